@@ -1,7 +1,11 @@
 # pylint: disable=too-few-public-methods, disable=too-many-arguments
+# pylint: disable=too-many-instance-attributes, disable=too-many-locals
 """
 ConfigDTO class implementation: stores the configuration information
 """
+from typing import Optional
+
+from core_utils.constants import NUM_ARTICLES_UPPER_LIMIT
 
 
 class ConfigDTO:
@@ -11,11 +15,46 @@ class ConfigDTO:
 
     seed_urls: list[str]
     total_articles: int
+    articles_upper_limit: int
+    listing_page_size: int
     headers: dict[str, str]
     encoding: str
     timeout: int
     should_verify_certificate: bool
     headless_mode: bool
+    max_in_flight: int
+    max_in_flight_per_host: int
+    requests_per_second: float
+    burst: int
+    pool_size: int
+    use_cache: bool
+    cache_ttl: int
+    cache_max_megabytes: int
+    incremental: bool
+    max_crawl_depth: int
+    max_links_per_page: int
+    normalize_urls: bool
+    article_patterns: list[str]
+    exclude_patterns: list[str]
+    ignored_query_params: list[str]
+    parser_backend: str
+    parse_processes: int
+    max_retries: int
+    backoff_factor: float
+    max_backoff: float
+    circuit_breaker_threshold: int
+    circuit_breaker_cooldown: float
+    max_body_kilobytes: int
+    content_types: list[str]
+    discovery: str
+    feed_urls: list[str]
+    modified_since: Optional[str]
+    deduplicate: bool
+    duplicate_distance: int
+    respect_robots: bool
+    robots_ttl: int
+    archive_mode: str
+    archive_path: Optional[str]
 
     def __init__(self,
                  seed_urls: list[str],
@@ -24,7 +63,42 @@ class ConfigDTO:
                  encoding: str,
                  timeout: int,
                  should_verify_certificate: bool,
-                 headless_mode: bool
+                 headless_mode: bool,
+                 articles_upper_limit: int = NUM_ARTICLES_UPPER_LIMIT,
+                 listing_page_size: int = NUM_ARTICLES_UPPER_LIMIT,
+                 max_in_flight: int = 4,
+                 max_in_flight_per_host: int = 2,
+                 requests_per_second: float = 0.3,
+                 burst: int = 1,
+                 pool_size: int = 4,
+                 use_cache: bool = False,
+                 cache_ttl: int = 3600,
+                 cache_max_megabytes: int = 100,
+                 incremental: bool = False,
+                 max_crawl_depth: int = 10,
+                 max_links_per_page: int = 1000,
+                 normalize_urls: bool = False,
+                 parser_backend: str = 'bs4',
+                 parse_processes: int = 0,
+                 max_retries: int = 3,
+                 backoff_factor: float = 1.0,
+                 max_backoff: float = 60.0,
+                 circuit_breaker_threshold: int = 5,
+                 circuit_breaker_cooldown: float = 60.0,
+                 max_body_kilobytes: int = 5120,
+                 content_types: Optional[list[str]] = None,
+                 discovery: str = 'listing',
+                 feed_urls: Optional[list[str]] = None,
+                 modified_since: Optional[str] = None,
+                 deduplicate: bool = False,
+                 duplicate_distance: int = 3,
+                 respect_robots: bool = True,
+                 robots_ttl: int = 86400,
+                 archive_mode: str = 'off',
+                 archive_path: Optional[str] = None,
+                 article_patterns: Optional[list[str]] = None,
+                 exclude_patterns: Optional[list[str]] = None,
+                 ignored_query_params: Optional[list[str]] = None
                  ):
         """
         Initializes an instance of the ConfigDTO class
@@ -32,8 +106,46 @@ class ConfigDTO:
 
         self.seed_urls = seed_urls
         self.total_articles = total_articles_to_find_and_parse
+        self.articles_upper_limit = articles_upper_limit
+        self.listing_page_size = listing_page_size
         self.headers = headers
         self.encoding = encoding
         self.timeout = timeout
         self.should_verify_certificate = should_verify_certificate
         self.headless_mode = headless_mode
+        self.max_in_flight = max_in_flight
+        self.max_in_flight_per_host = max_in_flight_per_host
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.pool_size = pool_size
+        self.use_cache = use_cache
+        self.cache_ttl = cache_ttl
+        self.cache_max_megabytes = cache_max_megabytes
+        self.incremental = incremental
+        self.max_crawl_depth = max_crawl_depth
+        self.max_links_per_page = max_links_per_page
+        self.normalize_urls = normalize_urls
+        self.parser_backend = parser_backend
+        self.parse_processes = parse_processes
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.circuit_breaker_threshold = circuit_breaker_threshold
+        self.circuit_breaker_cooldown = circuit_breaker_cooldown
+        self.max_body_kilobytes = max_body_kilobytes
+        self.content_types = content_types if content_types is not None \
+            else ['text/html', 'application/xhtml+xml']
+        self.discovery = discovery
+        self.feed_urls = feed_urls if feed_urls is not None else []
+        self.modified_since = modified_since
+        self.deduplicate = deduplicate
+        self.duplicate_distance = duplicate_distance
+        self.respect_robots = respect_robots
+        self.robots_ttl = robots_ttl
+        self.archive_mode = archive_mode
+        self.archive_path = archive_path
+        self.article_patterns = article_patterns if article_patterns is not None \
+            else ['/volga/news/']
+        self.exclude_patterns = exclude_patterns if exclude_patterns is not None else []
+        self.ignored_query_params = ignored_query_params if ignored_query_params is not None \
+            else ['utm_source', 'utm_medium', 'utm_campaign', 'utm_term', 'utm_content']
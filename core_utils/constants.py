@@ -6,8 +6,17 @@ from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).parent.parent
 ASSETS_PATH = PROJECT_ROOT / 'tmp' / 'articles'
+CACHE_PATH = PROJECT_ROOT / 'tmp' / 'cache'
+ARCHIVE_PATH = PROJECT_ROOT / 'tmp' / 'http_archive.sqlite3'
+METRICS_PATH = PROJECT_ROOT / 'tmp' / 'metrics'
 CRAWLER_CONFIG_PATH = PROJECT_ROOT / 'lab_5_scrapper' / 'scrapper_config.json'
 
 NUM_ARTICLES_UPPER_LIMIT = 150
 TIMEOUT_LOWER_LIMIT = 0
 TIMEOUT_UPPER_LIMIT = 60
+MAX_IN_FLIGHT_UPPER_LIMIT = 32
+BURST_UPPER_LIMIT = 32
+POOL_SIZE_UPPER_LIMIT = 32
+PARSE_PROCESSES_UPPER_LIMIT = 32
+MAX_RETRIES_UPPER_LIMIT = 10
+DUPLICATE_DISTANCE_UPPER_LIMIT = 15
@@ -0,0 +1,99 @@
+"""
+Archive of HTTP responses recorded during a run and replayed without network access
+"""
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Callable
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+# the body is stored decoded, so headers describing its transfer do not apply to it
+TRANSFER_HEADERS = ('content-encoding', 'content-length', 'transfer-encoding')
+
+
+class HttpArchive:
+    """
+    Single-file SQLite storage of compressed responses, keyed by the requested URL
+    """
+
+    modes = ('record', 'replay')
+
+    def __init__(self, path: Path, mode: str) -> None:
+        """
+        Initializes an instance of the HttpArchive class
+        """
+        self.path = path
+        self._mode = mode
+        self._stats = {'archive_recorded': 0, 'archive_replayed': 0, 'archive_misses': 0}
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('CREATE TABLE IF NOT EXISTS responses ('
+                                 'url TEXT PRIMARY KEY, status_code INTEGER, '
+                                 'headers TEXT, body BLOB, recorded_at REAL)')
+        self._connection.commit()
+
+    def fetch(self, url: str,
+              download: Callable[[], requests.models.Response]) -> requests.models.Response:
+        """
+        Replays the recorded response for the URL or downloads and records it
+        """
+        if self._mode == 'replay':
+            return self.replay(url)
+        response = download()
+        self.record(url, response)
+        return response
+
+    def record(self, url: str, response: requests.models.Response) -> None:
+        """
+        Saves the response, replacing an earlier one for the same URL
+        """
+        headers = {name: value for name, value in response.headers.items()
+                   if name.lower() not in TRANSFER_HEADERS}
+        row = (url, response.status_code, json.dumps(headers),
+               zlib.compress(response.content), time.time())
+        with self._lock:
+            self._connection.execute('INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)',
+                                     row)
+            self._connection.commit()
+            self._stats['archive_recorded'] += 1
+
+    def replay(self, url: str) -> requests.models.Response:
+        """
+        Rebuilds the recorded response for the URL,
+        a URL that was not recorded gives an empty 404 response
+        """
+        with self._lock:
+            row = self._connection.execute('SELECT status_code, headers, body FROM responses '
+                                           'WHERE url = ?', (url,)).fetchone()
+            self._stats['archive_replayed' if row else 'archive_misses'] += 1
+        response = requests.models.Response()
+        response.url = url
+        if row is None:
+            response.status_code = 404
+            response._content = b''  # pylint: disable=protected-access
+            return response
+        response.status_code = row[0]
+        response.headers = CaseInsensitiveDict(json.loads(row[1]))
+        response._content = zlib.decompress(row[2])  # pylint: disable=protected-access
+        return response
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Retrieve numbers of recorded, replayed and missing responses
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def close(self) -> None:
+        """
+        Closes the archive file
+        """
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,612 @@
+"""
+Configuration of the scrapper
+"""
+import datetime
+import json
+import re
+from functools import partial
+from pathlib import Path
+from typing import Optional
+
+import requests
+
+from core_utils.config_dto import ConfigDTO
+from core_utils.constants import (ARCHIVE_PATH, BURST_UPPER_LIMIT, CACHE_PATH,
+                                  DUPLICATE_DISTANCE_UPPER_LIMIT,
+                                  MAX_IN_FLIGHT_UPPER_LIMIT,
+                                  MAX_RETRIES_UPPER_LIMIT,
+                                  PARSE_PROCESSES_UPPER_LIMIT,
+                                  POOL_SIZE_UPPER_LIMIT, TIMEOUT_LOWER_LIMIT,
+                                  TIMEOUT_UPPER_LIMIT)
+from lab_5_scrapper.archive import HttpArchive
+from lab_5_scrapper.dedup import DuplicateIndex
+from lab_5_scrapper.exceptions import (IncorrectArchiveSettingsError,
+                                       IncorrectCacheSettingsError,
+                                       IncorrectCrawlLimitsError,
+                                       IncorrectDeduplicationSettingsError,
+                                       IncorrectDiscoverySettingsError,
+                                       IncorrectDownloadLimitsError,
+                                       IncorrectEncodingError,
+                                       IncorrectHeadersError,
+                                       IncorrectIncrementalModeError,
+                                       IncorrectMaxInFlightError,
+                                       IncorrectNumberOfArticlesError,
+                                       IncorrectParseProcessesError,
+                                       IncorrectParserBackendError,
+                                       IncorrectPoolSizeError,
+                                       IncorrectRateLimitError,
+                                       IncorrectRetrySettingsError,
+                                       IncorrectRobotsSettingsError,
+                                       IncorrectSeedURLError,
+                                       IncorrectTimeoutError,
+                                       IncorrectUrlPatternsError,
+                                       IncorrectVerifyError,
+                                       NumberOfArticlesOutOfRangeError)
+from lab_5_scrapper.feeds import FEED_CONTENT_TYPES, parse_feed_date
+from lab_5_scrapper.fetching import (CircuitBreaker, DownloadPolicy, Fetcher,
+                                     HostLimiter, RateLimiter, ResponseCache,
+                                     RetryPolicy, RobotsCache)
+from lab_5_scrapper.metrics import Metrics
+from lab_5_scrapper.urls import UrlClassifier
+
+PARSER_BACKENDS = ('bs4', 'lxml')
+
+DISCOVERY_MODES = ('listing', 'feeds')
+
+
+# pylint: disable=too-many-instance-attributes, too-many-public-methods
+class Config:
+    """
+    Unpacks and validates configurations
+    """
+
+    def __init__(self, path_to_config: Path) -> None:
+        """
+        Initializes an instance of the Config class
+        """
+        self.path_to_config = path_to_config
+        self.config = self._extract_config_content()
+        self._validate_config_content()
+
+        self._seed_urls = self.config.seed_urls
+        self._num_articles = self.config.total_articles
+        self._listing_page_size = self.config.listing_page_size
+        self._headers = self.config.headers
+        self._encoding = self.config.encoding
+        self._timeout = self.config.timeout
+        self._should_verify_certificate = self.config.should_verify_certificate
+        self._headless_mode = self.config.headless_mode
+        self._incremental = self.config.incremental
+        self._max_crawl_depth = self.config.max_crawl_depth
+        self._max_links_per_page = self.config.max_links_per_page
+        self._normalize_urls = self.config.normalize_urls
+        self._url_classifier = UrlClassifier(self.config.article_patterns,
+                                             self.config.exclude_patterns,
+                                             self._normalize_urls,
+                                             self.config.ignored_query_params)
+        self._parser_backend = self.config.parser_backend
+        self._parse_processes = self.config.parse_processes
+        self._max_in_flight = self.config.max_in_flight
+        self._discovery = self.config.discovery
+        self._feed_urls = self.config.feed_urls
+        self._modified_since = parse_feed_date(self.config.modified_since) \
+            if self.config.modified_since else None
+        self._metrics = Metrics()
+        self._duplicates = self._make_duplicate_index()
+        self._set_up_transport()
+
+    def _set_up_transport(self) -> None:
+        """
+        Creates the rate and concurrency limiters, the retry policy, the circuit breaker,
+        the download policy, the session, the archive of responses, the robots.txt cache
+        and the response cache
+        """
+        self._rate_limiter = RateLimiter(self.config.requests_per_second, self.config.burst)
+        self._host_limiter = HostLimiter(self.config.max_in_flight_per_host)
+        self._retry_policy = RetryPolicy(self.config.max_retries, self.config.backoff_factor,
+                                         self.config.max_backoff)
+        self._circuit_breaker = CircuitBreaker(self.config.circuit_breaker_threshold,
+                                               self.config.circuit_breaker_cooldown)
+        content_types = self.config.content_types
+        if self.config.discovery == 'feeds':
+            content_types = [*content_types, *FEED_CONTENT_TYPES]
+        self._download_policy = DownloadPolicy(self.config.max_body_kilobytes * 1024,
+                                               content_types, self._encoding)
+        self._fetcher = Fetcher(self.config.pool_size, self._headers,
+                                self._should_verify_certificate, self._download_policy)
+        self._http_archive = HttpArchive(self.get_archive_path(), self.config.archive_mode) \
+            if self.config.archive_mode in HttpArchive.modes else None
+        self._robots_policy = DownloadPolicy(RobotsCache.max_bytes, ['text/plain'], 'utf-8')
+        user_agent = self._headers.get('User-Agent') or self._headers.get('user_agent') or '*'
+        self._robots_cache = RobotsCache(self._fetch_robots, self._rate_limiter, user_agent,
+                                         self.config.robots_ttl) \
+            if self.config.respect_robots else None
+        self._response_cache = ResponseCache(CACHE_PATH, self.config.cache_ttl,
+                                             self.config.cache_max_megabytes * 1024 * 1024,
+                                             self._headers) \
+            if self.config.use_cache else None
+
+    def _fetch_robots(self, url: str) -> requests.models.Response:
+        """
+        Downloads robots.txt of a host the same way as pages,
+        through the archive of responses if there is one
+        """
+        # a host without reachable rules is disallowed by the cache,
+        # so its failures do not pause the pages of the host
+        download = partial(self.send_request, url, download_policy=self._robots_policy,
+                           count_failures=False)
+        return self._http_archive.fetch(url, download) if self._http_archive else download()
+
+    def send_request(self, url: str, headers: Optional[dict[str, str]] = None,
+                     download_policy: Optional[DownloadPolicy] = None,
+                     count_failures: bool = True) -> requests.models.Response:
+        """
+        Sends a request, repeating it after transient errors
+        while the host is not paused by the circuit breaker
+        """
+        return self._retry_policy.send(
+            partial(self._send_once, url, headers, download_policy, count_failures),
+            partial(self._metrics.record, 'retry_backoff'))
+
+    def _send_once(self, url: str, headers: Optional[dict[str, str]],
+                   download_policy: Optional[DownloadPolicy],
+                   count_failures: bool) -> requests.models.Response:
+        """
+        Sends a request within the rate and per-host concurrency limits,
+        reporting its outcome to the circuit breaker if failures are counted
+        """
+        self._metrics.record('circuit_breaker_wait', self._circuit_breaker.wait(url))
+        self._metrics.record('rate_limit_wait', self._rate_limiter.acquire(url))
+        try:
+            with self._host_limiter.hold(url), self._metrics.timer('download'):
+                response = self._fetcher.get(url, self._timeout, headers,
+                                             download_policy=download_policy)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            if count_failures:
+                self._circuit_breaker.record(url, success=False)
+            raise
+        # time from sending the request to parsing the headers,
+        # including connecting to the host
+        self._metrics.record('time_to_first_byte', response.elapsed.total_seconds())
+        if count_failures:
+            self._circuit_breaker.record(url, success=not self._retry_policy.is_failure(response))
+        return response
+
+    def _make_duplicate_index(self) -> Optional[DuplicateIndex]:
+        """
+        Creates index of fingerprints of saved articles if deduplication is enabled
+        """
+        return DuplicateIndex(self.config.duplicate_distance) if self.config.deduplicate else None
+
+    def _extract_config_content(self) -> ConfigDTO:
+        """
+        Returns config values
+        """
+        with open(self.path_to_config, 'r', encoding='utf-8') as path:
+            config_dict = json.load(path)
+        return ConfigDTO(**config_dict)
+
+    def _validate_config_content(self) -> None:
+        """
+        Ensure configuration parameters
+        are not corrupt
+        """
+        if not isinstance(self.config.seed_urls, list):
+            raise IncorrectSeedURLError('seed URL is not a list')
+        regex = re.compile(r'https?://')
+        for url in self.config.seed_urls:
+            if not isinstance(url, str):
+                raise IncorrectSeedURLError('seed URL is not str')
+            if not re.match(regex, url):
+                raise IncorrectSeedURLError('seed URL does not match standard pattern')
+        self._validate_number_of_articles()
+        if not isinstance(self.config.headers, dict):
+            raise IncorrectHeadersError('headers are not in a form of dictionary')
+        if not isinstance(self.config.encoding, str):
+            raise IncorrectEncodingError('encoding must be specified as a string')
+        if not isinstance(self.config.timeout, int) or \
+                not TIMEOUT_LOWER_LIMIT <= self.config.timeout <= TIMEOUT_UPPER_LIMIT:
+            raise IncorrectTimeoutError('timeout value must be a positive integer less than 60')
+        if not isinstance(self.config.should_verify_certificate, bool):
+            raise IncorrectVerifyError('verify certificate value must either be True or False')
+        if not isinstance(self.config.headless_mode, bool):
+            raise IncorrectVerifyError('headless mode value must either be True or False')
+        if not isinstance(self.config.incremental, bool):
+            raise IncorrectIncrementalModeError('incremental mode value '
+                                                'must either be True or False')
+        self._validate_request_limits()
+        self._validate_retry_settings()
+        self._validate_download_limits()
+        self._validate_cache_settings()
+        self._validate_crawl_limits()
+        self._validate_discovery_settings()
+        self._validate_deduplication_settings()
+        self._validate_archive_settings()
+        self._validate_url_patterns()
+        if not isinstance(self.config.respect_robots, bool):
+            raise IncorrectRobotsSettingsError('respect robots value must either be True or False')
+        if not isinstance(self.config.robots_ttl, int) or \
+                isinstance(self.config.robots_ttl, bool) or self.config.robots_ttl < 0:
+            raise IncorrectRobotsSettingsError('robots.txt TTL must be a non-negative integer')
+
+    def _validate_number_of_articles(self) -> None:
+        """
+        Ensure the number of articles and its upper limit
+        are not corrupt
+        """
+        if not isinstance(self.config.articles_upper_limit, int) or \
+                isinstance(self.config.articles_upper_limit, bool) or \
+                self.config.articles_upper_limit <= 0:
+            raise NumberOfArticlesOutOfRangeError('upper limit of the number of articles '
+                                                  'must be a positive integer')
+        if not isinstance(self.config.total_articles, int) or \
+                self.config.total_articles <= 0:
+            raise IncorrectNumberOfArticlesError('total number of articles to parse is not integer')
+        if not 1 <= self.config.total_articles <= self.config.articles_upper_limit:
+            raise NumberOfArticlesOutOfRangeError('total number of articles is out of range')
+
+    def _validate_request_limits(self) -> None:
+        """
+        Ensure concurrency and rate limiting parameters
+        are not corrupt
+        """
+        if not isinstance(self.config.max_in_flight, int) or \
+                isinstance(self.config.max_in_flight, bool) or \
+                not 1 <= self.config.max_in_flight <= MAX_IN_FLIGHT_UPPER_LIMIT:
+            raise IncorrectMaxInFlightError('max in flight value must be a positive integer '
+                                            f'not greater than {MAX_IN_FLIGHT_UPPER_LIMIT}')
+        if not isinstance(self.config.max_in_flight_per_host, int) or \
+                isinstance(self.config.max_in_flight_per_host, bool) or \
+                not 1 <= self.config.max_in_flight_per_host <= MAX_IN_FLIGHT_UPPER_LIMIT:
+            raise IncorrectMaxInFlightError('max in flight per host value must be a positive '
+                                            f'integer not greater than {MAX_IN_FLIGHT_UPPER_LIMIT}')
+        if not isinstance(self.config.requests_per_second, (int, float)) or \
+                isinstance(self.config.requests_per_second, bool) or \
+                self.config.requests_per_second <= 0:
+            raise IncorrectRateLimitError('requests per second must be a positive number')
+        if not isinstance(self.config.burst, int) or isinstance(self.config.burst, bool) or \
+                not 1 <= self.config.burst <= BURST_UPPER_LIMIT:
+            raise IncorrectRateLimitError('burst must be a positive integer '
+                                          f'not greater than {BURST_UPPER_LIMIT}')
+        if not isinstance(self.config.pool_size, int) or \
+                isinstance(self.config.pool_size, bool) or \
+                not 1 <= self.config.pool_size <= POOL_SIZE_UPPER_LIMIT:
+            raise IncorrectPoolSizeError('pool size must be a positive integer '
+                                         f'not greater than {POOL_SIZE_UPPER_LIMIT}')
+
+    def _validate_retry_settings(self) -> None:
+        """
+        Ensure retry and circuit breaker parameters
+        are not corrupt
+        """
+        if not isinstance(self.config.max_retries, int) or \
+                isinstance(self.config.max_retries, bool) or \
+                not 0 <= self.config.max_retries <= MAX_RETRIES_UPPER_LIMIT:
+            raise IncorrectRetrySettingsError('number of retries must be a non-negative integer '
+                                              f'not greater than {MAX_RETRIES_UPPER_LIMIT}')
+        for seconds in (self.config.backoff_factor, self.config.max_backoff,
+                        self.config.circuit_breaker_cooldown):
+            if not isinstance(seconds, (int, float)) or isinstance(seconds, bool) or seconds < 0:
+                raise IncorrectRetrySettingsError('backoff and cooldown durations '
+                                                  'must be non-negative numbers')
+        if not isinstance(self.config.circuit_breaker_threshold, int) or \
+                isinstance(self.config.circuit_breaker_threshold, bool) or \
+                self.config.circuit_breaker_threshold <= 0:
+            raise IncorrectRetrySettingsError('circuit breaker threshold '
+                                              'must be a positive integer')
+
+    def _validate_download_limits(self) -> None:
+        """
+        Ensure body size limit and allowed content types
+        are not corrupt
+        """
+        if not isinstance(self.config.max_body_kilobytes, int) or \
+                isinstance(self.config.max_body_kilobytes, bool) or \
+                self.config.max_body_kilobytes <= 0:
+            raise IncorrectDownloadLimitsError('body size limit must be a positive integer')
+        if not isinstance(self.config.content_types, list) or \
+                not self.config.content_types or \
+                not all(isinstance(content_type, str) and '/' in content_type
+                        for content_type in self.config.content_types):
+            raise IncorrectDownloadLimitsError('content types must be a non-empty list '
+                                               'of media types')
+
+    def _validate_cache_settings(self) -> None:
+        """
+        Ensure response cache parameters
+        are not corrupt
+        """
+        if not isinstance(self.config.use_cache, bool):
+            raise IncorrectCacheSettingsError('use cache value must either be True or False')
+        if not isinstance(self.config.cache_ttl, int) or \
+                isinstance(self.config.cache_ttl, bool) or self.config.cache_ttl < 0:
+            raise IncorrectCacheSettingsError('cache TTL must be a non-negative integer')
+        if not isinstance(self.config.cache_max_megabytes, int) or \
+                isinstance(self.config.cache_max_megabytes, bool) or \
+                self.config.cache_max_megabytes <= 0:
+            raise IncorrectCacheSettingsError('cache size must be a positive integer')
+
+    def _validate_crawl_limits(self) -> None:
+        """
+        Ensure recursive crawling parameters
+        are not corrupt
+        """
+        for limit in (self.config.max_crawl_depth, self.config.max_links_per_page,
+                      self.config.listing_page_size):
+            if not isinstance(limit, int) or isinstance(limit, bool) or limit <= 0:
+                raise IncorrectCrawlLimitsError('crawl depth, number of links per page '
+                                                'and listing page size '
+                                                'must be positive integers')
+        if not isinstance(self.config.normalize_urls, bool):
+            raise IncorrectCrawlLimitsError('normalize URLs value must either be True or False')
+        if self.config.parser_backend not in PARSER_BACKENDS:
+            raise IncorrectParserBackendError('parser backend must be one of '
+                                              f'{", ".join(PARSER_BACKENDS)}')
+        if not isinstance(self.config.parse_processes, int) or \
+                isinstance(self.config.parse_processes, bool) or \
+                not 0 <= self.config.parse_processes <= PARSE_PROCESSES_UPPER_LIMIT:
+            raise IncorrectParseProcessesError('number of parsing processes must be '
+                                               'a non-negative integer not greater than '
+                                               f'{PARSE_PROCESSES_UPPER_LIMIT}')
+
+    def _validate_discovery_settings(self) -> None:
+        """
+        Ensure discovery mode, feed URLs and modification date
+        are not corrupt
+        """
+        if self.config.discovery not in DISCOVERY_MODES:
+            raise IncorrectDiscoverySettingsError('discovery mode must be one of '
+                                                  f'{", ".join(DISCOVERY_MODES)}')
+        if not isinstance(self.config.feed_urls, list) or \
+                not all(isinstance(url, str) and re.match(r'https?://', url)
+                        for url in self.config.feed_urls):
+            raise IncorrectDiscoverySettingsError('feed URLs must be a list of HTTP URLs')
+        if self.config.modified_since is not None and \
+                (not isinstance(self.config.modified_since, str) or
+                 parse_feed_date(self.config.modified_since) is None):
+            raise IncorrectDiscoverySettingsError('modification date must be an ISO 8601 '
+                                                  'or RFC 822 date')
+
+    def _validate_deduplication_settings(self) -> None:
+        """
+        Ensure near-duplicate detection parameters
+        are not corrupt
+        """
+        if not isinstance(self.config.deduplicate, bool):
+            raise IncorrectDeduplicationSettingsError('deduplicate value '
+                                                      'must either be True or False')
+        if not isinstance(self.config.duplicate_distance, int) or \
+                isinstance(self.config.duplicate_distance, bool) or \
+                not 0 <= self.config.duplicate_distance <= DUPLICATE_DISTANCE_UPPER_LIMIT:
+            raise IncorrectDeduplicationSettingsError('duplicate distance must be a non-negative '
+                                                      'integer not greater than '
+                                                      f'{DUPLICATE_DISTANCE_UPPER_LIMIT}')
+
+    def _validate_archive_settings(self) -> None:
+        """
+        Ensure mode and path of the archive of responses
+        are not corrupt
+        """
+        if self.config.archive_mode not in ('off', *HttpArchive.modes):
+            raise IncorrectArchiveSettingsError('archive mode must be one of '
+                                                f'off, {", ".join(HttpArchive.modes)}')
+        if self.config.archive_path is not None and \
+                (not isinstance(self.config.archive_path, str) or not self.config.archive_path):
+            raise IncorrectArchiveSettingsError('archive path must be a non-empty string')
+        if self.config.archive_mode == 'replay' and not self.get_archive_path().is_file():
+            raise IncorrectArchiveSettingsError('archive to replay does not exist')
+
+    def _validate_url_patterns(self) -> None:
+        """
+        Ensure patterns of article and excluded URLs and ignored query parameters
+        are not corrupt
+        """
+        for patterns in (self.config.article_patterns, self.config.exclude_patterns,
+                         self.config.ignored_query_params):
+            if not isinstance(patterns, list) or \
+                    not all(isinstance(pattern, str) and pattern for pattern in patterns):
+                raise IncorrectUrlPatternsError('URL patterns and ignored query parameters '
+                                                'must be lists of non-empty strings')
+        if not self.config.article_patterns:
+            raise IncorrectUrlPatternsError('at least one article pattern must be given')
+        for pattern in (*self.config.article_patterns, *self.config.exclude_patterns):
+            try:
+                re.compile(pattern)
+            except re.error as error:
+                raise IncorrectUrlPatternsError(f'URL pattern {pattern} is not '
+                                                f'a regular expression: {error}') from error
+
+    def get_seed_urls(self) -> list[str]:
+        """
+        Retrieve seed urls
+        """
+        return self._seed_urls
+
+    def get_num_articles(self) -> int:
+        """
+        Retrieve total number of articles to scrape
+        """
+        return self._num_articles
+
+    def get_listing_page_size(self) -> int:
+        """
+        Retrieve number of article links requested from each listing page
+        """
+        return self._listing_page_size
+
+    def get_headers(self) -> dict[str, str]:
+        """
+        Retrieve headers to use during requesting
+        """
+        return self._headers
+
+    def get_encoding(self) -> str:
+        """
+        Retrieve encoding to use during parsing
+        """
+        return self._encoding
+
+    def get_timeout(self) -> int:
+        """
+        Retrieve number of seconds to wait for response
+        """
+        return self._timeout
+
+    def get_verify_certificate(self) -> bool:
+        """
+        Retrieve whether to verify certificate
+        """
+        return self._should_verify_certificate
+
+    def get_headless_mode(self) -> bool:
+        """
+        Retrieve whether to use headless mode
+        """
+        return self._headless_mode
+
+    def get_incremental(self) -> bool:
+        """
+        Retrieve whether to keep already downloaded articles
+        """
+        return self._incremental
+
+    def get_max_crawl_depth(self) -> int:
+        """
+        Retrieve how many pages away from the seed URL the crawler may go
+        """
+        return self._max_crawl_depth
+
+    def get_max_links_per_page(self) -> int:
+        """
+        Retrieve how many links of a single page the crawler may look at
+        """
+        return self._max_links_per_page
+
+    def get_normalize_urls(self) -> bool:
+        """
+        Retrieve whether to bring URLs to a canonical form
+        """
+        return self._normalize_urls
+
+    def get_url_classifier(self) -> UrlClassifier:
+        """
+        Retrieve classifier of links found on pages
+        """
+        return self._url_classifier
+
+    def get_parser_backend(self) -> str:
+        """
+        Retrieve library used to extract article fields from HTML
+        """
+        return self._parser_backend
+
+    def get_parse_processes(self) -> int:
+        """
+        Retrieve number of processes parsing downloaded pages,
+        zero means parsing in downloading threads
+        """
+        return self._parse_processes
+
+    def get_discovery(self) -> str:
+        """
+        Retrieve whether articles are found on listing pages or in sitemaps and feeds
+        """
+        return self._discovery
+
+    def get_feed_urls(self) -> list[str]:
+        """
+        Retrieve sitemaps and feeds to read,
+        defaulting to the sitemap of the host of each seed URL
+        """
+        if self._feed_urls:
+            return self._feed_urls
+        roots = [re.match(r'https?://[^/]+', url) for url in self._seed_urls]
+        return list(dict.fromkeys(f'{root.group()}/sitemap.xml' for root in roots if root))
+
+    def get_modified_since(self) -> Optional[datetime.datetime]:
+        """
+        Retrieve date before which feed entries are skipped
+        """
+        return self._modified_since
+
+    def get_max_in_flight(self) -> int:
+        """
+        Retrieve maximum number of requests performed at the same time
+        """
+        return self._max_in_flight
+
+    def get_rate_limiter(self) -> RateLimiter:
+        """
+        Retrieve rate limiter shared by all requests made with this configuration
+        """
+        return self._rate_limiter
+
+    def get_host_limiter(self) -> HostLimiter:
+        """
+        Retrieve limiter of concurrent requests to each host
+        """
+        return self._host_limiter
+
+    def get_retry_policy(self) -> RetryPolicy:
+        """
+        Retrieve policy of repeating requests failed with transient errors
+        """
+        return self._retry_policy
+
+    def get_circuit_breaker(self) -> CircuitBreaker:
+        """
+        Retrieve circuit breaker pausing hosts that fail repeatedly
+        """
+        return self._circuit_breaker
+
+    def get_metrics(self) -> Metrics:
+        """
+        Retrieve timers and counters of the run made with this configuration
+        """
+        return self._metrics
+
+    def get_duplicate_index(self) -> Optional[DuplicateIndex]:
+        """
+        Retrieve index of fingerprints finding near-duplicates if deduplication is enabled
+        """
+        return self._duplicates
+
+    def get_request_stats(self) -> dict[str, float]:
+        """
+        Retrieve counters of requests, retries and pauses made with this configuration
+        """
+        robots_stats = self._robots_cache.get_stats() if self._robots_cache else {}
+        archive_stats = self._http_archive.get_stats() if self._http_archive else {}
+        return {**self._fetcher.get_connection_stats(), **self._retry_policy.get_stats(),
+                **self._circuit_breaker.get_stats(), **self._download_policy.get_stats(),
+                **robots_stats, **archive_stats}
+
+    def get_fetcher(self) -> Fetcher:
+        """
+        Retrieve session with pooled connections shared by all requests
+        """
+        return self._fetcher
+
+    def get_archive_path(self) -> Path:
+        """
+        Retrieve path to the file of recorded responses
+        """
+        return Path(self.config.archive_path) if self.config.archive_path else ARCHIVE_PATH
+
+    def get_http_archive(self) -> Optional[HttpArchive]:
+        """
+        Retrieve archive recording or replaying responses if it is enabled
+        """
+        return self._http_archive
+
+    def get_robots_cache(self) -> Optional[RobotsCache]:
+        """
+        Retrieve rules of robots.txt of visited hosts if they are respected
+        """
+        return self._robots_cache
+
+    def get_response_cache(self) -> Optional[ResponseCache]:
+        """
+        Retrieve on-disk response cache if caching is enabled
+        """
+        return self._response_cache
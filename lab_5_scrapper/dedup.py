@@ -0,0 +1,107 @@
+"""
+Detection of articles published under several URLs by fingerprints of their texts
+"""
+import hashlib
+import json
+import re
+import threading
+from collections import Counter, defaultdict
+from typing import Optional
+
+from core_utils.article.article import Article
+
+SHINGLE_SIZE = 3
+
+FINGERPRINT_BITS = 64
+
+
+def get_simhash(text: str) -> Optional[int]:
+    """
+    Computes SimHash of word shingles of the text,
+    texts without words have no fingerprint
+    """
+    words = re.findall(r'\w+', text.lower())
+    if not words:
+        return None
+    shingles = Counter(' '.join(words[start:start + SHINGLE_SIZE])
+                       for start in range(max(1, len(words) - SHINGLE_SIZE + 1)))
+    weights = [0] * FINGERPRINT_BITS
+    for shingle, count in shingles.items():
+        value = int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'),
+                                               digest_size=FINGERPRINT_BITS // 8).digest(), 'big')
+        for bit in range(FINGERPRINT_BITS):
+            weights[bit] += count if value >> bit & 1 else -count
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+
+class DuplicateIndex:
+    """
+    Thread-safe index of text fingerprints finding near-duplicates of articles
+    """
+
+    def __init__(self, max_distance: int) -> None:
+        """
+        Initializes an instance of the DuplicateIndex class
+        """
+        self._max_distance = max_distance
+        # fingerprints differing in at most max_distance bits are equal
+        # in at least one of max_distance + 1 bands
+        bounds = [round(index * FINGERPRINT_BITS / (max_distance + 1))
+                  for index in range(max_distance + 2)]
+        self._bands = list(zip(bounds, bounds[1:]))
+        self._buckets: list[defaultdict[int, list[tuple[int, int]]]] = \
+            [defaultdict(list) for _ in self._bands]
+        self._aliases: dict[int, list[str]] = {}
+        self._lock = threading.Lock()
+
+    def find_original(self, article: Article) -> Optional[int]:
+        """
+        Retrieve ID of an earlier article with nearly the same text, recording the URL
+        of the article as its alias, otherwise remembers the article as an original
+        """
+        fingerprint = get_simhash(article.text)
+        if fingerprint is None:
+            return None
+        keys = self._get_keys(fingerprint)
+        with self._lock:
+            for bucket, key in zip(self._buckets, keys):
+                for other_fingerprint, other_id in bucket.get(key, []):
+                    if bin(fingerprint ^ other_fingerprint).count('1') <= self._max_distance:
+                        self._aliases.setdefault(other_id, []).append(str(article.url))
+                        return other_id
+            for bucket, key in zip(self._buckets, keys):
+                bucket[key].append((fingerprint, article.article_id))
+        return None
+
+    def add_saved(self, article: Article) -> None:
+        """
+        Remembers an article saved by a previous run as an original
+        """
+        fingerprint = get_simhash(article.text)
+        if fingerprint is None:
+            return
+        with self._lock:
+            for bucket, key in zip(self._buckets, self._get_keys(fingerprint)):
+                bucket[key].append((fingerprint, article.article_id))
+
+    def _get_keys(self, fingerprint: int) -> list[int]:
+        """
+        Splits the fingerprint into the bands of the index
+        """
+        return [fingerprint >> start & ((1 << end - start) - 1) for start, end in self._bands]
+
+    def save_aliases(self) -> None:
+        """
+        Adds URLs of skipped duplicates to meta files of their originals
+        """
+        with self._lock:
+            aliases, self._aliases = self._aliases, {}
+        for original_id, urls in aliases.items():
+            meta_path = Article(None, original_id).get_meta_file_path()
+            if not meta_path.exists():
+                continue
+            with open(meta_path, 'r', encoding='utf-8') as meta_file:
+                meta = json.load(meta_file)
+            meta['aliases'] = list(dict.fromkeys([*meta.get('aliases', []), *urls]))
+            with open(meta_path, 'w', encoding='utf-8') as meta_file:
+                json.dump(meta, meta_file, indent=4, ensure_ascii=False, separators=(',', ': '))
@@ -0,0 +1,95 @@
+"""
+Errors of the scrapper configuration
+"""
+
+
+class IncorrectSeedURLError(TypeError):
+    """
+    Raised when seed URLs are in incorrect form
+    """
+
+class NumberOfArticlesOutOfRangeError(Exception):
+
+    """Raised when the number of articles is
+    out of range from 1 to 150"""
+
+class IncorrectNumberOfArticlesError(Exception):
+
+    """Raised when the number of articles is not int"""
+
+class IncorrectHeadersError(Exception):
+
+    """Raised when headers are in incorrect form"""
+
+
+class IncorrectEncodingError(Exception):
+
+    """Raised when encoding is in incorrect form"""
+
+class IncorrectTimeoutError(Exception):
+
+    """Raised when timeout is in incorrect form"""
+
+class IncorrectVerifyError(Exception):
+
+    """Raise when verify certificate is in incorrect form"""
+
+class IncorrectMaxInFlightError(Exception):
+
+    """Raised when the number of concurrent requests is in incorrect form"""
+
+class IncorrectRateLimitError(Exception):
+
+    """Raised when request rate or burst size is in incorrect form"""
+
+class IncorrectPoolSizeError(Exception):
+
+    """Raised when the size of the connection pool is in incorrect form"""
+
+class IncorrectCacheSettingsError(Exception):
+
+    """Raised when response cache parameters are in incorrect form"""
+
+class IncorrectIncrementalModeError(Exception):
+
+    """Raised when incremental mode value is in incorrect form"""
+
+class IncorrectCrawlLimitsError(Exception):
+
+    """Raised when recursive crawling limits are in incorrect form"""
+
+class IncorrectParserBackendError(Exception):
+
+    """Raised when HTML parsing backend is unknown"""
+
+class IncorrectParseProcessesError(Exception):
+
+    """Raised when the number of parsing processes is in incorrect form"""
+
+class IncorrectRetrySettingsError(Exception):
+
+    """Raised when retry or circuit breaker parameters are in incorrect form"""
+
+class IncorrectDownloadLimitsError(Exception):
+
+    """Raised when body size limit or allowed content types are in incorrect form"""
+
+class IncorrectDiscoverySettingsError(Exception):
+
+    """Raised when discovery mode, feed URLs or modification date are in incorrect form"""
+
+class IncorrectDeduplicationSettingsError(Exception):
+
+    """Raised when near-duplicate detection parameters are in incorrect form"""
+
+class IncorrectRobotsSettingsError(Exception):
+
+    """Raised when robots.txt policy parameters are in incorrect form"""
+
+class IncorrectArchiveSettingsError(Exception):
+
+    """Raised when mode or path of the archive of responses are in incorrect form"""
+
+class IncorrectUrlPatternsError(Exception):
+
+    """Raised when patterns of article and excluded URLs are in incorrect form"""
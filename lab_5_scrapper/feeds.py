@@ -0,0 +1,78 @@
+"""
+Streaming reading of sitemaps and news feeds for discovery of articles
+"""
+import datetime
+import gzip
+from email.utils import parsedate_to_datetime
+from io import BufferedIOBase, BytesIO
+from typing import Iterator, Optional
+
+from lxml import etree
+
+FEED_CONTENT_TYPES = ('application/xml', 'text/xml', 'application/rss+xml',
+                      'application/atom+xml', 'application/gzip', 'application/x-gzip')
+
+ENTRY_TAGS = {'url': 'page', 'item': 'page', 'entry': 'page', 'sitemap': 'sitemap'}
+
+DATE_TAGS = ('lastmod', 'pubDate', 'updated', 'published')
+
+
+def parse_feed_date(value: str) -> Optional[datetime.datetime]:
+    """
+    Converts a W3C date of sitemaps and Atom or an RFC 822 date of RSS
+    to a datetime, dates without time zone are taken as UTC
+    """
+    value = value.strip()
+    try:
+        date = datetime.datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        try:
+            date = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+    return date if date.tzinfo else date.replace(tzinfo=datetime.timezone.utc)
+
+
+def open_feed(body: bytes) -> BufferedIOBase:
+    """
+    Wraps a downloaded feed into a stream, decompressing gzipped sitemaps on the fly
+    """
+    if body[:2] == b'\x1f\x8b':
+        return gzip.GzipFile(fileobj=BytesIO(body))
+    return BytesIO(body)
+
+
+def iter_feed_entries(source: BufferedIOBase
+                      ) -> Iterator[tuple[str, str, Optional[datetime.datetime]]]:
+    """
+    Reads a sitemap, a sitemap index, an RSS or an Atom feed element by element,
+    yielding kind of each entry ('page' or 'sitemap'), its URL and modification date
+    """
+    link: Optional[str] = None
+    modified: Optional[datetime.datetime] = None
+    for event, element in etree.iterparse(source, events=('start', 'end'),
+                                          resolve_entities=False, no_network=True):
+        name = etree.QName(element).localname
+        if event == 'start':
+            if name in ENTRY_TAGS:
+                link, modified = None, None
+            continue
+        if name == 'loc' and element.text:
+            link = element.text.strip()
+        elif name == 'link':
+            # RSS keeps the URL in the text, Atom in the attribute of the alternate link
+            if element.text and element.text.strip():
+                link = element.text.strip()
+            elif element.get('href') and element.get('rel', 'alternate') == 'alternate':
+                link = element.get('href')
+        elif name in DATE_TAGS and element.text:
+            date = parse_feed_date(element.text)
+            if date and (modified is None or date > modified):
+                modified = date
+        elif name in ENTRY_TAGS:
+            if link:
+                yield ENTRY_TAGS[name], link, modified
+            # processed entries are dropped to keep memory flat on large sitemaps
+            element.clear()
+            while element.getprevious() is not None:
+                del element.getparent()[0]
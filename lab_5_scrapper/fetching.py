@@ -0,0 +1,589 @@
+"""
+Transport layer of the scrapper: rate limiting, retries, pooled connections,
+download limits, robots.txt policies and caching
+"""
+import codecs
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+
+# pylint: disable=too-few-public-methods
+class RateLimiter:
+    """
+    Token bucket limiting the frequency of requests to each host
+    """
+
+    def __init__(self, requests_per_second: float, burst: int) -> None:
+        """
+        Initializes an instance of the RateLimiter class
+        """
+        self._rate = requests_per_second
+        self._burst = burst
+        self._buckets: dict[str, tuple[float, float]] = {}
+        self._host_rates: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def limit_host(self, url: str, requests_per_second: float) -> None:
+        """
+        Lowers the frequency of requests to the host of the URL,
+        requests to a limited host are not sent in bursts
+        """
+        with self._lock:
+            self._host_rates[urlparse(url).netloc] = min(self._rate, requests_per_second)
+
+    def acquire(self, url: str) -> float:
+        """
+        Waits until a request to the host of the URL is allowed,
+        returns the number of seconds spent waiting
+        """
+        host = urlparse(url).netloc
+        with self._lock:
+            rate = self._host_rates.get(host, self._rate)
+            burst = 1.0 if host in self._host_rates else float(self._burst)
+            now = time.monotonic()
+            tokens, updated = self._buckets.get(host, (burst, now))
+            tokens = min(burst, tokens + (now - updated) * rate) - 1
+            self._buckets[host] = (tokens, now)
+        delay = -tokens / rate if tokens < 0 else 0.0
+        if delay:
+            time.sleep(delay)
+        return delay
+
+
+class RetryPolicy:
+    """
+    Decides whether a failed request is repeated and how long to wait before that
+    """
+
+    retry_statuses = (429, 500, 502, 503, 504)
+
+    def __init__(self, max_retries: int, backoff_factor: float, max_backoff: float) -> None:
+        """
+        Initializes an instance of the RetryPolicy class
+        """
+        self._max_retries = max_retries
+        self._backoff_factor = backoff_factor
+        self._max_backoff = max_backoff
+        self._stats = {'retries': 0, 'retries_exhausted': 0}
+        self._lock = threading.Lock()
+
+    def is_failure(self, response: Optional[requests.models.Response]) -> bool:
+        """
+        Checks whether the request failed with a transient error,
+        no response means the connection failed
+        """
+        return response is None or response.status_code in self.retry_statuses
+
+    def should_retry(self, attempt: int, response: Optional[requests.models.Response]) -> bool:
+        """
+        Checks whether the request made after the given number of retries is to be repeated
+        """
+        if not self.is_failure(response):
+            return False
+        if attempt < self._max_retries:
+            return True
+        with self._lock:
+            self._stats['retries_exhausted'] += 1
+        return False
+
+    def get_delay(self, attempt: int, response: Optional[requests.models.Response]) -> float:
+        """
+        Retrieve seconds to wait before the next retry: Retry-After of the response
+        or exponential backoff with full jitter, both capped by the maximum backoff
+        """
+        with self._lock:
+            self._stats['retries'] += 1
+        retry_after = self._parse_retry_after(
+            response.headers.get('Retry-After') if response is not None else None)
+        if retry_after is not None:
+            return min(retry_after, self._max_backoff)
+        return random.uniform(0, min(self._max_backoff, self._backoff_factor * 2 ** attempt))
+
+    def send(self, request: Callable[[], requests.models.Response],
+             on_backoff: Optional[Callable[[float], None]] = None) -> requests.models.Response:
+        """
+        Makes the request, repeating it after transient errors with backoff,
+        a connection error is raised again once retries are exhausted
+        """
+        attempt = 0
+        while True:
+            response: Optional[requests.models.Response] = None
+            try:
+                response = request()
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                if not self.should_retry(attempt, None):
+                    raise
+            if response is not None and not self.should_retry(attempt, response):
+                return response
+            delay = self.get_delay(attempt, response)
+            if on_backoff is not None:
+                on_backoff(delay)
+            time.sleep(delay)
+            attempt += 1
+
+    @staticmethod
+    def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """
+        Converts Retry-After given in seconds or as an HTTP date to seconds from now
+        """
+        if not value:
+            return None
+        if value.strip().isdigit():
+            return float(value)
+        try:
+            date = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, date.timestamp() - time.time())
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Retrieve numbers of retries made and requests given up after all retries
+        """
+        with self._lock:
+            return dict(self._stats)
+
+
+class CircuitBreaker:
+    """
+    Pauses requests to a host after a number of failures in a row
+    """
+
+    def __init__(self, threshold: int, cooldown: float) -> None:
+        """
+        Initializes an instance of the CircuitBreaker class
+        """
+        self._threshold = threshold
+        self._cooldown = cooldown
+        self._hosts: dict[str, tuple[int, float]] = {}
+        self._trips = 0
+        self._paused = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self, url: str) -> float:
+        """
+        Waits until requests to the host of the URL are resumed,
+        returns the number of seconds spent waiting
+        """
+        with self._lock:
+            _, opened_until = self._hosts.get(urlparse(url).netloc, (0, 0.0))
+            delay = max(0.0, opened_until - time.monotonic())
+            self._paused += delay
+        if delay:
+            time.sleep(delay)
+        return delay
+
+    def record(self, url: str, success: bool) -> None:
+        """
+        Counts the result of a request, opening the circuit
+        when the host fails too many times in a row
+        """
+        host = urlparse(url).netloc
+        with self._lock:
+            failures, opened_until = self._hosts.get(host, (0, 0.0))
+            if success:
+                self._hosts[host] = (0, opened_until)
+                return
+            failures += 1
+            now = time.monotonic()
+            if failures >= self._threshold and now >= opened_until:
+                # after the pause one more failure is enough to open the circuit again
+                self._hosts[host] = (self._threshold - 1, now + self._cooldown)
+                self._trips += 1
+            else:
+                self._hosts[host] = (failures, opened_until)
+
+    def get_stats(self) -> dict[str, float]:
+        """
+        Retrieve number of times hosts were paused and total seconds spent waiting for them
+        """
+        with self._lock:
+            return {'circuit_breaker_trips': self._trips,
+                    'circuit_breaker_wait_seconds': round(self._paused, 3)}
+
+
+class DownloadPolicy:
+    """
+    Reads response bodies in chunks, aborting the download of pages
+    that are too large or are not HTML
+    """
+
+    chunk_size = 16 * 1024
+
+    def __init__(self, max_bytes: int, content_types: list[str], encoding: str) -> None:
+        """
+        Initializes an instance of the DownloadPolicy class
+        """
+        self._max_bytes = max_bytes
+        self._content_types = [content_type.lower() for content_type in content_types]
+        self._encoding = encoding
+        self._aborted = 0
+        self._lock = threading.Lock()
+
+    def read(self, response: requests.models.Response) -> requests.models.Response:
+        """
+        Downloads the body of a streamed response, an aborted download
+        is marked with 413 or 415 status and has no body
+        """
+        content_length = response.headers.get('Content-Length', '')
+        media_type = response.headers.get('Content-Type', '').split(';')[0].strip().lower()
+        if content_length.isdigit() and int(content_length) > self._max_bytes:
+            return self._abort(response, 413, 'Body exceeds the size limit')
+        if response.status_code == 200 and media_type and \
+                media_type not in self._content_types:
+            return self._abort(response, 415, f'Content type {media_type} is not allowed')
+        decoder = codecs.getincrementaldecoder(self._encoding)(errors='replace') \
+            if response.status_code == 200 and not media_type else None
+        chunks, size = [], 0
+        for chunk in response.iter_content(self.chunk_size):
+            size += len(chunk)
+            if size > self._max_bytes:
+                return self._abort(response, 413, 'Body exceeds the size limit')
+            if decoder and (text := decoder.decode(chunk).lstrip()):
+                # a page without declared type is downloaded only if it starts with markup
+                if not text.startswith('<'):
+                    return self._abort(response, 415, 'Body is not markup')
+                decoder = None
+            chunks.append(chunk)
+        response._content = b''.join(chunks)  # pylint: disable=protected-access
+        return response
+
+    def _abort(self, response: requests.models.Response, status_code: int,
+               reason: str) -> requests.models.Response:
+        """
+        Closes the connection without reading the rest of the body
+        """
+        response.close()
+        response.status_code = status_code
+        response.reason = reason
+        response._content = b''  # pylint: disable=protected-access
+        with self._lock:
+            self._aborted += 1
+        return response
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Retrieve number of aborted downloads
+        """
+        with self._lock:
+            return {'downloads_aborted': self._aborted}
+
+
+class HostLimiter:
+    """
+    Limits the number of requests to each host performed at the same time
+    """
+
+    def __init__(self, max_in_flight_per_host: int) -> None:
+        """
+        Initializes an instance of the HostLimiter class
+        """
+        self._max_in_flight = max_in_flight_per_host
+        self._slots: dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def hold(self, url: str) -> Iterator[None]:
+        """
+        Waits for a free slot of the host of the URL and keeps it within the block
+        """
+        host = urlparse(url).netloc
+        with self._lock:
+            slots = self._slots.setdefault(host,
+                                           threading.BoundedSemaphore(self._max_in_flight))
+        with slots:
+            yield
+
+
+class Fetcher:
+    """
+    Session keeping a pool of keep-alive connections to each host
+    """
+
+    def __init__(self, pool_size: int, headers: dict[str, str], verify: bool,
+                 download_policy: Optional[DownloadPolicy] = None) -> None:
+        """
+        Initializes an instance of the Fetcher class
+        """
+        self._download_policy = download_policy
+        self._adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self._session = requests.Session()
+        self._session.mount('http://', self._adapter)
+        self._session.mount('https://', self._adapter)
+        self._session.headers.update(headers)
+        self._session.verify = verify
+
+    def get(self, url: str, timeout: int, headers: Optional[dict[str, str]] = None,
+            download_policy: Optional[DownloadPolicy] = None) -> requests.models.Response:
+        """
+        Requests the URL through one of the pooled connections, streaming the body
+        through the given download policy or the default one if there is any
+        """
+        download_policy = download_policy or self._download_policy
+        if not download_policy:
+            return self._session.get(url, timeout=timeout, headers=headers)
+        response = self._session.get(url, timeout=timeout, headers=headers, stream=True)
+        return download_policy.read(response)
+
+    def get_connection_stats(self) -> dict[str, int]:
+        """
+        Retrieve numbers of requests sent and connections opened for them
+        """
+        pools = self._adapter.poolmanager.pools
+        requests_sent = connections_opened = 0
+        # the pool container does not support iteration over its items
+        for key in pools.keys():  # pylint: disable=consider-using-dict-items
+            pool = pools[key]
+            requests_sent += pool.num_requests
+            connections_opened += pool.num_connections
+        return {'requests': requests_sent,
+                'connections_opened': connections_opened,
+                'connections_reused': requests_sent - connections_opened}
+
+    def close(self) -> None:
+        """
+        Closes all pooled connections
+        """
+        self._session.close()
+
+
+class RobotsCache:
+    """
+    Rules of robots.txt of each host, downloaded once and refreshed
+    after the time to live, with crawl delays passed to the rate limiter
+    """
+
+    max_bytes = 512 * 1024
+    # rules of a host that failed to give them are asked for again soon
+    failure_ttl = 60
+
+    def __init__(self, fetch: Callable[[str], requests.models.Response],
+                 rate_limiter: RateLimiter, user_agent: str, ttl: int) -> None:
+        """
+        Initializes an instance of the RobotsCache class
+        """
+        self._fetch = fetch
+        self._rate_limiter = rate_limiter
+        self._user_agent = user_agent
+        self._ttl = ttl
+        self._policies: dict[str, tuple[RobotFileParser, float]] = {}
+        self._host_locks: dict[str, threading.Lock] = {}
+        self._stats = {'robots_downloaded': 0, 'robots_disallowed': 0}
+        self._lock = threading.Lock()
+
+    def is_allowed(self, url: str) -> bool:
+        """
+        Checks whether rules of the host allow visiting the URL
+        """
+        if self.get_policy(url).can_fetch(self._user_agent, url):
+            return True
+        with self._lock:
+            self._stats['robots_disallowed'] += 1
+        return False
+
+    def get_policy(self, url: str) -> RobotFileParser:
+        """
+        Retrieve rules of the host of the URL, downloading them
+        if they are not known yet or are outdated
+        """
+        parts = urlparse(url)
+        root = f'{parts.scheme}://{parts.netloc}'
+        with self._lock:
+            host_lock = self._host_locks.setdefault(root, threading.Lock())
+        # other threads wait for rules of the host instead of downloading them again
+        with host_lock:
+            policy, expires = self._policies.get(root, (None, 0.0))
+            if policy is None or time.monotonic() > expires:
+                policy = self._download(root)
+                # only a failure to download rules disallows everything
+                ttl = min(self._ttl, self.failure_ttl) if policy.disallow_all else self._ttl
+                self._policies[root] = (policy, time.monotonic() + ttl)
+            return policy
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Retrieve numbers of downloaded rules and disallowed URLs
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def _download(self, root: str) -> RobotFileParser:
+        """
+        Downloads and parses rules of the host: missing rules allow everything,
+        while a server that stays unreachable or failing after retries disallows everything
+        """
+        policy = RobotFileParser(f'{root}/robots.txt')
+        try:
+            response = self._fetch(f'{root}/robots.txt')
+        except requests.exceptions.RequestException:
+            response = None
+        with self._lock:
+            self._stats['robots_downloaded'] += 1
+        if response is None or response.status_code >= 500:
+            policy.disallow_all = True
+        elif response.status_code >= 400:
+            policy.allow_all = True
+        else:
+            policy.parse(response.text.splitlines())
+        request_rate = policy.request_rate(self._user_agent)
+        crawl_delay = policy.crawl_delay(self._user_agent)
+        if request_rate and request_rate.requests and request_rate.seconds:
+            self._rate_limiter.limit_host(root, request_rate.requests / request_rate.seconds)
+        if crawl_delay:
+            self._rate_limiter.limit_host(root, 1 / float(crawl_delay))
+        return policy
+
+
+class ResponseCache:
+    """
+    On-disk storage of downloaded pages revalidated with ETag and Last-Modified
+    """
+
+    stored_headers = ('Content-Type', 'ETag', 'Last-Modified')
+
+    def __init__(self, path: Path, ttl: int, max_bytes: int,
+                 request_headers: dict[str, str]) -> None:
+        """
+        Initializes an instance of the ResponseCache class
+        """
+        self.path = path
+        self._ttl = ttl
+        self._max_bytes = max_bytes
+        self._variant = json.dumps(request_headers, sort_keys=True)
+        self._lock = threading.Lock()
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._size = sum(body.stat().st_size for body in self.path.glob('*.body'))
+
+    def _get_key(self, url: str) -> str:
+        """
+        Makes a file name for the URL requested with configured headers
+        """
+        return hashlib.sha256(f'{url}\n{self._variant}'.encode('utf-8')).hexdigest()
+
+    def lookup(self, url: str) -> Optional[dict]:
+        """
+        Retrieve cached entry for the URL with its age in seconds
+        """
+        key = self._get_key(url)
+        meta_path, body_path = self.path / f'{key}.json', self.path / f'{key}.body'
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as meta_file:
+                entry: dict = json.load(meta_file)
+            entry['body'] = body_path.read_bytes()
+        except (OSError, json.decoder.JSONDecodeError):
+            return None
+        entry['age'] = time.time() - entry['stored_at']
+        # eviction may remove the entry after it is read, then it is a miss
+        with self._lock:
+            try:
+                os.utime(body_path)
+            except FileNotFoundError:
+                return None
+        return entry
+
+    def is_fresh(self, entry: dict) -> bool:
+        """
+        Checks whether the entry can be used without asking the server
+        """
+        return bool(entry['age'] < self._ttl)
+
+    @staticmethod
+    def get_conditional_headers(entry: dict) -> dict[str, str]:
+        """
+        Retrieve headers asking the server to send the page only if it changed
+        """
+        headers = {}
+        if etag := entry['headers'].get('ETag'):
+            headers['If-None-Match'] = etag
+        if last_modified := entry['headers'].get('Last-Modified'):
+            headers['If-Modified-Since'] = last_modified
+        return headers
+
+    @staticmethod
+    def to_response(url: str, entry: dict) -> requests.models.Response:
+        """
+        Rebuilds a response from the cached entry
+        """
+        response = requests.models.Response()
+        response.url = url
+        response.status_code = entry['status_code']
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response._content = entry['body']  # pylint: disable=protected-access
+        return response
+
+    def store(self, url: str, response: requests.models.Response) -> None:
+        """
+        Saves a successful response and evicts least recently used entries
+        if the cache exceeds its size limit
+        """
+        key = self._get_key(url)
+        entry = {'url': url,
+                 'status_code': response.status_code,
+                 'headers': {name: response.headers[name] for name in self.stored_headers
+                             if name in response.headers},
+                 'stored_at': time.time()}
+        body_path = self.path / f'{key}.body'
+        with self._lock:
+            if body_path.exists():
+                self._size -= body_path.stat().st_size
+            self._write(body_path, response.content)
+            self._write(self.path / f'{key}.json', json.dumps(entry).encode('utf-8'))
+            self._size += len(response.content)
+            self._evict()
+
+    def refresh(self, url: str, entry: dict) -> None:
+        """
+        Marks the cached entry as just revalidated, storing it again
+        if it was evicted after it had been looked up
+        """
+        key = self._get_key(url)
+        meta = {'url': url, 'status_code': entry['status_code'], 'headers': entry['headers'],
+                'stored_at': time.time()}
+        with self._lock:
+            if (self.path / f'{key}.body').exists():
+                self._write(self.path / f'{key}.json', json.dumps(meta).encode('utf-8'))
+                return
+        self.store(url, self.to_response(url, entry))
+
+    def get_size(self) -> int:
+        """
+        Retrieve total size of cached pages in bytes
+        """
+        return self._size
+
+    @staticmethod
+    def _write(path: Path, content: bytes) -> None:
+        """
+        Replaces the file content so that readers never see a partial file
+        """
+        tmp_path = path.with_suffix(f'{path.suffix}.tmp{threading.get_ident()}')
+        tmp_path.write_bytes(content)
+        tmp_path.replace(path)
+
+    def _evict(self) -> None:
+        """
+        Removes least recently used entries until the cache fits its size limit
+        """
+        if self._size <= self._max_bytes:
+            return
+        bodies = sorted(self.path.glob('*.body'), key=lambda body: body.stat().st_mtime)
+        for body_path in bodies:
+            if self._size <= self._max_bytes:
+                break
+            self._size -= body_path.stat().st_size
+            body_path.unlink()
+            body_path.with_suffix('.json').unlink(missing_ok=True)
@@ -0,0 +1,94 @@
+"""
+Timers and counters showing where the scrapper spends time during a run
+"""
+import json
+import math
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+
+def get_percentile(sorted_values: list[float], percent: float) -> float:
+    """
+    Retrieve the nearest-rank percentile of sorted values
+    """
+    rank = max(1, math.ceil(percent / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class Metrics:
+    """
+    Thread-safe storage of stage durations and event counters of a run
+    """
+
+    percentiles = (50, 90, 99)
+
+    def __init__(self) -> None:
+        """
+        Initializes an instance of the Metrics class
+        """
+        self._started = time.perf_counter()
+        self._timings: defaultdict[str, list[float]] = defaultdict(list)
+        self._counters: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        """
+        Measures the duration of the enclosed block as a stage with the given name
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def record(self, name: str, seconds: float) -> None:
+        """
+        Adds a duration measured elsewhere to the stage with the given name
+        """
+        with self._lock:
+            self._timings[name].append(seconds)
+
+    def add(self, name: str, value: int = 1) -> None:
+        """
+        Increases the counter with the given name
+        """
+        with self._lock:
+            self._counters[name] += value
+
+    def get_summary(self) -> dict:
+        """
+        Retrieve counters, duration percentiles of each stage in milliseconds
+        and throughput since the start of the run
+        """
+        duration = time.perf_counter() - self._started
+        with self._lock:
+            timings = {name: sorted(values) for name, values in self._timings.items()}
+            counters = dict(self._counters)
+        stages = {}
+        for name, values in sorted(timings.items()):
+            stages[name] = {'count': len(values),
+                            'total_ms': round(sum(values) * 1000, 3),
+                            'mean_ms': round(sum(values) / len(values) * 1000, 3),
+                            **{f'p{percent}_ms': round(get_percentile(values, percent) * 1000, 3)
+                               for percent in self.percentiles},
+                            'max_ms': round(values[-1] * 1000, 3)}
+        return {'duration_seconds': round(duration, 3),
+                'stages': stages,
+                'counters': counters,
+                'throughput': {
+                    'articles_per_second': round(counters.get('articles_saved', 0) / duration, 3),
+                    'bytes_per_second': round(counters.get('bytes_downloaded', 0) / duration, 3)
+                }}
+
+    def save(self, path: Path, **extra: object) -> None:
+        """
+        Writes the summary of the run with additional sections to a JSON file
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as summary_file:
+            json.dump({**self.get_summary(), **extra}, summary_file, indent=4)
@@ -0,0 +1,64 @@
+"""
+Compares time and memory spent by HTML parsing backends on saved pages
+"""
+import json
+import statistics
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from core_utils.constants import CRAWLER_CONFIG_PATH
+from lab_5_scrapper.configuration import PARSER_BACKENDS, Config
+from lab_5_scrapper.scrapper import HTMLParser
+
+FIXTURES_PATH = Path(__file__).parent / 'tests' / 'test_files'
+
+
+def make_config(backend: str, directory: Path) -> Config:
+    """
+    Creates configuration selecting the given parsing backend
+    """
+    with open(CRAWLER_CONFIG_PATH, 'r', encoding='utf-8') as config_file:
+        config_dict = json.load(config_file)
+    config_dict['parser_backend'] = backend
+    path = directory / f'{backend}_config.json'
+    with open(path, 'w', encoding='utf-8') as config_file:
+        json.dump(config_dict, config_file)
+    return Config(path)
+
+
+def measure(config: Config, pages: list[str], repeats: int) -> dict[str, float]:
+    """
+    Returns median parsing time and peak memory allocated on Python heap per page
+    """
+    timings = []
+    for _ in range(repeats):
+        for page in pages:
+            start = time.perf_counter()
+            HTMLParser('https://example.com', 1, config).parse_html(page)
+            timings.append(time.perf_counter() - start)
+    peaks = []
+    for page in pages:
+        tracemalloc.start()
+        HTMLParser('https://example.com', 1, config).parse_html(page)
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return {'median_ms': statistics.median(timings) * 1000,
+            'peak_kib': max(peaks) / 1024}
+
+
+def main() -> None:
+    """
+    Entrypoint for the benchmark
+    """
+    pages = [path.read_text(encoding='utf-8') for path in sorted(FIXTURES_PATH.glob('*.html'))]
+    with tempfile.TemporaryDirectory() as directory:
+        for backend in PARSER_BACKENDS:
+            result = measure(make_config(backend, Path(directory)), pages, repeats=200)
+            print(f'{backend:>5}: {result["median_ms"]:.2f} ms per page, '
+                  f'{result["peak_kib"]:.0f} KiB peak of Python heap')
+
+
+if __name__ == "__main__":
+    main()
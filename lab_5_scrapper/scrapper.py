@@ -1,216 +1,403 @@
 """
 Crawler implementation
 """
+import asyncio
 import datetime
 import json
-import random
-import re
+import math
+import os
+import queue
 import shutil
-import time
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Pattern, Union
+from typing import Callable, Iterator, Optional, Pattern, Union
 
 import requests
 from bs4 import BeautifulSoup
+from lxml import etree, html
 
 from core_utils.article.article import Article
-from core_utils.article.io import to_meta, to_raw
-from core_utils.config_dto import ConfigDTO
-from core_utils.constants import (ASSETS_PATH, CRAWLER_CONFIG_PATH,
-                                  NUM_ARTICLES_UPPER_LIMIT,
-                                  TIMEOUT_LOWER_LIMIT, TIMEOUT_UPPER_LIMIT)
-
-
-class IncorrectSeedURLError(TypeError):
+from core_utils.constants import ASSETS_PATH, CRAWLER_CONFIG_PATH, METRICS_PATH
+from lab_5_scrapper.configuration import Config
+# configuration errors are re-exported as a part of the scrapper interface
+# pylint: disable=unused-import
+from lab_5_scrapper.exceptions import (IncorrectArchiveSettingsError,
+                                       IncorrectCacheSettingsError,
+                                       IncorrectCrawlLimitsError,
+                                       IncorrectDeduplicationSettingsError,
+                                       IncorrectDiscoverySettingsError,
+                                       IncorrectDownloadLimitsError,
+                                       IncorrectEncodingError,
+                                       IncorrectHeadersError,
+                                       IncorrectIncrementalModeError,
+                                       IncorrectMaxInFlightError,
+                                       IncorrectNumberOfArticlesError,
+                                       IncorrectParseProcessesError,
+                                       IncorrectParserBackendError,
+                                       IncorrectPoolSizeError,
+                                       IncorrectRateLimitError,
+                                       IncorrectRetrySettingsError,
+                                       IncorrectRobotsSettingsError,
+                                       IncorrectSeedURLError,
+                                       IncorrectTimeoutError,
+                                       IncorrectUrlPatternsError,
+                                       IncorrectVerifyError,
+                                       NumberOfArticlesOutOfRangeError)
+# pylint: enable=unused-import
+from lab_5_scrapper.feeds import iter_feed_entries, open_feed
+from lab_5_scrapper.storage import (ArticleIndex, OrderedArticleWriter,
+                                    article_to_fields)
+
+ARTICLE_XPATHS = {
+    'text': etree.XPath('(//div[@itemprop="articleBody"])[1]//p'),
+    'title': etree.XPath('(//div[@itemprop="headline"])[1]//h1'),
+    'author': etree.XPath('(//span[@itemprop="author"])[1]//meta[@itemprop="name"]/@content'),
+    'topics': etree.XPath('(//ul[@itemprop="keywords"])[1]//li'),
+    'date': etree.XPath('(//meta[@itemprop="datePublished"])[1]/@content')
+}
+
+
+def get_fair_shares(demands: list[float], budget: int) -> list[int]:
     """
-    Raised when seed URLs are in incorrect form
+    Splits the budget between consumers so that none of them gets more than it demands
+    and the rest get equal parts, extra units going to the first consumers
     """
+    shares = [0] * len(demands)
+    unsatisfied = [index for index, demand in enumerate(demands) if demand > 0]
+    while budget > 0 and unsatisfied:
+        portion = max(1, budget // len(unsatisfied))
+        for index in list(unsatisfied):
+            grant = int(min(portion, demands[index] - shares[index], budget))
+            shares[index] += grant
+            budget -= grant
+            if shares[index] >= demands[index]:
+                unsatisfied.remove(index)
+            if not budget:
+                break
+    return shares
+
+
+def drain_queue(items: queue.Queue) -> list:
+    """
+    Waits for an item of the queue and takes it together with all items already put
+    """
+    drained = [items.get()]
+    while True:
+        try:
+            drained.append(items.get_nowait())
+        except queue.Empty:
+            return drained
 
-class NumberOfArticlesOutOfRangeError(Exception):
-
-    """Raised when the number of articles is
-    out of range from 1 to 150"""
-
-class IncorrectNumberOfArticlesError(Exception):
-
-    """Raised when the number of articles is not int"""
-
-class IncorrectHeadersError(Exception):
-
-    """Raised when headers are in incorrect form"""
-
-
-class IncorrectEncodingError(Exception):
 
-    """Raised when encoding is in incorrect form"""
+def make_request(url: str, config: Config) -> requests.models.Response:
+    """
+    Delivers a response from a request
+    with given configuration
+    """
+    with config.get_metrics().timer('make_request'):
+        archive = config.get_http_archive()
+        # replayed responses skip rate limiting, retries and caching
+        response = archive.fetch(url, partial(fetch_response, url, config)) if archive \
+            else fetch_response(url, config)
+        response.encoding = config.get_encoding()
+        return response
 
-class IncorrectTimeoutError(Exception):
 
-    """Raised when timeout is in incorrect form"""
+def fetch_response(url: str, config: Config) -> requests.models.Response:
+    """
+    Takes a fresh response from the cache or downloads it,
+    revalidating a cached one with the server
+    """
+    metrics = config.get_metrics()
+    cache = config.get_response_cache()
+    entry = cache.lookup(url) if cache else None
+    if cache and entry and cache.is_fresh(entry):
+        metrics.add('cache_hits')
+        return cache.to_response(url, entry)
+    response = send_with_retries(
+        url, config, cache.get_conditional_headers(entry) if cache and entry else None)
+    metrics.add('bytes_downloaded', len(response.content))
+    if cache and entry and response.status_code == 304:
+        metrics.add('cache_revalidations')
+        cache.refresh(url, entry)
+        response = cache.to_response(url, entry)
+    elif cache and response.status_code == 200:
+        cache.store(url, response)
+    return response
 
-class IncorrectVerifyError(Exception):
 
-    """Raise when verify certificate is in incorrect form"""
+def send_with_retries(url: str, config: Config,
+                      headers: Optional[dict[str, str]] = None) -> requests.models.Response:
+    """
+    Sends a request, repeating it after transient errors
+    while the host is not paused by the circuit breaker
+    """
+    if (robots_cache := config.get_robots_cache()) is not None:
+        # the crawl delay of the host reaches the rate limiter before the first request
+        robots_cache.get_policy(url)
+    return config.send_request(url, headers)
 
 
-class Config:
+async def make_request_async(url: str, config: Config,
+                             semaphore: asyncio.Semaphore) -> requests.models.Response:
     """
-    Unpacks and validates configurations
+    Delivers a response from a request in a worker thread,
+    waiting for a free slot of the concurrency pool
     """
+    async with semaphore:
+        return await asyncio.to_thread(make_request, url, config)
 
-    def __init__(self, path_to_config: Path) -> None:
-        """
-        Initializes an instance of the Config class
-        """
-        self.path_to_config = path_to_config
-        self.config = self._extract_config_content()
-        self._validate_config_content()
-
-        self._seed_urls = self.config.seed_urls
-        self._num_articles = self.config.total_articles
-        self._headers = self.config.headers
-        self._encoding = self.config.encoding
-        self._timeout = self.config.timeout
-        self._should_verify_certificate = self.config.should_verify_certificate
-        self._headless_mode = self.config.headless_mode
 
-    def _extract_config_content(self) -> ConfigDTO:
-        """
-        Returns config values
-        """
-        with open(self.path_to_config, 'r', encoding='utf-8') as path:
-            config_dict = json.load(path)
-        return ConfigDTO(**config_dict)
+class Crawler:
+    """
+    Crawler implementation
+    """
 
-    def _validate_config_content(self) -> None:
-        """
-        Ensure configuration parameters
-        are not corrupt
-        """
-        if not isinstance(self.config.seed_urls, list):
-            raise IncorrectSeedURLError('seed URL is not a list')
-        regex = re.compile(r'https?://')
-        for url in self.config.seed_urls:
-            if not isinstance(url, str):
-                raise IncorrectSeedURLError('seed URL is not str')
-            if not re.match(regex, url):
-                raise IncorrectSeedURLError('seed URL does not match standard pattern')
-        if not isinstance(self.config.total_articles, int) or \
-                self.config.total_articles <= 0:
-            raise IncorrectNumberOfArticlesError('total number of articles to parse is not integer')
-        if not 1 <= self.config.total_articles <= NUM_ARTICLES_UPPER_LIMIT:
-            raise NumberOfArticlesOutOfRangeError('total number of articles is out of range')
-        if not isinstance(self.config.headers, dict):
-            raise IncorrectHeadersError('headers are not in a form of dictionary')
-        if not isinstance(self.config.encoding, str):
-            raise IncorrectEncodingError('encoding must be specified as a string')
-        if not isinstance(self.config.timeout, int) or \
-                not TIMEOUT_LOWER_LIMIT <= self.config.timeout <= TIMEOUT_UPPER_LIMIT:
-            raise IncorrectTimeoutError('timeout value must be a positive integer less than 60')
-        if not isinstance(self.config.should_verify_certificate, bool):
-            raise IncorrectVerifyError('verify certificate value must either be True or False')
-        if not isinstance(self.config.headless_mode, bool):
-            raise IncorrectVerifyError('headless mode value must either be True or False')
+    url_pattern: Union[Pattern, str]
 
-    def get_seed_urls(self) -> list[str]:
+    def __init__(self, config: Config, index: Optional[ArticleIndex] = None) -> None:
         """
-        Retrieve seed urls
+        Initializes an instance of the Crawler class
         """
-        return self._seed_urls
+        self.config = config
+        self.urls = []
+        self._seed_urls = self.config.get_seed_urls()
+        self._index = index
+        self._classifier = self.config.get_url_classifier()
 
-    def get_num_articles(self) -> int:
+    def find_articles(self) -> None:
         """
-        Retrieve total number of articles to scrape
+        Finds articles
         """
-        return self._num_articles
+        with self.config.get_metrics().timer('find_articles'):
+            for _ in self.iter_urls():
+                pass
+
+    def iter_urls(self) -> Iterator[str]:
+        """
+        Finds articles walking listings of all seeds or all feeds at the same time,
+        yielding links of each of them within its fair share of the number of articles
+        """
+        sources = self.config.get_feed_urls() if self.config.get_discovery() == 'feeds' \
+            else self._seed_urls
+        found: queue.Queue = queue.Queue()
+        stop = threading.Event()
+        pending: list[deque[str]] = [deque() for _ in sources]
+        demands = [math.inf] * len(sources)
+        admitted = [0] * len(sources)
+        claim = self._make_claim()
+        executor = ThreadPoolExecutor(max_workers=self.config.get_max_in_flight())
+        for seed_index, url in enumerate(sources):
+            executor.submit(self._find_seed_links, seed_index, url, found, stop, claim)
+        try:
+            running = len(sources)
+            while running and len(self.urls) < self.config.get_num_articles():
+                # links which arrived together are admitted together, so that seeds alternate
+                for seed_index, links, finished in drain_queue(found):
+                    if isinstance(links, Exception):
+                        raise links
+                    pending[seed_index].extend(links)
+                    if finished:
+                        running -= 1
+                        demands[seed_index] = admitted[seed_index] + len(pending[seed_index])
+                yield from self._admit_fair_share(pending, admitted, demands)
+        finally:
+            stop.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _make_claim(self) -> Callable[[str], bool]:
+        """
+        Makes a check, called in threads of seeds, that a link is new, not saved
+        and allowed, so that the first seed to find a link gets it
+        """
+        claimed, claim_lock = set(self.urls), threading.Lock()
+
+        def claim(link: str) -> bool:
+            if self._is_saved(link) or not self._is_allowed(link):
+                return False
+            with claim_lock:
+                if link in claimed:
+                    return False
+                claimed.add(link)
+            return True
+
+        return claim
+
+    def _admit_fair_share(self, pending: list[deque[str]], admitted: list[int],
+                          demands: list[float]) -> Iterator[str]:
+        """
+        Takes pending links of seeds in round robin while they fit into
+        fair shares of the number of articles, seeds without pending links
+        are passed over so that slow seeds do not hold back the others
+        """
+        shares = get_fair_shares(demands, self.config.get_num_articles()
+                                 - len(self.urls) + sum(admitted))
+        while candidates := [index for index, links in enumerate(pending)
+                             if links and admitted[index] < shares[index]]:
+            # the seed with the fewest admitted links goes first
+            seed_index = min(candidates, key=lambda index: (admitted[index], index))
+            admitted[seed_index] += 1
+            self.urls.append(pending[seed_index].popleft())
+            yield self.urls[-1]
+
+    def _find_seed_links(self, seed_index: int, url: str,  # pylint: disable=too-many-arguments
+                         found: queue.Queue, stop: threading.Event,
+                         claim: Callable[[str], bool]) -> None:
+        """
+        Puts links from listing pages of a seed or from a feed to the queue batch by batch,
+        then marks the seed as finished or passes the error that occurred
+        """
+        batches = self._iter_feed(url, stop, claim) \
+            if self.config.get_discovery() == 'feeds' else self._iter_listing(url, stop, claim)
+        try:
+            for links in batches:
+                found.put((seed_index, links, False))
+        except Exception as error:  # pylint: disable=broad-except
+            found.put((seed_index, error, True))
+            return
+        found.put((seed_index, [], True))
 
-    def get_headers(self) -> dict[str, str]:
+    def _iter_listing(self, url: str, stop: threading.Event,
+                      claim: Callable[[str], bool]) -> Iterator[list[str]]:
         """
-        Retrieve headers to use during requesting
+        Walks listing pages of a seed until enough links are claimed or a page
+        is not full, downloading the next page while the current one is parsed
         """
-        return self._headers
+        num_arts = self.config.get_num_articles()
+        page_size = min(num_arts, self.config.get_listing_page_size())
+        seen: set[str] = set()
+        claimed = 0
+        with ThreadPoolExecutor(max_workers=1) as prefetcher:
+            request_page = partial(self._request_listing_page, prefetcher, url, page_size)
+            next_page: Optional[Future] = request_page(1)
+            page_number = 1
+            while next_page and not stop.is_set():
+                response = next_page.result()
+                page_number += 1
+                # the next page is prefetched only if it is needed whatever this one brings
+                next_page = request_page(page_number) \
+                    if claimed + page_size < num_arts else None
+                is_last, new_links = self._claim_page_links(response, page_size, seen, claim)
+                if new_links:
+                    claimed += len(new_links)
+                    yield new_links
+                if claimed >= num_arts or is_last:
+                    break
+                next_page = next_page or request_page(page_number)
+            if next_page:
+                next_page.cancel()
 
-    def get_encoding(self) -> str:
+    def _request_listing_page(self, prefetcher: ThreadPoolExecutor, url: str,
+                              page_size: int, page_number: int) -> Future:
         """
-        Retrieve encoding to use during parsing
+        Starts downloading a listing page of the seed in the background
         """
-        return self._encoding
+        return prefetcher.submit(make_request,
+                                 self._get_listing_url(url, page_number, page_size),
+                                 self.config)
 
-    def get_timeout(self) -> int:
+    def _claim_page_links(self, response: requests.models.Response, page_size: int,
+                          seen: set[str], claim: Callable[[str], bool]) -> tuple[bool, list[str]]:
         """
-        Retrieve number of seconds to wait for response
+        Claims new links of a listing page and tells whether the page is the last one,
+        which is the case when it is not full or brings no new links
         """
-        return self._timeout
+        with self.config.get_metrics().timer('collect_urls'):
+            page_links = self._extract_links(response)
+        links = [link for link in page_links if link not in seen]
+        seen.update(links)
+        return not links or len(page_links) < page_size, [link for link in links if claim(link)]
 
-    def get_verify_certificate(self) -> bool:
+    def _iter_feed(self, url: str, stop: threading.Event,
+                   claim: Callable[[str], bool]) -> Iterator[list[str]]:
         """
-        Retrieve whether to verify certificate
+        Reads a sitemap or a feed together with nested sitemaps until enough links
+        are claimed, yielding article links in batches of the listing page size
         """
-        return self._should_verify_certificate
+        num_arts = self.config.get_num_articles()
+        batch_size = min(num_arts, self.config.get_listing_page_size())
+        feeds, visited = deque([url]), {url}
+        seen: set[str] = set()
+        claimed = 0
+        while feeds and claimed < num_arts and not stop.is_set():
+            batch = []
+            for kind, link in self._read_feed(feeds.popleft()):
+                if kind == 'sitemap':
+                    if link not in visited:
+                        visited.add(link)
+                        feeds.append(link)
+                elif self._classifier.is_article(link) and link not in seen:
+                    seen.add(link)
+                    if not claim(link):
+                        continue
+                    claimed += 1
+                    batch.append(link)
+                    if len(batch) == batch_size:
+                        yield batch
+                        batch = []
+                    if claimed >= num_arts or stop.is_set():
+                        break
+            if batch:
+                yield batch
+
+    def _read_feed(self, url: str) -> Iterator[tuple[str, str]]:
+        """
+        Streams entries of a sitemap or a feed modified after the configured date,
+        a malformed or truncated document gives the entries read before the error
+        """
+        response = make_request(url, self.config)
+        if response.status_code != 200:
+            return
+        modified_since = self.config.get_modified_since()
+        with self.config.get_metrics().timer('parse_feed'):
+            try:
+                for kind, link, modified in iter_feed_entries(open_feed(response.content)):
+                    # entries without a date are kept as they may be new
+                    if modified_since is not None and modified is not None and \
+                            modified < modified_since:
+                        continue
+                    if (canonical_link := self._classifier.canonicalize(link, url)) and \
+                            not self._classifier.is_excluded(canonical_link):
+                        yield kind, canonical_link
+            except (etree.XMLSyntaxError, EOFError, OSError):
+                self.config.get_metrics().add('feeds_malformed')
 
-    def get_headless_mode(self) -> bool:
+    @staticmethod
+    def _get_listing_url(url: str, page_number: int, page_size: int) -> str:
         """
-        Retrieve whether to use headless mode
+        Makes URL of a listing page of the seed
         """
-        return self._headless_mode
-
-
-def make_request(url: str, config: Config) -> requests.models.Response:
-    """
-    Delivers a response from a request
-    with given configuration
-    """
-    time.sleep(random.randint(1, 6))
-    response = requests.get(url,
-                        headers=config.get_headers(),
-                        timeout=config.get_timeout())
-    response.encoding = config.get_encoding()
-    return response
-
+        if page_number == 1:
+            return f'{url}?per-page={page_size}'
+        return f'{url}?page={page_number}&per-page={page_size}'
 
-class Crawler:
-    """
-    Crawler implementation
-    """
-
-    url_pattern: Union[Pattern, str]
-
-    def __init__(self, config: Config) -> None:
+    def _extract_links(self, response: requests.models.Response) -> list[str]:
         """
-        Initializes an instance of the Crawler class
+        Retrieve article links found on a seed page
         """
-        self.config = config
-        self.urls = []
-        self._seed_urls = self.config.get_seed_urls()
-
+        if response.status_code != 200:
+            return []
+        main_bs = BeautifulSoup(response.text, 'lxml')
+        feed_lines = main_bs.find_all('a', {'class': 'd-block mb-0'})
+        links = self._classifier.classify((str(line.get('href') or '') for line in feed_lines),
+                                          response.url)
+        return [link for link, is_article in links if is_article]
 
-    def _extract_url(self, article_bs: BeautifulSoup) -> str:
+    def _is_saved(self, url: str) -> bool:
         """
-        Finds and retrieves URL from HTML
+        Checks whether the article was downloaded by a previous run
         """
-        url: Union[str, list, None] = article_bs.get('href')
-        if isinstance(url, str) and \
-            '/volga/news/' in url:
-            return url
-        return ''
+        return self._index is not None and url in self._index
 
-    def find_articles(self) -> None:
+    def _is_allowed(self, url: str) -> bool:
         """
-        Finds articles
+        Checks whether robots.txt of the host allows visiting the URL
         """
-        num_arts = self.config.get_num_articles()
-        for url in self._seed_urls:
-            response = make_request(f'{url}?per-page={num_arts}', self.config)
-            if response.status_code != 200:
-                continue
-            main_bs = BeautifulSoup(response.text, 'lxml')
-            feed_lines = main_bs.find_all('a', {'class': 'd-block mb-0'})
-            for line in feed_lines:
-                if len(self.urls) >= num_arts:
-                    break
-                if link := self._extract_url(line):
-                    self.urls.append(link)
-
+        robots_cache = self.config.get_robots_cache()
+        return robots_cache is None or robots_cache.is_allowed(url)
 
     def get_search_urls(self) -> list:
         """
@@ -219,18 +406,18 @@ class Crawler:
         return self._seed_urls
 
 
-class HTMLParser:
+class PageParser:
     """
-    ArticleParser implementation
+    Extracts an article from a downloaded page
     """
 
-    def __init__(self, full_url: str, article_id: int, config: Config) -> None:
+    def __init__(self, full_url: str, article_id: int, parser_backend: str) -> None:
         """
-        Initializes an instance of the HTMLParser class
+        Initializes an instance of the PageParser class
         """
         self.full_url = full_url
         self.article_id = article_id
-        self.config = config
+        self.parser_backend = parser_backend
         self.article: Article = Article(full_url, article_id)
 
     def _fill_article_with_text(self, article_soup: BeautifulSoup) -> None:
@@ -273,136 +460,460 @@ class HTMLParser:
         """
         return datetime.datetime.strptime(date_str, '%Y-%m-%dT%H:%M:%S%z')
 
-    def parse(self) -> Union[Article, bool, list]:
+    def parse_html(self, page: str) -> Union[Article, bool, list]:
         """
-        Parses each article
+        Fills the article with the content of the page
+        using the parsing backend
         """
-        response = make_request(self.full_url, self.config)
-        b_s = BeautifulSoup(response.text, 'lxml')
+        if self.parser_backend == 'lxml':
+            self._fill_article_from_tree(html.fromstring(page))
+            return self.article
+        b_s = BeautifulSoup(page, 'lxml')
         self._fill_article_with_text(b_s)
         self._fill_article_with_meta_information(b_s)
         return self.article
 
+    def _fill_article_from_tree(self, tree: html.HtmlElement) -> None:
+        """
+        Finds text and meta information of article
+        with XPath expressions compiled beforehand
+        """
+        paragraphs = ARTICLE_XPATHS['text'](tree)
+        self.article.text = '\n'.join(par.text_content() for par in paragraphs)
+        self.article.title = ARTICLE_XPATHS['title'](tree)[0].text_content()
+        authors = ARTICLE_XPATHS['author'](tree)
+        self.article.author = [str(authors[0])] if authors and authors[0] else ['NOT FOUND']
+        self.article.topics = [tag.text_content().replace('"', '&quot;')
+                               for tag in ARTICLE_XPATHS['topics'](tree)]
+        if article_date := ARTICLE_XPATHS['date'](tree):
+            self.article.date = self.unify_date_format(str(article_date[0]))
+
+
+class HTMLParser(PageParser):
+    """
+    ArticleParser implementation
+    """
+
+    def __init__(self, full_url: str, article_id: int, config: Config) -> None:
+        """
+        Initializes an instance of the HTMLParser class
+        """
+        super().__init__(full_url, article_id, config.get_parser_backend())
+        self.config = config
+
+    def parse(self) -> Union[Article, bool, list]:
+        """
+        Parses each article
+        """
+        response = make_request(self.full_url, self.config)
+        return self._parse_response(response)
+
+    async def parse_async(self, semaphore: asyncio.Semaphore) -> Union[Article, bool, list]:
+        """
+        Parses an article downloaded within the concurrency pool
+        """
+        response = await make_request_async(self.full_url, self.config, semaphore)
+        return self._parse_response(response)
+
+    def _parse_response(self, response: requests.models.Response) -> Union[Article, bool, list]:
+        """
+        Fills the article with the content of the downloaded page,
+        pages of failed requests are not parsed
+        """
+        if response.status_code != 200:
+            return False
+        with self.config.get_metrics().timer('parse'):
+            return self.parse_html(response.text)
+
+
+class AsyncCrawler(Crawler):
+    """
+    A crawler, which requests all seed pages concurrently
+    """
+
+    def find_articles(self) -> None:
+        """
+        Finds articles
+        """
+        with self.config.get_metrics().timer('find_articles'):
+            asyncio.run(self.find_articles_async())
+
+    async def find_articles_async(self) -> None:
+        """
+        Finds articles without blocking the event loop,
+        walking listings or feeds of all seeds at the same time
+        """
+        # listings and feeds are walked by blocking threads of seeds
+        await asyncio.to_thread(partial(list, self.iter_urls()))
+
+
 class RecursiveCrawler(Crawler):
     """
     A crawler, which gets all necessary links
     given only one seed URL and is able
     to recover crawling after interruption
     """
-    def __init__(self, config: Config) -> None:
+
+    journal_batch_size = 16
+    compaction_interval = 512
+
+    def __init__(self, config: Config, index: Optional[ArticleIndex] = None) -> None:
         """
         Initializes an instance of the RecursiveCrawler class
         """
-        super().__init__(config)
+        super().__init__(config, index)
         self.start_url = self.config.get_seed_urls()[0]
         self.path_to_info = Path(__file__).parent / 'intermediate_info.json'
+        self.path_to_journal = self.path_to_info.with_suffix('.jsonl')
         if not self.path_to_info.exists():
             self.path_to_info.touch()
         self.url_index = 0
         self.other_urls = []
+        self.frontier: deque[tuple[str, int]] = deque()
+        self._generation = 0
+        self._journal_buffer: list[str] = []
+        self._records_since_compaction = 0
         self.load_intermediate_information()
 
-    def find_articles(self) -> None:
+    def iter_urls(self) -> Iterator[str]:
         """
-        Finds articles
+        Finds articles, visiting pages in breadth-first order
+        and yielding each link as soon as it is found, after links
+        restored from an interrupted run which are not saved yet
+        """
+        if self.config.get_discovery() == 'feeds':
+            yield from super().iter_urls()
+            return
+        restored_urls = [url for url in self.urls if not self._is_saved(url)]
+        try:
+            yield from restored_urls
+            yield from self._crawl()
+        finally:
+            self._flush_journal()
+
+    def _crawl(self) -> Iterator[str]:
+        """
+        Visits pages of the frontier until enough articles are found
         """
         num_arts = self.config.get_num_articles()
-        regex = re.compile(r'https?://')
-        response = make_request(self.start_url, self.config)
-        main_bs = BeautifulSoup(response.text, 'lxml')
-        feed_lines = main_bs.find_all('a')
-        for url in feed_lines[self.url_index:]:
-            if len(self.urls) >= num_arts:
-                return
-            link = self._extract_url(url)
-            if not link:
-                link = url.get('href')
-                if not link:
+        max_depth = self.config.get_max_crawl_depth()
+        if not self.frontier:
+            self._push(self._classifier.canonicalize(self.start_url) or self.start_url, 0)
+        visited = set(self.urls) | {page for page, _ in self.frontier}
+        known_other_urls = set(self.other_urls)
+        while self.frontier and len(self.urls) < num_arts:
+            self.start_url, depth = self.frontier[0]
+            response = make_request(self.start_url, self.config)
+            feed_lines = BeautifulSoup(response.text, 'lxml').find_all('a') \
+                if response.status_code == 200 else []
+            links = self._classifier.classify(
+                (str(line.get('href') or '')
+                 for line in feed_lines[:self.config.get_max_links_per_page()]),
+                self.start_url)
+            for position in range(self.url_index, len(links)):
+                if len(self.urls) >= num_arts:
+                    return
+                link, is_article = links[position]
+                if not is_article:
+                    if link not in known_other_urls:
+                        known_other_urls.add(link)
+                        self.other_urls.append(link)
+                        self._write_journal({'other': link})
                     continue
-                if link not in self.other_urls:
-                    if not re.match(regex, str(link)):
-                        link = 'https://www.interfax-russia.ru' + link
-                    self.other_urls.append(link)
-                continue
-            if link in self.urls:
-                continue
-            self.urls.append(link)
-            self.save_intermediate_information(feed_lines.index(url))
-        self.url_index = 0
-        while len(self.urls) < num_arts:
-            if self.start_url in self.urls:
-                index = self.urls.index(self.start_url)
-                self.start_url = self.urls[index+1]
-            else:
-                self.start_url = self.urls[0]
-            self.find_articles()
+                if link in visited or self._is_saved(link):
+                    continue
+                visited.add(link)
+                if not self._is_allowed(link):
+                    continue
+                self.urls.append(link)
+                self.url_index = position
+                self._write_journal({'url': link, 'page': self.start_url, 'index': position})
+                if depth < max_depth:
+                    self._push(link, depth + 1)
+                yield link
+            self.frontier.popleft()
+            self.url_index = 0
+            self._write_journal({'done': self.start_url})
+
+    def _push(self, page: str, depth: int) -> None:
+        """
+        Adds the page to the end of the frontier
+        """
+        self.frontier.append((page, depth))
+        self._write_journal({'push': page, 'depth': depth})
+
+    def _write_journal(self, record: dict) -> None:
+        """
+        Appends a change of the crawling state to the journal,
+        writing records to disk in batches
+        """
+        self._journal_buffer.append(json.dumps(record))
+        self._records_since_compaction += 1
+        if self._records_since_compaction >= self.compaction_interval:
+            self.save_intermediate_information(self.url_index)
+        elif len(self._journal_buffer) >= self.journal_batch_size:
+            self._flush_journal()
+
+    def _flush_journal(self) -> None:
+        """
+        Writes buffered journal records and makes sure they reach the disk
+        """
+        if not self._journal_buffer:
+            return
+        with open(self.path_to_journal, 'a', encoding='utf-8') as journal:
+            if not journal.tell():
+                journal.write(json.dumps({'generation': self._generation}) + '\n')
+            journal.write('\n'.join(self._journal_buffer) + '\n')
+            journal.flush()
+            os.fsync(journal.fileno())
+        self._journal_buffer.clear()
 
     def save_intermediate_information(self, url_index: int) -> None:
         """
         Saves values of start_url and urls attributes
-        in a json file
+        in a json file and starts a new journal
         """
+        self._generation += 1
         info_dict = {'current_start_url': self.start_url,
                      'current_url_idx': url_index,
                      'current_urls': self.urls,
-                     'current_other_urls': self.other_urls}
-        with open(self.path_to_info, 'w', encoding='utf-8') as json_file:
+                     'current_other_urls': self.other_urls,
+                     'current_frontier': list(self.frontier),
+                     'generation': self._generation}
+        tmp_path = self.path_to_info.with_suffix('.json.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as json_file:
             json.dump(info_dict, json_file)
+            json_file.flush()
+            os.fsync(json_file.fileno())
+        tmp_path.replace(self.path_to_info)
+        self.path_to_journal.unlink(missing_ok=True)
+        self._journal_buffer.clear()
+        self._records_since_compaction = 0
 
     def load_intermediate_information(self) -> None:
         """
         Loads start_url and urls values, saved before interruption,
-        from json file
+        from json file and replays the journal written after it
         """
         with open(self.path_to_info, 'r', encoding='utf-8') as json_file:
             try:
                 info_dict = json.load(json_file)
             except json.decoder.JSONDecodeError:
-                return
-        self.start_url = info_dict['current_start_url']
-        self.urls = info_dict['current_urls']
-        self.url_index = info_dict['current_url_idx']
-        self.other_urls = info_dict['current_other_urls']
-
-
-def prepare_environment(base_path: Union[Path, str]) -> None:
+                info_dict = {}
+        if info_dict:
+            self.start_url = info_dict['current_start_url']
+            self.urls = info_dict['current_urls']
+            self.url_index = info_dict['current_url_idx']
+            self.other_urls = info_dict['current_other_urls']
+            self.frontier = deque((page, depth)
+                                  for page, depth in info_dict.get('current_frontier', []))
+            self._generation = info_dict.get('generation', 0)
+        if self.path_to_journal.exists():
+            self._replay_journal()
+
+    def _replay_journal(self) -> None:
+        """
+        Applies journal records to the state loaded from the json file
+        """
+        with open(self.path_to_journal, 'r', encoding='utf-8') as journal:
+            lines = journal.read().splitlines()
+        try:
+            records = [json.loads(line) for line in lines]
+        except json.decoder.JSONDecodeError:
+            # the last record may be cut by the interruption
+            records = [json.loads(line) for line in lines[:-1]]
+        if not records or records[0].get('generation') != self._generation:
+            return
+        for record in records[1:]:
+            if 'url' in record:
+                self.urls.append(record['url'])
+                self.start_url, self.url_index = record['page'], record['index']
+            elif 'other' in record:
+                self.other_urls.append(record['other'])
+            elif 'push' in record:
+                self.frontier.append((record['push'], record['depth']))
+            elif 'done' in record and self.frontier and self.frontier[0][0] == record['done']:
+                self.frontier.popleft()
+                self.url_index = 0
+        self._records_since_compaction = len(records) - 1
+
+
+def prepare_environment(base_path: Union[Path, str], incremental: bool = False) -> None:
     """
     Creates ASSETS_PATH folder if no created and removes existing folder
+    unless articles from previous runs should be kept
     """
-    if base_path.exists():
+    base_path = Path(base_path)
+    if base_path.exists() and not incremental:
         shutil.rmtree(base_path)
-    base_path.mkdir(parents=True)
+    base_path.mkdir(parents=True, exist_ok=True)
+
+def parse_fields(full_url: str, configuration: Config) -> dict:
+    """
+    Downloads and parses an article in a thread and returns its fields
+    """
+    # the ID is given to the article only when it is saved
+    article = HTMLParser(full_url=full_url, article_id=0, config=configuration).parse()
+    if not isinstance(article, Article):
+        return {}
+    return article_to_fields(article)
+
+_PARSE_WORKER_STATE: dict[str, str] = {}
+
+def init_parse_worker(parser_backend: str, encoding: str) -> None:
+    """
+    Keeps parsing settings passed once to a parsing process
+    """
+    _PARSE_WORKER_STATE['parser_backend'] = parser_backend
+    _PARSE_WORKER_STATE['encoding'] = encoding
+
+def extract_article_fields(page: bytes, full_url: str) -> dict:
+    """
+    Parses a downloaded page in a parsing process
+    and returns fields of the article
+    """
+    parser = PageParser(full_url, 0, _PARSE_WORKER_STATE['parser_backend'])
+    article = parser.parse_html(page.decode(_PARSE_WORKER_STATE['encoding'], errors='replace'))
+    if not isinstance(article, Article):
+        return {}
+    return article_to_fields(article)
+
+def download_for_parsing(full_url: str, configuration: Config,
+                         pool: ProcessPoolExecutor) -> dict:
+    """
+    Downloads a page and waits until a parsing process extracts the article from it
+    """
+    response = make_request(full_url, configuration)
+    if response.status_code != 200:
+        return {}
+    # time spent in the queue of the process pool is included
+    with configuration.get_metrics().timer('parse'):
+        return pool.submit(extract_article_fields, response.content, full_url).result()
+
+def save_in_order(crawler: Crawler, configuration: Config, first_id: int,
+                  parse: Callable[[str], dict]) -> None:
+    """
+    Parses articles by a pool of workers while the crawler is still finding them,
+    pausing the crawler when workers fall behind, and saves them in the order
+    they were found, articles which failed to be parsed are counted and skipped
+    """
+    workers = configuration.get_max_in_flight()
+    free_slots = threading.Semaphore(2 * workers)
+    writer = OrderedArticleWriter(first_id, configuration.get_metrics(),
+                                  configuration.get_duplicate_index())
+
+    def save(position: int, future: Future) -> None:
+        if future.exception():
+            configuration.get_metrics().add('articles_failed')
+        writer.add(position, {} if future.exception() else future.result())
+        free_slots.release()
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for position, full_url in enumerate(crawler.iter_urls()):
+            free_slots.acquire()  # pylint: disable=consider-using-with
+            executor.submit(parse, full_url).add_done_callback(partial(save, position))
+    save_aliases(configuration)
+
+def stream_articles_to_processes(crawler: Crawler, configuration: Config,
+                                 first_id: int = 1) -> None:
+    """
+    Downloads pages found by the crawler in threads, parses them in processes
+    and saves articles in the main process in the order they were found
+    """
+    with ProcessPoolExecutor(max_workers=configuration.get_parse_processes(),
+                             initializer=init_parse_worker,
+                             initargs=(configuration.get_parser_backend(),
+                                       configuration.get_encoding())) as pool:
+        save_in_order(crawler, configuration, first_id,
+                      partial(download_for_parsing, configuration=configuration, pool=pool))
+
+def stream_articles(crawler: Crawler, configuration: Config, first_id: int = 1) -> None:
+    """
+    Parses and saves articles by a pool of workers while the crawler is still
+    finding them, giving consecutive IDs starting from first_id to saved articles
+    """
+    if configuration.get_parse_processes():
+        stream_articles_to_processes(crawler, configuration, first_id)
+        return
+    save_in_order(crawler, configuration, first_id,
+                  partial(parse_fields, configuration=configuration))
+
+def save_aliases(configuration: Config) -> None:
+    """
+    Records URLs of skipped near-duplicates in meta files of their originals
+    """
+    duplicates = configuration.get_duplicate_index()
+    if duplicates is not None:
+        duplicates.save_aliases()
+
+def report_run(configuration: Config) -> Path:
+    """
+    Saves timings, counters and request statistics of the run to a JSON file
+    and returns its path
+    """
+    path = METRICS_PATH / f'run_{datetime.datetime.now():%Y%m%d_%H%M%S}.json'
+    configuration.get_metrics().save(path, requests=configuration.get_request_stats())
+    return path
 
 def main1() -> None:
     """
     Entrypoint for scrapper module
     """
-    prepare_environment(ASSETS_PATH)
     configuration = Config(path_to_config=CRAWLER_CONFIG_PATH)
-    crawler = Crawler(config=configuration)
-    crawler.find_articles()
-    for i, full_url in enumerate(crawler.urls, 1):
-        parser = HTMLParser(full_url=full_url, article_id=i, config=configuration)
-        article: Union[Article, bool, list] = parser.parse()
-        if isinstance(article, Article):
-            to_raw(article)
-            to_meta(article)
+    prepare_environment(ASSETS_PATH, configuration.get_incremental())
+    index = ArticleIndex(ASSETS_PATH, configuration.get_duplicate_index())
+    crawler = Crawler(config=configuration, index=index)
+    stream_articles(crawler, configuration, index.get_next_id())
+    report_run(configuration)
 
 def main2() -> None:
     """
     Entrypoint for scrapper module
     """
-    prepare_environment(ASSETS_PATH)
     configuration = Config(path_to_config=CRAWLER_CONFIG_PATH)
-    crawler = RecursiveCrawler(config=configuration)
-    crawler.find_articles()
-    for i, full_url in enumerate(
-            crawler.urls[:configuration.get_num_articles()], 1):
-        parser = HTMLParser(full_url=full_url, article_id=i, config=configuration)
-        article: Union[Article, bool, list] = parser.parse()
-        if isinstance(article, Article):
-            to_raw(article)
-            to_meta(article)
+    prepare_environment(ASSETS_PATH, configuration.get_incremental())
+    index = ArticleIndex(ASSETS_PATH, configuration.get_duplicate_index())
+    crawler = RecursiveCrawler(config=configuration, index=index)
+    stream_articles(crawler, configuration, index.get_next_id())
+    report_run(configuration)
+
+async def crawl_async(configuration: Config, index: Optional[ArticleIndex] = None) -> None:
+    """
+    Crawls and parses articles concurrently, saving each one as soon as it and all
+    articles found before it are parsed, articles which failed to be parsed
+    are counted and skipped
+    """
+    semaphore = asyncio.Semaphore(configuration.get_max_in_flight())
+    crawler = AsyncCrawler(config=configuration, index=index)
+    await crawler.find_articles_async()
+    writer = OrderedArticleWriter(index.get_next_id() if index else 1,
+                                  configuration.get_metrics(),
+                                  configuration.get_duplicate_index())
+
+    async def parse_at(position: int, full_url: str) -> tuple[int, Union[Article, bool, list]]:
+        # the ID is given to the article only when it is saved
+        parser = HTMLParser(full_url=full_url, article_id=0, config=configuration)
+        try:
+            return position, await parser.parse_async(semaphore)
+        except Exception:  # pylint: disable=broad-except
+            configuration.get_metrics().add('articles_failed')
+            return position, False
+
+    for parsing in asyncio.as_completed([parse_at(position, full_url)
+                                         for position, full_url in enumerate(crawler.urls)]):
+        position, article = await parsing
+        writer.add(position, article_to_fields(article) if isinstance(article, Article) else {})
+    save_aliases(configuration)
+
+def main3() -> None:
+    """
+    Entrypoint for scrapper module
+    """
+    configuration = Config(path_to_config=CRAWLER_CONFIG_PATH)
+    prepare_environment(ASSETS_PATH, configuration.get_incremental())
+    index = ArticleIndex(ASSETS_PATH, configuration.get_duplicate_index())
+    asyncio.run(crawl_async(configuration, index))
+    report_run(configuration)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,143 @@
+"""
+Lookup and saving of articles stored on disk
+"""
+import json
+import threading
+from pathlib import Path
+from typing import Optional
+
+from core_utils.article.article import (Article, date_from_meta,
+                                        get_article_id_from_filepath)
+from core_utils.article.io import to_meta, to_raw
+from lab_5_scrapper.dedup import DuplicateIndex
+from lab_5_scrapper.metrics import Metrics
+
+
+class ArticleIndex:
+    """
+    Mapping of URLs of already saved articles to their IDs
+    """
+
+    def __init__(self, path: Path, duplicates: Optional[DuplicateIndex] = None) -> None:
+        """
+        Initializes an instance of the ArticleIndex class
+        from meta files found in the folder, URLs of skipped duplicates
+        lead to their originals, texts of saved articles are added
+        to the index of duplicates if there is one
+        """
+        self._ids = {}
+        for meta_path in path.glob('*_meta.json'):
+            with open(meta_path, 'r', encoding='utf-8') as meta_file:
+                meta = json.load(meta_file)
+            article_id = get_article_id_from_filepath(meta_path)
+            for url in (meta.get('url'), *meta.get('aliases', [])):
+                self._ids[url] = article_id
+            raw_path = meta_path.with_name(f'{article_id}_raw.txt')
+            if duplicates is not None and raw_path.exists():
+                article = Article(meta.get('url'), article_id)
+                article.text = raw_path.read_text(encoding='utf-8')
+                duplicates.add_saved(article)
+
+    def __contains__(self, url: object) -> bool:
+        """
+        Checks whether the article with this URL is already saved
+        """
+        return url in self._ids
+
+    def __len__(self) -> int:
+        """
+        Retrieve number of saved articles
+        """
+        return len(set(self._ids.values()))
+
+    def get_id(self, url: str) -> Optional[int]:
+        """
+        Retrieve ID of the saved article with this URL
+        """
+        return self._ids.get(url)
+
+    def get_next_id(self) -> int:
+        """
+        Retrieve the first ID following all saved articles
+        """
+        return max(self._ids.values(), default=0) + 1
+
+
+def article_to_fields(article: Article) -> dict:
+    """
+    Retrieve fields of a parsed article, which can be passed between processes
+    """
+    return {**article.get_meta(), 'text': article.text}
+
+
+def article_from_fields(fields: dict, article_id: int) -> Article:
+    """
+    Restores an article with the given ID from fields of a parsed article
+    """
+    article = Article(fields['url'], article_id)
+    article.title = fields['title']
+    article.date = date_from_meta(fields['date']) if fields['date'] else None
+    article.author = fields['author']
+    article.topics = fields['topics']
+    article.text = fields['text']
+    return article
+
+
+def save_article(article: Article, metrics: Metrics,
+                 duplicates: Optional[DuplicateIndex] = None) -> bool:
+    """
+    Saves text and meta information of the article, timing both writes,
+    unless it is a near-duplicate of an article saved before,
+    and tells whether the article was saved
+    """
+    if duplicates is not None:
+        with metrics.timer('deduplicate'):
+            original_id = duplicates.find_original(article)
+        if original_id is not None:
+            metrics.add('duplicates_skipped')
+            return False
+    with metrics.timer('to_raw'):
+        to_raw(article)
+    with metrics.timer('to_meta'):
+        to_meta(article)
+    metrics.add('articles_saved')
+    return True
+
+
+class OrderedArticleWriter:
+    """
+    Saves articles parsed in any order strictly in the order they were found,
+    giving IDs only to the saved ones
+    """
+
+    def __init__(self, first_id: int, metrics: Optional[Metrics] = None,
+                 duplicates: Optional[DuplicateIndex] = None) -> None:
+        """
+        Initializes an instance of the OrderedArticleWriter class
+        """
+        self._next_id = first_id
+        self._next_position = 0
+        self._metrics = metrics or Metrics()
+        self._duplicates = duplicates
+        self._pending: dict[int, dict] = {}
+        self._lock = threading.Lock()
+
+    def add(self, position: int, fields: dict) -> None:
+        """
+        Saves the article found at this position and all following ones that are ready,
+        empty fields mean the article is skipped
+        """
+        with self._lock:
+            self._pending[position] = fields
+            while self._next_position in self._pending:
+                ready_fields = self._pending.pop(self._next_position)
+                if ready_fields and save_article(article_from_fields(ready_fields, self._next_id),
+                                                 self._metrics, self._duplicates):
+                    self._next_id += 1
+                self._next_position += 1
+
+    def get_waiting(self) -> int:
+        """
+        Retrieve number of parsed articles waiting for preceding ones
+        """
+        return len(self._pending)
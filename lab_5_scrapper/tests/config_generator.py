@@ -16,7 +16,8 @@ def generate_config(seed_urls: list,
                     timeout: int,
                     should_verify_certificate: bool,
                     headless_mode: bool,
-                    path: Path = TEST_CRAWLER_CONFIG_PATH):
+                    path: Path = TEST_CRAWLER_CONFIG_PATH,
+                    **optional_params):
     """
     Generates scrapper_config.py for testing
     """
@@ -26,7 +27,8 @@ def generate_config(seed_urls: list,
               'encoding': encoding,
               'timeout': timeout,
               'should_verify_certificate': should_verify_certificate,
-              'headless_mode': headless_mode}
+              'headless_mode': headless_mode,
+              **optional_params}
 
     if path.exists():
         shutil.rmtree(TEST_PATH)
@@ -0,0 +1,204 @@
+"""
+Local stand-in for the news website to test the scrapper offline
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qs, urlsplit
+
+from config.test_params import TEST_CRAWLER_CONFIG_PATH
+from core_utils.constants import CRAWLER_CONFIG_PATH
+from lab_5_scrapper.scrapper import Config
+from lab_5_scrapper.tests.config_generator import generate_config
+
+LISTING_PATH = '/volga/news'
+
+ARTICLE_TEMPLATE = """<html><body>
+<div itemprop="headline"><h1>Article {article_id}</h1></div>
+<span itemprop="author"><meta itemprop="name" content="Author {article_id}"></span>
+<ul itemprop="keywords"><li>topic</li><li>news</li></ul>
+<meta itemprop="datePublished" content="2023-04-01T10:00:00+03:00">
+<div itemprop="articleBody"><p>First paragraph of article {article_id}.</p>
+<p>Second paragraph of article {article_id}.</p></div>
+{related}<a href="/about">About</a>
+</body></html>"""
+
+
+# pylint: disable=too-many-instance-attributes
+class LocalNewsServer:
+    """
+    Serves a listing page and a fixed number of article pages
+    """
+
+    def __init__(self, num_articles: int, delay: float = 0.0,
+                 listing_size: Optional[int] = None) -> None:
+        """
+        Initializes the server on a free local port
+        """
+        self.num_articles = num_articles
+        self.delay = delay
+        self.listing_size = listing_size
+        self.requests = []
+        self.statuses = []
+        self.page_version = 1
+        self.failures: dict[str, list[tuple[int, Optional[str]]]] = {}
+        self.files: dict[str, tuple[dict[str, str], bytes]] = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._make_handler())
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """
+        Root URL of the server
+        """
+        return f'http://127.0.0.1:{self._server.server_port}'
+
+    @property
+    def seed_url(self) -> str:
+        """
+        URL of the listing page
+        """
+        return f'{self.base_url}{LISTING_PATH}'
+
+    def article_url(self, article_id: int) -> str:
+        """
+        URL of the article page with the given number
+        """
+        return f'{self.seed_url}/article-{article_id}'
+
+    def render(self, url: str) -> Optional[str]:
+        """
+        Returns the page for the given path with query or None if there is no such page
+        """
+        parts = urlsplit(url)
+        path, query = parts.path, parse_qs(parts.query)
+        if path == LISTING_PATH:
+            listing_size = min(self.listing_size or self.num_articles, self.num_articles)
+            page_size = int(query.get('per-page', [listing_size])[0])
+            first = (int(query.get('page', ['1'])[0]) - 1) * page_size + 1
+            links = [f'<a class="d-block mb-0" href="{self.article_url(i)}">Article {i}</a>'
+                     for i in range(first, min(first + page_size - 1, listing_size) + 1)]
+            return '<html><body>' + '\n'.join(links) + '</body></html>'
+        prefix = f'{LISTING_PATH}/article-'
+        if path.startswith(prefix) and path[len(prefix):].isdigit():
+            article_id = int(path[len(prefix):])
+            if 1 <= article_id <= self.num_articles:
+                related = f'<a href="{self.article_url(article_id + 1)}">Next</a>\n' \
+                    if article_id < self.num_articles else ''
+                return ARTICLE_TEMPLATE.format(article_id=article_id, related=related)
+        return None
+
+    def _make_handler(self) -> type:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            """
+            Request handler bound to the server instance
+            """
+
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self) -> None:  # pylint: disable=invalid-name
+                """
+                Serves a page, tracking the number of concurrent requests
+                """
+                with server.lock:
+                    server.requests.append(self.path)
+                    server.in_flight += 1
+                    server.max_in_flight = max(server.max_in_flight, server.in_flight)
+                try:
+                    time.sleep(server.delay)
+                    with server.lock:
+                        queued_failures = server.failures.get(self.path)
+                        failure = queued_failures.pop(0) if queued_failures else None
+                    if not failure and self.path in server.files:
+                        self.send_file(*server.files[self.path])
+                        return
+                    page = server.render(self.path)
+                    etag = f'"{server.page_version}"'
+                    if failure:
+                        status, body = failure[0], b'Temporarily unavailable'
+                    elif page is not None and self.headers.get('If-None-Match') == etag:
+                        status, body = 304, b''
+                    else:
+                        status = 200 if page is not None else 404
+                        body = (page or 'Not found').encode('utf-8')
+                    server.statuses.append(status)
+                    self.send_response(status)
+                    self.send_header('Content-Type', 'text/html; charset=utf-8')
+                    self.send_header('ETag', etag)
+                    if failure and failure[1]:
+                        self.send_header('Retry-After', failure[1])
+                    self.send_header('Content-Length', str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                finally:
+                    with server.lock:
+                        server.in_flight -= 1
+
+            def send_file(self, headers: dict[str, str], body: bytes) -> None:
+                """
+                Serves a file with the given headers, closing the connection
+                to mark the end of the body if its length is not sent
+                """
+                server.statuses.append(200)
+                self.send_response(200)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                if 'Content-Length' not in headers:
+                    self.send_header('Connection', 'close')
+                    self.close_connection = True  # pylint: disable=attribute-defined-outside-init
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args: object) -> None:
+                """
+                Keeps test output clean
+                """
+
+        return Handler
+
+    def start(self) -> 'LocalNewsServer':
+        """
+        Starts serving requests in a background thread
+        """
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """
+        Stops the server and releases the port
+        """
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> 'LocalNewsServer':
+        return self.start()
+
+    def __exit__(self, *args: object) -> None:
+        self.stop()
+
+
+def make_local_config(server: LocalNewsServer, **optional_params: object) -> Config:
+    """
+    Generates a test config targeting the local server
+    without request delays and robots.txt lookups
+    """
+    with CRAWLER_CONFIG_PATH.open(encoding='utf-8') as file:
+        reference = json.load(file)
+    generate_config(seed_urls=[server.seed_url],
+                    num_articles=server.num_articles,
+                    headers=reference['headers'],
+                    encoding=reference['encoding'],
+                    timeout=reference['timeout'],
+                    should_verify_certificate=True,
+                    headless_mode=True,
+                    **{'requests_per_second': 1000, 'burst': 8, 'respect_robots': False,
+                       **optional_params})
+    return Config(TEST_CRAWLER_CONFIG_PATH)
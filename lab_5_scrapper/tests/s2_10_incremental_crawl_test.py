@@ -0,0 +1,84 @@
+"""
+Incremental crawling validation
+"""
+import asyncio
+import json
+import shutil
+import unittest
+from unittest import mock
+
+import pytest
+
+from config.test_params import TEST_PATH
+from lab_5_scrapper.scrapper import (ArticleIndex, Crawler, IncorrectIncrementalModeError,
+                                     crawl_async, prepare_environment)
+from lab_5_scrapper.tests.local_server import LocalNewsServer, make_local_config
+
+
+class IncrementalCrawlTest(unittest.TestCase):
+    """
+    Class for testing crawling that keeps articles from previous runs
+    """
+
+    def setUp(self) -> None:
+        self.server = LocalNewsServer(num_articles=5).start()
+        self.config = make_local_config(self.server, incremental=True)
+        self.assets_path = TEST_PATH / 'articles'
+        self.assets_path.mkdir()
+        self.assets = mock.patch('core_utils.article.article.ASSETS_PATH', self.assets_path)
+        self.assets.start()
+
+    def _run(self) -> None:
+        prepare_environment(self.assets_path, self.config.get_incremental())
+        asyncio.run(crawl_async(self.config, ArticleIndex(self.assets_path)))
+
+    @pytest.mark.stage_2_10_incremental_crawl_check
+    @pytest.mark.lab_5_scrapper
+    def test_only_new_articles_are_downloaded(self):
+        """
+        Ensure a repeated run fetches only new URLs and appends them with next free IDs
+        """
+        self.server.num_articles = 3
+        self._run()
+        self.server.num_articles = 5
+        self.server.requests.clear()
+        self._run()
+
+        article_requests = [path for path in self.server.requests if 'article-' in path]
+        self.assertEqual(['/volga/news/article-4', '/volga/news/article-5'],
+                         sorted(article_requests))
+        index = ArticleIndex(self.assets_path)
+        self.assertEqual(5, len(index))
+        for article_id in range(1, 6):
+            self.assertEqual(article_id, index.get_id(self.server.article_url(article_id)))
+            with open(self.assets_path / f'{article_id}_meta.json', encoding='utf-8') as file:
+                self.assertEqual(article_id, json.load(file)['id'])
+
+    @pytest.mark.stage_2_10_incremental_crawl_check
+    @pytest.mark.lab_5_scrapper
+    def test_crawler_skips_saved_urls(self):
+        """
+        Ensure crawler does not collect URLs of saved articles
+        """
+        self.server.num_articles = 2
+        self._run()
+        crawler = Crawler(self.config, ArticleIndex(self.assets_path))
+        self.server.num_articles = 5
+        crawler.find_articles()
+        self.assertEqual([self.server.article_url(i) for i in range(3, 6)], crawler.urls)
+
+    @pytest.mark.stage_2_10_incremental_crawl_check
+    @pytest.mark.lab_5_scrapper
+    def test_incorrect_incremental_mode(self):
+        """
+        Ensure incremental mode value is validated
+        """
+        for incorrect_value in ('true', 1, None):
+            with self.assertRaises(IncorrectIncrementalModeError):
+                make_local_config(self.server, incremental=incorrect_value)
+
+    def tearDown(self) -> None:
+        self.assets.stop()
+        self.server.stop()
+        if TEST_PATH.exists():
+            shutil.rmtree(TEST_PATH)
@@ -0,0 +1,171 @@
+# pylint: disable=protected-access
+"""
+Breadth-first recursive crawling validation
+"""
+import json
+import shutil
+import unittest
+
+import pytest
+
+from config.test_params import TEST_PATH
+from core_utils.constants import PROJECT_ROOT
+from lab_5_scrapper.scrapper import IncorrectCrawlLimitsError, RecursiveCrawler
+from lab_5_scrapper.storage import ArticleIndex
+from lab_5_scrapper.tests.local_server import (LocalNewsServer,
+                                               make_local_config)
+from lab_5_scrapper.urls import normalize_url
+
+
+class RecursiveCrawlerTest(unittest.TestCase):
+    """
+    Class for testing the frontier of RecursiveCrawler
+    """
+
+    def setUp(self) -> None:
+        self.server = LocalNewsServer(num_articles=6, listing_size=2).start()
+        self._remove_intermediate_information()
+
+    @staticmethod
+    def _remove_intermediate_information() -> None:
+        for name in ('intermediate_info.json', 'intermediate_info.jsonl'):
+            (PROJECT_ROOT / 'lab_5_scrapper' / name).unlink(missing_ok=True)
+
+    def _expected_urls(self, last_id: int) -> list[str]:
+        return [self.server.article_url(i) for i in range(1, last_id + 1)]
+
+    @pytest.mark.stage_2_11_recursive_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_pages_are_visited_breadth_first(self):
+        """
+        Ensure articles linked from article pages are found without duplicates
+        """
+        crawler = RecursiveCrawler(make_local_config(self.server))
+        crawler.find_articles()
+        self.assertEqual(self._expected_urls(6), crawler.urls)
+        self.assertEqual([f'{self.server.base_url}/about'], crawler.other_urls)
+
+    @pytest.mark.stage_2_11_recursive_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_depth_is_limited(self):
+        """
+        Ensure pages deeper than the limit are not requested
+        """
+        crawler = RecursiveCrawler(make_local_config(self.server, max_crawl_depth=1))
+        crawler.find_articles()
+        self.assertEqual(self._expected_urls(3), crawler.urls)
+        self.assertFalse(crawler.frontier)
+
+    @pytest.mark.stage_2_11_recursive_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_crawling_is_resumed(self):
+        """
+        Ensure a new crawler continues from the saved frontier
+        """
+        config = make_local_config(self.server)
+        config._num_articles = 3
+        RecursiveCrawler(config).find_articles()
+
+        config._num_articles = 6
+        self.server.requests.clear()
+        crawler = RecursiveCrawler(config)
+        crawler.find_articles()
+        self.assertEqual(self._expected_urls(6), crawler.urls)
+        self.assertNotIn('/volga/news', self.server.requests)
+
+    @pytest.mark.stage_2_11_recursive_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_restored_links_are_parsed(self):
+        """
+        Ensure links found before interruption and not saved yet
+        are yielded again by a resumed crawler
+        """
+        config = make_local_config(self.server)
+        config._num_articles = 3
+        RecursiveCrawler(config).find_articles()
+
+        config._num_articles = 6
+        TEST_PATH.mkdir(parents=True, exist_ok=True)
+        (TEST_PATH / '1_meta.json').write_text(
+            json.dumps({'id': 1, 'url': self.server.article_url(1)}), encoding='utf-8')
+        crawler = RecursiveCrawler(config, index=ArticleIndex(TEST_PATH))
+        self.assertEqual(self._expected_urls(6)[1:], list(crawler.iter_urls()))
+
+    @pytest.mark.stage_2_11_recursive_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_state_is_journaled(self):
+        """
+        Ensure discovered links are appended to the journal instead of rewriting the state
+        """
+        config = make_local_config(self.server)
+        config._num_articles = 4
+        crawler = RecursiveCrawler(config)
+        crawler.find_articles()
+        self.assertFalse(crawler.path_to_info.read_text(encoding='utf-8'))
+        records = crawler.path_to_journal.read_text(encoding='utf-8').splitlines()
+        self.assertEqual(4, sum('"url"' in record for record in records))
+
+        restored = RecursiveCrawler(config)
+        self.assertEqual(crawler.urls, restored.urls)
+        self.assertEqual(crawler.other_urls, restored.other_urls)
+        self.assertEqual(crawler.frontier, restored.frontier)
+
+    @pytest.mark.stage_2_11_recursive_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_journal_is_compacted(self):
+        """
+        Ensure the journal is folded into the json file periodically
+        """
+        config = make_local_config(self.server)
+        crawler = RecursiveCrawler(config)
+        crawler.compaction_interval = 4
+        crawler.find_articles()
+        self.assertTrue(crawler.path_to_info.read_text(encoding='utf-8'))
+        records = crawler.path_to_journal.read_text(encoding='utf-8').splitlines()
+        self.assertLessEqual(len(records), 4)
+
+        restored = RecursiveCrawler(config)
+        self.assertEqual(crawler.urls, restored.urls)
+        self.assertEqual(crawler.frontier, restored.frontier)
+
+    @pytest.mark.stage_2_11_recursive_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_cut_journal_record_is_ignored(self):
+        """
+        Ensure a record partially written before interruption does not break loading
+        """
+        config = make_local_config(self.server)
+        config._num_articles = 2
+        crawler = RecursiveCrawler(config)
+        crawler.find_articles()
+        with open(crawler.path_to_journal, 'a', encoding='utf-8') as journal:
+            journal.write('{"url": "http://exa')
+        self.assertEqual(crawler.urls, RecursiveCrawler(config).urls)
+
+    @pytest.mark.stage_2_11_recursive_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_normalize_url(self):
+        """
+        Ensure URLs differing only in form are brought to the same one
+        """
+        self.assertEqual('https://example.com/news',
+                         normalize_url('HTTPS://Example.com:443/news/#comments'))
+        self.assertEqual('http://example.com/?page=2',
+                         normalize_url('http://example.com?page=2'))
+
+    @pytest.mark.stage_2_11_recursive_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_incorrect_crawl_limits(self):
+        """
+        Ensure crawl limits are validated
+        """
+        for incorrect_params in ({'max_crawl_depth': 0}, {'max_links_per_page': '10'},
+                                 {'normalize_urls': 'no'}):
+            with self.assertRaises(IncorrectCrawlLimitsError):
+                make_local_config(self.server, **incorrect_params)
+
+    def tearDown(self) -> None:
+        self._remove_intermediate_information()
+        self.server.stop()
+        if TEST_PATH.exists():
+            shutil.rmtree(TEST_PATH)
@@ -0,0 +1,118 @@
+"""
+Streaming crawl, parse and persist pipeline validation
+"""
+import asyncio
+import json
+import shutil
+import unittest
+from functools import partial
+from typing import Iterator
+from unittest import mock
+
+import pytest
+
+from config.test_params import TEST_PATH
+from lab_5_scrapper.scrapper import Crawler, crawl_async, stream_articles
+from lab_5_scrapper.tests.local_server import (LISTING_PATH, LocalNewsServer,
+                                               make_local_config)
+
+
+class ObservedCrawler(Crawler):
+    """
+    Crawler recording how many articles are saved when each link is yielded
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.saved_on_yield = []
+
+    def iter_urls(self) -> Iterator[str]:
+        for url in super().iter_urls():
+            self.saved_on_yield.append(len(list(TEST_PATH.glob('*_meta.json'))))
+            yield url
+
+
+class StreamingPipelineTest(unittest.TestCase):
+    """
+    Class for testing streaming of found links to parser workers
+    """
+
+    def setUp(self) -> None:
+        self.server = LocalNewsServer(num_articles=10, delay=0.05).start()
+        self.assets = mock.patch('core_utils.article.article.ASSETS_PATH', TEST_PATH)
+        self.assets.start()
+
+    @pytest.mark.stage_2_12_streaming_pipeline_check
+    @pytest.mark.lab_5_scrapper
+    def test_articles_are_saved_in_discovery_order(self):
+        """
+        Ensure every found article is saved under the ID of its position
+        """
+        config = make_local_config(self.server, max_in_flight=3)
+        stream_articles(Crawler(config), config)
+        for article_id in range(1, 11):
+            with open(TEST_PATH / f'{article_id}_meta.json', encoding='utf-8') as file:
+                self.assertEqual(self.server.article_url(article_id), json.load(file)['url'])
+
+    @pytest.mark.stage_2_12_streaming_pipeline_check
+    @pytest.mark.lab_5_scrapper
+    def test_failed_pages_leave_no_gaps(self):
+        """
+        Ensure an article which could not be downloaded takes no ID
+        """
+        for parse_processes in (0, 2):
+            shutil.rmtree(TEST_PATH, ignore_errors=True)
+            TEST_PATH.mkdir(parents=True)
+            self.server.failures[f'{LISTING_PATH}/article-4'] = [(503, None)]
+            config = make_local_config(self.server, max_in_flight=3, max_retries=0,
+                                       parse_processes=parse_processes)
+            stream_articles(Crawler(config), config)
+            urls = []
+            for article_id in range(1, 10):
+                with open(TEST_PATH / f'{article_id}_meta.json', encoding='utf-8') as file:
+                    urls.append(json.load(file)['url'])
+            self.assertEqual([self.server.article_url(i) for i in range(1, 11) if i != 4], urls)
+            self.assertFalse((TEST_PATH / '10_meta.json').exists())
+
+    @pytest.mark.stage_2_12_streaming_pipeline_check
+    @pytest.mark.lab_5_scrapper
+    def test_unparsable_pages_are_counted_and_skipped(self):
+        """
+        Ensure a page which cannot be parsed does not stop saving the other articles
+        """
+        page = b'<html><body>Not an article</body></html>'
+        self.server.files[f'{LISTING_PATH}/article-4'] = (
+            {'Content-Type': 'text/html; charset=utf-8', 'Content-Length': str(len(page))},
+            page)
+        runs = [partial(stream_articles, Crawler(config), config)
+                for config in (make_local_config(self.server, max_in_flight=3),
+                               make_local_config(self.server, parse_processes=2))]
+        config = make_local_config(self.server)
+        runs.append(partial(asyncio.run, crawl_async(config)))
+        for run in runs:
+            shutil.rmtree(TEST_PATH, ignore_errors=True)
+            TEST_PATH.mkdir(parents=True)
+            run()
+            self.assertEqual(9, len(list(TEST_PATH.glob('*_meta.json'))))
+        self.assertEqual(1, config.get_metrics().get_summary()['counters']['articles_failed'])
+
+    @pytest.mark.stage_2_12_streaming_pipeline_check
+    @pytest.mark.lab_5_scrapper
+    def test_crawler_waits_for_workers(self):
+        """
+        Ensure articles are saved while links are still being found
+        and the crawler does not run ahead of the workers
+        """
+        config = make_local_config(self.server, max_in_flight=1)
+        crawler = ObservedCrawler(config)
+        stream_articles(crawler, config)
+        self.assertEqual(10, len(crawler.saved_on_yield))
+        for yielded, saved in enumerate(crawler.saved_on_yield):
+            self.assertLessEqual(yielded - saved, 2)
+        self.assertTrue(crawler.saved_on_yield[-1])
+
+    def tearDown(self) -> None:
+        self.assets.stop()
+        self.server.stop()
+        if TEST_PATH.exists():
+            shutil.rmtree(TEST_PATH)
@@ -0,0 +1,67 @@
+"""
+HTML parsing backends validation
+"""
+import shutil
+import unittest
+
+import pytest
+
+from config.test_params import TEST_PATH
+from core_utils.constants import PROJECT_ROOT
+from lab_5_scrapper.scrapper import HTMLParser, IncorrectParserBackendError
+from lab_5_scrapper.tests.local_server import LocalNewsServer, make_local_config
+
+FIXTURE_PAGE = PROJECT_ROOT / 'lab_5_scrapper' / 'tests' / 'test_files' / 'article_page.html'
+
+
+class ParserBackendTest(unittest.TestCase):
+    """
+    Class for testing that backends extract the same article fields
+    """
+
+    def setUp(self) -> None:
+        self.server = LocalNewsServer(num_articles=2).start()
+
+    @pytest.mark.stage_2_13_parser_backend_check
+    @pytest.mark.lab_5_scrapper
+    def test_backends_extract_same_fields_from_saved_page(self):
+        """
+        Ensure XPath extraction gives the same article as BeautifulSoup
+        """
+        page = FIXTURE_PAGE.read_text(encoding='utf-8')
+        articles = [HTMLParser('https://example.com', 1,
+                               make_local_config(self.server, parser_backend=backend))
+                    .parse_html(page)
+                    for backend in ('bs4', 'lxml')]
+        self.assertEqual(articles[0].get_meta(), articles[1].get_meta())
+        self.assertEqual(articles[0].get_raw_text(), articles[1].get_raw_text())
+        self.assertEqual(['Интерфакс-Поволжье'], articles[1].author)
+        self.assertIn('&quot;Стратегия-2035&quot;', articles[1].topics)
+
+    @pytest.mark.stage_2_13_parser_backend_check
+    @pytest.mark.lab_5_scrapper
+    def test_lxml_backend_parses_downloaded_article(self):
+        """
+        Ensure parse() fills the article with the XPath backend
+        """
+        config = make_local_config(self.server, parser_backend='lxml')
+        article = HTMLParser(self.server.article_url(2), 2, config).parse()
+        self.assertEqual('Article 2', article.title)
+        self.assertEqual(['Author 2'], article.author)
+        self.assertTrue(article.text.startswith('First paragraph of article 2.'))
+        self.assertTrue(article.date)
+
+    @pytest.mark.stage_2_13_parser_backend_check
+    @pytest.mark.lab_5_scrapper
+    def test_incorrect_parser_backend(self):
+        """
+        Ensure unknown backends are rejected
+        """
+        for incorrect_value in ('html5lib', 1, None):
+            with self.assertRaises(IncorrectParserBackendError):
+                make_local_config(self.server, parser_backend=incorrect_value)
+
+    def tearDown(self) -> None:
+        self.server.stop()
+        if TEST_PATH.exists():
+            shutil.rmtree(TEST_PATH)
@@ -0,0 +1,86 @@
+"""
+Parsing downloaded pages in separate processes validation
+"""
+import json
+import shutil
+import unittest
+from unittest import mock
+
+import pytest
+
+from config.test_params import TEST_PATH
+from lab_5_scrapper.scrapper import (Crawler, IncorrectParseProcessesError,
+                                     prepare_environment, stream_articles)
+from lab_5_scrapper.storage import OrderedArticleWriter
+from lab_5_scrapper.tests.local_server import (LocalNewsServer,
+                                               make_local_config)
+
+
+class ProcessPoolTest(unittest.TestCase):
+    """
+    Class for testing parsing pages in a pool of processes
+    """
+
+    def setUp(self) -> None:
+        self.server = LocalNewsServer(num_articles=8, delay=0.05).start()
+
+    @pytest.mark.stage_2_14_process_pool_check
+    @pytest.mark.lab_5_scrapper
+    def test_processes_give_same_articles_as_threads(self):
+        """
+        Ensure articles parsed in processes are saved in order
+        and match articles parsed in threads
+        """
+        saved = []
+        for parse_processes in (0, 2):
+            config = make_local_config(self.server, max_in_flight=4,
+                                       parse_processes=parse_processes)
+            prepare_environment(TEST_PATH)
+            with mock.patch('core_utils.article.article.ASSETS_PATH', TEST_PATH):
+                stream_articles(Crawler(config), config)
+            saved.append({path.name: path.read_text(encoding='utf-8')
+                          for path in TEST_PATH.iterdir()})
+
+        self.assertEqual(16, len(saved[1]))
+        self.assertEqual(saved[0], saved[1])
+        for article_id in range(1, 9):
+            meta = json.loads(saved[1][f'{article_id}_meta.json'])
+            self.assertEqual(self.server.article_url(article_id), meta['url'])
+            self.assertEqual(f'Article {article_id}', meta['title'])
+
+    @pytest.mark.stage_2_14_process_pool_check
+    @pytest.mark.lab_5_scrapper
+    def test_writer_saves_in_order_of_ids(self):
+        """
+        Ensure articles are written only after all preceding ones
+        and skipped articles take no IDs
+        """
+        fields = {'title': 'Title', 'date': '2023-04-01 10:00:00', 'author': ['Author'],
+                  'topics': [], 'text': 'Text', 'pos_frequencies': {}}
+        written = []
+        writer = OrderedArticleWriter(first_id=1)
+        with mock.patch('lab_5_scrapper.storage.to_raw',
+                        lambda article: written.append((article.article_id, article.url))), \
+                mock.patch('lab_5_scrapper.storage.to_meta'):
+            writer.add(2, {**fields, 'url': 'https://example.com/3'})
+            writer.add(1, {})
+            self.assertEqual([], written)
+            self.assertEqual(2, writer.get_waiting())
+            writer.add(0, {**fields, 'url': 'https://example.com/1'})
+        self.assertEqual([(1, 'https://example.com/1'), (2, 'https://example.com/3')], written)
+        self.assertEqual(0, writer.get_waiting())
+
+    @pytest.mark.stage_2_14_process_pool_check
+    @pytest.mark.lab_5_scrapper
+    def test_incorrect_parse_processes(self):
+        """
+        Ensure the number of parsing processes is validated
+        """
+        for incorrect_value in (-1, 'two', True, 1000):
+            with self.assertRaises(IncorrectParseProcessesError):
+                make_local_config(self.server, parse_processes=incorrect_value)
+
+    def tearDown(self) -> None:
+        self.server.stop()
+        if TEST_PATH.exists():
+            shutil.rmtree(TEST_PATH)
@@ -0,0 +1,144 @@
+"""
+Retries and circuit breaker validation
+"""
+import shutil
+import time
+import unittest
+from unittest import mock
+
+import pytest
+
+from config.test_params import TEST_PATH
+from lab_5_scrapper.fetching import CircuitBreaker, RetryPolicy
+from lab_5_scrapper.scrapper import (Crawler, HTMLParser,
+                                     IncorrectRetrySettingsError, make_request)
+from lab_5_scrapper.tests.local_server import (LISTING_PATH, LocalNewsServer,
+                                               make_local_config)
+
+
+class RetryTest(unittest.TestCase):
+    """
+    Class for testing repeating of failed requests
+    """
+
+    def setUp(self) -> None:
+        self.server = LocalNewsServer(num_articles=3).start()
+
+    @pytest.mark.stage_2_15_retry_check
+    @pytest.mark.lab_5_scrapper
+    def test_transient_errors_are_retried(self):
+        """
+        Ensure 429 and 503 responses are repeated until the page is served
+        """
+        config = make_local_config(self.server, backoff_factor=0.01)
+        self.server.failures[f'{LISTING_PATH}/article-1'] = [(503, None), (429, None)]
+        article = HTMLParser(self.server.article_url(1), 1, config).parse()
+        self.assertEqual('Article 1', article.title)
+        self.assertEqual([503, 429, 200], self.server.statuses)
+        self.assertEqual(2, config.get_request_stats()['retries'])
+
+    @pytest.mark.stage_2_15_retry_check
+    @pytest.mark.lab_5_scrapper
+    def test_retry_after_is_honoured(self):
+        """
+        Ensure the delay requested by the server is waited before retrying
+        """
+        config = make_local_config(self.server, backoff_factor=0.0)
+        self.server.failures[f'{LISTING_PATH}?per-page=3'] = [(503, '1')]
+        start = time.monotonic()
+        crawler = Crawler(config)
+        crawler.find_articles()
+        self.assertGreaterEqual(time.monotonic() - start, 1.0)
+        self.assertEqual([self.server.article_url(i) for i in range(1, 4)], crawler.urls)
+
+    @pytest.mark.stage_2_15_retry_check
+    @pytest.mark.lab_5_scrapper
+    def test_failed_page_is_not_parsed(self):
+        """
+        Ensure an error page left after all retries is not taken for an article
+        """
+        config = make_local_config(self.server, max_retries=1, backoff_factor=0.0)
+        self.server.failures[f'{LISTING_PATH}/article-2'] = [(500, None)] * 2
+        self.assertFalse(HTMLParser(self.server.article_url(2), 2, config).parse())
+        self.assertEqual(1, config.get_request_stats()['retries_exhausted'])
+
+    @pytest.mark.stage_2_15_retry_check
+    @pytest.mark.lab_5_scrapper
+    def test_client_errors_are_not_retried(self):
+        """
+        Ensure pages that do not exist are requested once
+        """
+        config = make_local_config(self.server, backoff_factor=0.0)
+        self.assertEqual(404, make_request(f'{self.server.base_url}/missing', config).status_code)
+        self.assertEqual(1, len(self.server.requests))
+
+    @pytest.mark.stage_2_15_retry_check
+    @pytest.mark.lab_5_scrapper
+    def test_incorrect_retry_settings(self):
+        """
+        Ensure retry and circuit breaker parameters are validated
+        """
+        for incorrect_params in ({'max_retries': -1}, {'max_retries': 100},
+                                 {'max_retries': True}, {'backoff_factor': '1'},
+                                 {'max_backoff': -1}, {'circuit_breaker_threshold': 0},
+                                 {'circuit_breaker_cooldown': None}):
+            with self.assertRaises(IncorrectRetrySettingsError):
+                make_local_config(self.server, **incorrect_params)
+
+    def tearDown(self) -> None:
+        self.server.stop()
+        if TEST_PATH.exists():
+            shutil.rmtree(TEST_PATH)
+
+
+class RetryPolicyTest(unittest.TestCase):
+    """
+    Class for testing backoff delays
+    """
+
+    @pytest.mark.stage_2_15_retry_check
+    @pytest.mark.lab_5_scrapper
+    def test_backoff_grows_exponentially_with_jitter(self):
+        """
+        Ensure delays stay within the growing exponential bound and the cap
+        """
+        policy = RetryPolicy(max_retries=10, backoff_factor=0.5, max_backoff=3.0)
+        with mock.patch('random.uniform', lambda low, high: high):
+            self.assertEqual([0.5, 1.0, 2.0, 3.0, 3.0],
+                             [policy.get_delay(attempt, None) for attempt in range(5)])
+        for attempt in range(5):
+            self.assertLessEqual(policy.get_delay(attempt, None), 3.0)
+
+    @pytest.mark.stage_2_15_retry_check
+    @pytest.mark.lab_5_scrapper
+    def test_retry_after_as_date(self):
+        """
+        Ensure Retry-After given as an HTTP date is converted to seconds
+        """
+        response = mock.Mock(headers={'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT'})
+        policy = RetryPolicy(max_retries=1, backoff_factor=5.0, max_backoff=10.0)
+        self.assertEqual(0.0, policy.get_delay(0, response))
+
+
+class CircuitBreakerTest(unittest.TestCase):
+    """
+    Class for testing pausing of failing hosts
+    """
+
+    @pytest.mark.stage_2_15_retry_check
+    @pytest.mark.lab_5_scrapper
+    def test_host_is_paused_after_failures_in_a_row(self):
+        """
+        Ensure only the failing host waits and it is opened again after one more failure
+        """
+        breaker = CircuitBreaker(threshold=2, cooldown=0.2)
+        breaker.record('https://example.com/a', success=False)
+        breaker.record('https://example.com/b', success=True)
+        breaker.record('https://example.com/c', success=False)
+        self.assertEqual(0.0, breaker.wait('https://example.com/d'))
+        breaker.record('https://example.com/e', success=False)
+        self.assertEqual(0.0, breaker.wait('https://example.org/a'))
+        self.assertGreater(breaker.wait('https://example.com/f'), 0.1)
+        breaker.record('https://example.com/g', success=False)
+        self.assertGreater(breaker.wait('https://example.com/h'), 0.1)
+        self.assertEqual(2, breaker.get_stats()['circuit_breaker_trips'])
@@ -0,0 +1,86 @@
+"""
+Streaming download limits validation
+"""
+import shutil
+import unittest
+
+import pytest
+
+from config.test_params import TEST_PATH
+from lab_5_scrapper.scrapper import (HTMLParser, IncorrectDownloadLimitsError,
+                                     make_request)
+from lab_5_scrapper.tests.local_server import (LocalNewsServer,
+                                               make_local_config)
+
+
+class DownloadLimitsTest(unittest.TestCase):
+    """
+    Class for testing aborting of large and non-HTML downloads
+    """
+
+    def setUp(self) -> None:
+        self.server = LocalNewsServer(num_articles=2).start()
+        self.config = make_local_config(self.server, max_body_kilobytes=64)
+
+    @pytest.mark.stage_2_16_download_limits_check
+    @pytest.mark.lab_5_scrapper
+    def test_html_page_within_limit_is_downloaded(self):
+        """
+        Ensure usual pages are downloaded and parsed completely
+        """
+        article = HTMLParser(self.server.article_url(1), 1, self.config).parse()
+        self.assertEqual('Article 1', article.title)
+        self.assertEqual(0, self.config.get_request_stats()['downloads_aborted'])
+
+    @pytest.mark.stage_2_16_download_limits_check
+    @pytest.mark.lab_5_scrapper
+    def test_large_body_is_aborted(self):
+        """
+        Ensure a body over the limit is rejected by its declared
+        or its actual length
+        """
+        body = b'<html>' + b'a' * 100 * 1024 + b'</html>'
+        self.server.files['/declared'] = ({'Content-Type': 'text/html',
+                                           'Content-Length': str(len(body))}, body)
+        self.server.files['/undeclared'] = ({'Content-Type': 'text/html'}, body)
+        for path in ('/declared', '/undeclared'):
+            response = make_request(f'{self.server.base_url}{path}', self.config)
+            self.assertEqual(413, response.status_code)
+            self.assertEqual('', response.text)
+        self.assertEqual(2, self.config.get_request_stats()['downloads_aborted'])
+
+    @pytest.mark.stage_2_16_download_limits_check
+    @pytest.mark.lab_5_scrapper
+    def test_non_html_is_aborted(self):
+        """
+        Ensure bodies of types out of the whitelist and untyped bodies
+        that are not markup are not downloaded
+        """
+        self.server.files['/file.pdf'] = ({'Content-Type': 'application/pdf',
+                                           'Content-Length': '8'}, b'%PDF-1.4')
+        self.server.files['/untyped'] = ({}, b'\x00\x01binary')
+        self.server.files['/untyped.html'] = ({}, '  <html>Привет</html>'.encode('utf-8'))
+        self.assertEqual(415, make_request(f'{self.server.base_url}/file.pdf',
+                                           self.config).status_code)
+        self.assertEqual(415, make_request(f'{self.server.base_url}/untyped',
+                                           self.config).status_code)
+        response = make_request(f'{self.server.base_url}/untyped.html', self.config)
+        self.assertEqual(200, response.status_code)
+        self.assertEqual('  <html>Привет</html>', response.text)
+
+    @pytest.mark.stage_2_16_download_limits_check
+    @pytest.mark.lab_5_scrapper
+    def test_incorrect_download_limits(self):
+        """
+        Ensure body size limit and content types are validated
+        """
+        for incorrect_params in ({'max_body_kilobytes': 0}, {'max_body_kilobytes': 1.5},
+                                 {'content_types': 'text/html'}, {'content_types': []},
+                                 {'content_types': ['html']}):
+            with self.assertRaises(IncorrectDownloadLimitsError):
+                make_local_config(self.server, **incorrect_params)
+
+    def tearDown(self) -> None:
+        self.server.stop()
+        if TEST_PATH.exists():
+            shutil.rmtree(TEST_PATH)
@@ -0,0 +1,96 @@
+"""
+Crawl metrics and stage timings validation
+"""
+import json
+import shutil
+import unittest
+from unittest import mock
+
+import pytest
+
+from config.test_params import TEST_PATH
+from lab_5_scrapper.metrics import Metrics, get_percentile
+from lab_5_scrapper.scrapper import (Crawler, prepare_environment, report_run,
+                                     stream_articles)
+from lab_5_scrapper.tests.local_server import (LocalNewsServer,
+                                               make_local_config)
+
+
+class MetricsTest(unittest.TestCase):
+    """
+    Class for testing timers and counters
+    """
+
+    @pytest.mark.stage_2_17_metrics_check
+    @pytest.mark.lab_5_scrapper
+    def test_percentiles_use_nearest_rank(self):
+        """
+        Ensure percentiles are taken from measured values
+        """
+        values = [float(value) for value in range(1, 101)]
+        self.assertEqual(50.0, get_percentile(values, 50))
+        self.assertEqual(90.0, get_percentile(values, 90))
+        self.assertEqual(100.0, get_percentile(values, 100))
+        self.assertEqual(7.0, get_percentile([7.0], 99))
+
+    @pytest.mark.stage_2_17_metrics_check
+    @pytest.mark.lab_5_scrapper
+    def test_summary_has_stages_counters_and_throughput(self):
+        """
+        Ensure timed blocks and counters are summarized
+        """
+        metrics = Metrics()
+        for seconds in (0.001, 0.002, 0.003):
+            metrics.record('download', seconds)
+        with metrics.timer('parse'):
+            pass
+        metrics.add('articles_saved', 2)
+        metrics.add('bytes_downloaded', 1000)
+        summary = metrics.get_summary()
+        self.assertEqual(3, summary['stages']['download']['count'])
+        self.assertEqual(2.0, summary['stages']['download']['p50_ms'])
+        self.assertEqual(3.0, summary['stages']['download']['max_ms'])
+        self.assertEqual(1, summary['stages']['parse']['count'])
+        self.assertEqual({'articles_saved': 2, 'bytes_downloaded': 1000}, summary['counters'])
+        self.assertGreater(summary['throughput']['articles_per_second'], 0)
+        self.assertGreater(summary['throughput']['bytes_per_second'], 0)
+
+
+class RunMetricsTest(unittest.TestCase):
+    """
+    Class for testing metrics collected during a crawl
+    """
+
+    def setUp(self) -> None:
+        self.server = LocalNewsServer(num_articles=4).start()
+
+    @pytest.mark.stage_2_17_metrics_check
+    @pytest.mark.lab_5_scrapper
+    def test_run_summary_covers_all_stages(self):
+        """
+        Ensure a crawl records each stage and saves a JSON summary
+        """
+        config = make_local_config(self.server)
+        prepare_environment(TEST_PATH / 'articles')
+        with mock.patch('core_utils.article.article.ASSETS_PATH', TEST_PATH / 'articles'), \
+                mock.patch('lab_5_scrapper.scrapper.METRICS_PATH', TEST_PATH / 'metrics'):
+            stream_articles(Crawler(config), config)
+            path = report_run(config)
+
+        with open(path, encoding='utf-8') as summary_file:
+            summary = json.load(summary_file)
+        stages = summary['stages']
+        self.assertEqual(5, stages['make_request']['count'])
+        self.assertEqual(5, stages['download']['count'])
+        self.assertEqual(5, stages['rate_limit_wait']['count'])
+        self.assertEqual(1, stages['collect_urls']['count'])
+        for stage in ('parse', 'to_raw', 'to_meta'):
+            self.assertEqual(4, stages[stage]['count'])
+        self.assertEqual(4, summary['counters']['articles_saved'])
+        self.assertGreater(summary['counters']['bytes_downloaded'], 0)
+        self.assertEqual(5, summary['requests']['requests'])
+
+    def tearDown(self) -> None:
+        self.server.stop()
+        if TEST_PATH.exists():
+            shutil.rmtree(TEST_PATH)
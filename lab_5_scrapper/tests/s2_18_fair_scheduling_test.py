@@ -0,0 +1,152 @@
+# pylint: disable=protected-access
+"""
+Fair crawling of several seeds validation
+"""
+import math
+import shutil
+import time
+import unittest
+from collections import deque
+from unittest import mock
+
+import pytest
+
+from config.test_params import TEST_PATH
+from lab_5_scrapper.scrapper import (Crawler, IncorrectMaxInFlightError,
+                                     get_fair_shares, prepare_environment,
+                                     stream_articles)
+from lab_5_scrapper.tests.local_server import (LocalNewsServer,
+                                               make_local_config)
+
+
+class FairSharesTest(unittest.TestCase):
+    """
+    Class for testing splitting of the article budget
+    """
+
+    @pytest.mark.stage_2_18_fair_scheduling_check
+    @pytest.mark.lab_5_scrapper
+    def test_budget_is_split_fairly(self):
+        """
+        Ensure small demands are satisfied and the rest is split equally
+        """
+        self.assertEqual([4, 3, 3], get_fair_shares([float('inf')] * 3, 10))
+        self.assertEqual([2, 4, 4], get_fair_shares([2, float('inf'), 5], 10))
+        self.assertEqual([2, 0, 3], get_fair_shares([2, 0, 3], 10))
+        self.assertEqual([0, 0], get_fair_shares([5, 5], 0))
+
+
+class FairCrawlerTest(unittest.TestCase):
+    """
+    Class for testing crawling of several seeds at the same time
+    """
+
+    def setUp(self) -> None:
+        self.large = LocalNewsServer(num_articles=10, delay=0.5).start()
+        self.small = LocalNewsServer(num_articles=2, delay=0.5).start()
+
+    def _make_config(self, num_articles: int, **optional_params: object):
+        config = make_local_config(self.large, **optional_params)
+        config._seed_urls = [self.large.seed_url, self.small.seed_url]
+        config._num_articles = num_articles
+        return config
+
+    @pytest.mark.stage_2_18_fair_scheduling_check
+    @pytest.mark.lab_5_scrapper
+    def test_seeds_are_requested_concurrently(self):
+        """
+        Ensure crawling takes the time of the slowest seed rather than the sum
+        """
+        crawler = Crawler(self._make_config(num_articles=6))
+        start = time.monotonic()
+        crawler.find_articles()
+        self.assertLess(time.monotonic() - start, 0.9)
+
+    @pytest.mark.stage_2_18_fair_scheduling_check
+    @pytest.mark.lab_5_scrapper
+    def test_first_seed_does_not_starve_others(self):
+        """
+        Ensure the budget left by a small seed goes to the large one
+        and the large seed does not take more than its share before that
+        """
+        crawler = Crawler(self._make_config(num_articles=6))
+        crawler.find_articles()
+        small_urls = [self.small.article_url(i) for i in (1, 2)]
+        self.assertEqual(6, len(crawler.urls))
+        self.assertEqual(small_urls, [url for url in crawler.urls if url in small_urls])
+        self.assertEqual([self.large.article_url(i) for i in range(1, 5)],
+                         [url for url in crawler.urls if url not in small_urls])
+        # which seed answers first depends on timing, the large one is held to its share
+        self.assertLessEqual(crawler.urls.index(small_urls[0]), 3)
+
+    @pytest.mark.stage_2_18_fair_scheduling_check
+    @pytest.mark.lab_5_scrapper
+    def test_pending_links_of_seeds_are_interleaved(self):
+        """
+        Ensure seeds which both have pending links take turns
+        """
+        crawler = Crawler(self._make_config(num_articles=6))
+        pending = [deque(['large-1', 'large-2', 'large-3', 'large-4']),
+                   deque(['small-1', 'small-2'])]
+        admitted = [0, 0]
+        links = list(crawler._admit_fair_share(pending, admitted, [math.inf, 2]))
+        self.assertEqual(['large-1', 'small-1', 'large-2', 'small-2', 'large-3', 'large-4'],
+                         links)
+
+    @pytest.mark.stage_2_18_fair_scheduling_check
+    @pytest.mark.lab_5_scrapper
+    def test_slow_seed_does_not_hold_back_others(self):
+        """
+        Ensure links of a fast seed are admitted before a slow seed answers
+        """
+        self.large.delay = 0.0
+        self.small.delay = 2.0
+        crawler = Crawler(self._make_config(num_articles=6))
+        start = time.monotonic()
+        timings = [time.monotonic() - start for _ in crawler.iter_urls()]
+        large_urls = [url for url in crawler.urls if url.startswith(self.large.base_url)]
+        self.assertEqual([self.large.article_url(i) for i in range(1, 5)], large_urls)
+        # the large seed takes its half of the budget without waiting for the small one
+        self.assertEqual(large_urls[:3], crawler.urls[:3])
+        self.assertLess(timings[2], 1.0)
+        self.assertGreater(timings[-1], 2.0)
+
+    @pytest.mark.stage_2_18_fair_scheduling_check
+    @pytest.mark.lab_5_scrapper
+    def test_budget_is_shared_equally(self):
+        """
+        Ensure seeds with enough links get equal parts of the budget
+        """
+        crawler = Crawler(self._make_config(num_articles=2))
+        crawler.find_articles()
+        self.assertEqual({self.large.article_url(1), self.small.article_url(1)},
+                         set(crawler.urls))
+
+    @pytest.mark.stage_2_18_fair_scheduling_check
+    @pytest.mark.lab_5_scrapper
+    def test_requests_to_host_are_capped(self):
+        """
+        Ensure a host is not requested by more workers than allowed
+        """
+        self.large.delay = 0.05
+        config = make_local_config(self.large, max_in_flight=8, max_in_flight_per_host=2)
+        prepare_environment(TEST_PATH / 'articles')
+        with mock.patch('core_utils.article.article.ASSETS_PATH', TEST_PATH / 'articles'):
+            stream_articles(Crawler(config), config)
+        self.assertEqual(2, self.large.max_in_flight)
+
+    @pytest.mark.stage_2_18_fair_scheduling_check
+    @pytest.mark.lab_5_scrapper
+    def test_incorrect_max_in_flight_per_host(self):
+        """
+        Ensure the per-host concurrency limit is validated
+        """
+        for incorrect_value in (0, '2', True, 1000):
+            with self.assertRaises(IncorrectMaxInFlightError):
+                make_local_config(self.large, max_in_flight_per_host=incorrect_value)
+
+    def tearDown(self) -> None:
+        self.large.stop()
+        self.small.stop()
+        if TEST_PATH.exists():
+            shutil.rmtree(TEST_PATH)
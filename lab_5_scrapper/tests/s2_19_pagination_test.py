@@ -0,0 +1,136 @@
+"""
+Paginated listing crawling validation
+"""
+import json
+import shutil
+import time
+import unittest
+from unittest import mock
+
+import pytest
+
+from config.test_params import TEST_PATH
+from lab_5_scrapper.scrapper import (AsyncCrawler, Crawler,
+                                     IncorrectCrawlLimitsError,
+                                     NumberOfArticlesOutOfRangeError)
+from lab_5_scrapper.storage import ArticleIndex
+from lab_5_scrapper.tests.local_server import (LISTING_PATH, LocalNewsServer,
+                                               make_local_config)
+
+
+class PaginationTest(unittest.TestCase):
+    """
+    Class for testing walking through listing pages
+    """
+
+    def setUp(self) -> None:
+        self.server = LocalNewsServer(num_articles=400).start()
+
+    def _listing_requests(self) -> list[str]:
+        return [path for path in self.server.requests if path.startswith(f'{LISTING_PATH}?')]
+
+    @pytest.mark.stage_2_19_pagination_check
+    @pytest.mark.lab_5_scrapper
+    def test_more_than_one_page_of_articles(self):
+        """
+        Ensure the crawler collects articles from as many pages as needed
+        when the upper limit of articles is raised
+        """
+        config = make_local_config(self.server, articles_upper_limit=1000,
+                                   listing_page_size=150)
+        crawler = Crawler(config)
+        crawler.find_articles()
+        self.assertEqual([self.server.article_url(i) for i in range(1, 401)], crawler.urls)
+        self.assertEqual([f'{LISTING_PATH}?per-page=150',
+                          f'{LISTING_PATH}?page=2&per-page=150',
+                          f'{LISTING_PATH}?page=3&per-page=150'], self._listing_requests())
+
+    @pytest.mark.stage_2_19_pagination_check
+    @pytest.mark.lab_5_scrapper
+    def test_walk_stops_at_empty_page(self):
+        """
+        Ensure a listing shorter than the number of articles ends the walk
+        """
+        self.server.listing_size = 5
+        config = make_local_config(self.server, articles_upper_limit=1000,
+                                   listing_page_size=3)
+        crawler = Crawler(config)
+        crawler.find_articles()
+        self.assertEqual([self.server.article_url(i) for i in range(1, 6)], crawler.urls)
+
+    @pytest.mark.stage_2_19_pagination_check
+    @pytest.mark.lab_5_scrapper
+    def test_saved_links_do_not_end_the_walk(self):
+        """
+        Ensure only links admitted to the crawl count towards the number of articles
+        """
+        TEST_PATH.mkdir(parents=True, exist_ok=True)
+        for article_id in range(1, 4):
+            (TEST_PATH / f'{article_id}_meta.json').write_text(
+                json.dumps({'id': article_id, 'url': self.server.article_url(article_id)}),
+                encoding='utf-8')
+        config = make_local_config(self.server, articles_upper_limit=1000,
+                                   listing_page_size=5)
+        config._num_articles = 5  # pylint: disable=protected-access
+        crawler = Crawler(config, index=ArticleIndex(TEST_PATH))
+        crawler.find_articles()
+        self.assertEqual([self.server.article_url(i) for i in range(4, 9)], crawler.urls)
+        self.assertEqual([f'{LISTING_PATH}?per-page=5',
+                          f'{LISTING_PATH}?page=2&per-page=5'], self._listing_requests())
+
+    @pytest.mark.stage_2_19_pagination_check
+    @pytest.mark.lab_5_scrapper
+    def test_async_crawler_walks_pages(self):
+        """
+        Ensure the asynchronous crawler walks listing pages as well
+        """
+        config = make_local_config(self.server, articles_upper_limit=1000,
+                                   listing_page_size=150)
+        crawler = AsyncCrawler(config)
+        crawler.find_articles()
+        self.assertEqual([self.server.article_url(i) for i in range(1, 401)], crawler.urls)
+        self.assertEqual(3, len(self._listing_requests()))
+
+    @pytest.mark.stage_2_19_pagination_check
+    @pytest.mark.lab_5_scrapper
+    def test_next_page_is_prefetched(self):
+        """
+        Ensure the next listing page is downloaded while the current one is parsed
+        """
+        self.server.delay = 0.3
+        config = make_local_config(self.server, articles_upper_limit=1000,
+                                   listing_page_size=100)
+        config._num_articles = 300  # pylint: disable=protected-access
+        crawler = Crawler(config)
+        extract_links = crawler._extract_links  # pylint: disable=protected-access
+
+        def slow_extract_links(response):
+            time.sleep(0.3)
+            return extract_links(response)
+
+        start = time.monotonic()
+        with mock.patch.object(crawler, '_extract_links', slow_extract_links):
+            crawler.find_articles()
+        self.assertEqual(300, len(crawler.urls))
+        self.assertLess(time.monotonic() - start, 1.6)
+
+    @pytest.mark.stage_2_19_pagination_check
+    @pytest.mark.lab_5_scrapper
+    def test_number_of_articles_follows_upper_limit(self):
+        """
+        Ensure the number of articles is checked against the configured upper limit
+        """
+        with self.assertRaises(NumberOfArticlesOutOfRangeError):
+            make_local_config(self.server)
+        for incorrect_value in (0, '1000', True):
+            with self.assertRaises(NumberOfArticlesOutOfRangeError):
+                make_local_config(self.server, articles_upper_limit=incorrect_value)
+        for incorrect_value in (0, 1.5, None):
+            with self.assertRaises(IncorrectCrawlLimitsError):
+                make_local_config(self.server, articles_upper_limit=1000,
+                                  listing_page_size=incorrect_value)
+
+    def tearDown(self) -> None:
+        self.server.stop()
+        if TEST_PATH.exists():
+            shutil.rmtree(TEST_PATH)
@@ -0,0 +1,156 @@
+"""
+Discovery of articles in sitemaps and feeds validation
+"""
+import gzip
+import shutil
+import unittest
+from io import BytesIO
+
+import pytest
+
+from config.test_params import TEST_PATH
+from lab_5_scrapper.feeds import iter_feed_entries
+from lab_5_scrapper.scrapper import (AsyncCrawler, Crawler,
+                                     IncorrectDiscoverySettingsError)
+from lab_5_scrapper.tests.local_server import (LISTING_PATH, LocalNewsServer,
+                                               make_local_config)
+
+XML_HEADERS = {'Content-Type': 'application/xml'}
+
+SITEMAP_NAMESPACE = 'http://www.sitemaps.org/schemas/sitemap/0.9'
+
+
+def make_urlset(entries: list[tuple[str, str]]) -> bytes:
+    """
+    Builds a sitemap with the given URLs and modification dates
+    """
+    urls = ''.join(f'<url><loc>{url}</loc><lastmod>{lastmod}</lastmod></url>'
+                   for url, lastmod in entries)
+    return f'<?xml version="1.0" encoding="UTF-8"?>' \
+           f'<urlset xmlns="{SITEMAP_NAMESPACE}">{urls}</urlset>'.encode('utf-8')
+
+
+class FeedDiscoveryTest(unittest.TestCase):
+    """
+    Class for testing discovery of articles in sitemaps and feeds
+    """
+
+    def setUp(self) -> None:
+        self.server = LocalNewsServer(num_articles=10).start()
+
+    def _serve_sitemaps(self) -> None:
+        base_url = self.server.base_url
+        self.server.files['/sitemap.xml'] = (XML_HEADERS, (
+            f'<?xml version="1.0" encoding="UTF-8"?><sitemapindex xmlns="{SITEMAP_NAMESPACE}">'
+            f'<sitemap><loc>{base_url}/sitemap-new.xml</loc>'
+            f'<lastmod>2023-04-02</lastmod></sitemap>'
+            f'<sitemap><loc>{base_url}/sitemap-old.xml.gz</loc>'
+            f'<lastmod>2022-01-01</lastmod></sitemap>'
+            f'</sitemapindex>').encode('utf-8'))
+        self.server.files['/sitemap-new.xml'] = (XML_HEADERS, make_urlset(
+            [(self.server.article_url(i), '2023-04-01T10:00:00+03:00') for i in range(1, 6)]
+            + [(f'{base_url}/about', '2023-04-01'),
+               (self.server.article_url(6), '2023-03-01')]))
+        self.server.files['/sitemap-old.xml.gz'] = (
+            {'Content-Type': 'application/gzip'},
+            gzip.compress(make_urlset([(self.server.article_url(i), '2021-12-31')
+                                       for i in range(7, 11)])))
+
+    @pytest.mark.stage_2_20_feed_discovery_check
+    @pytest.mark.lab_5_scrapper
+    def test_sitemap_discovery(self):
+        """
+        Ensure articles are found in nested and gzipped sitemaps
+        without requesting listing pages
+        """
+        self._serve_sitemaps()
+        config = make_local_config(self.server, discovery='feeds')
+        crawler = Crawler(config)
+        crawler.find_articles()
+        self.assertEqual([self.server.article_url(i) for i in range(1, 11)], crawler.urls)
+        self.assertFalse([path for path in self.server.requests
+                          if path.startswith(LISTING_PATH + '?')])
+
+    @pytest.mark.stage_2_20_feed_discovery_check
+    @pytest.mark.lab_5_scrapper
+    def test_modified_since_skips_old_entries(self):
+        """
+        Ensure old articles and sitemaps modified before the date are skipped
+        """
+        self._serve_sitemaps()
+        config = make_local_config(self.server, discovery='feeds',
+                                   modified_since='2023-03-15')
+        crawler = Crawler(config)
+        crawler.find_articles()
+        self.assertEqual([self.server.article_url(i) for i in range(1, 6)], crawler.urls)
+        self.assertNotIn('/sitemap-old.xml.gz', self.server.requests)
+
+    @pytest.mark.stage_2_20_feed_discovery_check
+    @pytest.mark.lab_5_scrapper
+    def test_rss_feed_discovery(self):
+        """
+        Ensure articles are found in an RSS feed given in the configuration,
+        stopping at the number of articles
+        """
+        items = ''.join(f'<item><title>Article {i}</title><link>{self.server.article_url(i)}</link>'
+                        f'<pubDate>Sat, 01 Apr 2023 10:00:00 +0300</pubDate></item>'
+                        for i in range(1, 11))
+        self.server.files['/rss.xml'] = (
+            {'Content-Type': 'application/rss+xml'},
+            f'<rss version="2.0"><channel><link>{self.server.base_url}</link>'
+            f'{items}</channel></rss>'.encode('utf-8'))
+        config = make_local_config(self.server, discovery='feeds',
+                                   feed_urls=[f'{self.server.base_url}/rss.xml'])
+        config._num_articles = 4  # pylint: disable=protected-access
+        crawler = AsyncCrawler(config)
+        crawler.find_articles()
+        self.assertEqual([self.server.article_url(i) for i in range(1, 5)], crawler.urls)
+
+    @pytest.mark.stage_2_20_feed_discovery_check
+    @pytest.mark.lab_5_scrapper
+    def test_atom_entries(self):
+        """
+        Ensure Atom entries give the alternate link and the latest date
+        """
+        feed = b'<feed xmlns="http://www.w3.org/2005/Atom"><link href="https://example.com"/>' \
+               b'<entry><link rel="edit" href="https://example.com/edit/1"/>' \
+               b'<link href="https://example.com/volga/news/1"/>' \
+               b'<published>2023-04-01T10:00:00Z</published>' \
+               b'<updated>2023-04-02T10:00:00Z</updated></entry></feed>'
+        entries = list(iter_feed_entries(BytesIO(feed)))
+        self.assertEqual(1, len(entries))
+        kind, link, modified = entries[0]
+        self.assertEqual(('page', 'https://example.com/volga/news/1'), (kind, link))
+        self.assertEqual('2023-04-02T10:00:00+00:00', modified.isoformat())
+
+    @pytest.mark.stage_2_20_feed_discovery_check
+    @pytest.mark.lab_5_scrapper
+    def test_malformed_feed_keeps_read_entries(self):
+        """
+        Ensure a truncated sitemap gives the entries read before the error
+        """
+        self.server.files['/sitemap.xml'] = (
+            XML_HEADERS, make_urlset([(self.server.article_url(i), '2023-04-01')
+                                      for i in range(1, 4)])[:-20])
+        config = make_local_config(self.server, discovery='feeds')
+        crawler = Crawler(config)
+        crawler.find_articles()
+        self.assertEqual([self.server.article_url(i) for i in range(1, 3)], crawler.urls)
+        self.assertEqual(1, config.get_metrics().get_summary()['counters']['feeds_malformed'])
+
+    @pytest.mark.stage_2_20_feed_discovery_check
+    @pytest.mark.lab_5_scrapper
+    def test_incorrect_discovery_settings(self):
+        """
+        Ensure discovery mode, feed URLs and modification date are validated
+        """
+        for incorrect_params in ({'discovery': 'sitemap'}, {'feed_urls': 'sitemap.xml'},
+                                 {'feed_urls': ['sitemap.xml']}, {'modified_since': 'yesterday'},
+                                 {'modified_since': 20230401}):
+            with self.assertRaises(IncorrectDiscoverySettingsError):
+                make_local_config(self.server, **incorrect_params)
+
+    def tearDown(self) -> None:
+        self.server.stop()
+        if TEST_PATH.exists():
+            shutil.rmtree(TEST_PATH)
@@ -0,0 +1,153 @@
+"""
+Near-duplicate detection of articles validation
+"""
+import json
+import shutil
+import unittest
+from unittest import mock
+
+import pytest
+
+from config.test_params import TEST_PATH
+from core_utils.article.article import Article
+from lab_5_scrapper.dedup import DuplicateIndex, get_simhash
+from lab_5_scrapper.scrapper import (Crawler,
+                                     IncorrectDeduplicationSettingsError,
+                                     prepare_environment, stream_articles)
+from lab_5_scrapper.storage import ArticleIndex
+from lab_5_scrapper.tests.local_server import (LISTING_PATH, LocalNewsServer,
+                                               make_local_config)
+
+STORY = ' '.join(f'Sentence number {index} of the story tells about the river port '
+                 f'and the budget of the city for year {2000 + index}.' for index in range(40))
+
+
+def make_article(article_id: int, text: str) -> Article:
+    """
+    Creates an article with the given text
+    """
+    article = Article(f'https://example.com/volga/news/{article_id}', article_id)
+    article.text = text
+    return article
+
+
+class DeduplicationTest(unittest.TestCase):
+    """
+    Class for testing detection of articles published under several URLs
+    """
+
+    def setUp(self) -> None:
+        self.server = LocalNewsServer(num_articles=6).start()
+        copy = self.server.render(f'{LISTING_PATH}/article-1').encode('utf-8')
+        for article_id in (3, 5):
+            self.server.files[f'{LISTING_PATH}/article-{article_id}'] = (
+                {'Content-Type': 'text/html; charset=utf-8',
+                 'Content-Length': str(len(copy))}, copy)
+
+    @pytest.mark.stage_2_21_deduplication_check
+    @pytest.mark.lab_5_scrapper
+    def test_duplicates_are_skipped_and_recorded_as_aliases(self):
+        """
+        Ensure copies of an article are not saved and their URLs
+        are kept in meta information of the original
+        """
+        for parse_processes in (0, 2):
+            config = make_local_config(self.server, max_in_flight=1, deduplicate=True,
+                                       parse_processes=parse_processes)
+            prepare_environment(TEST_PATH)
+            with mock.patch('core_utils.article.article.ASSETS_PATH', TEST_PATH):
+                stream_articles(Crawler(config), config)
+
+            self.assertEqual(['1', '2', '3', '4'],
+                             sorted(path.name.split('_')[0]
+                                    for path in TEST_PATH.glob('*_raw.txt')))
+            with open(TEST_PATH / '1_meta.json', encoding='utf-8') as meta_file:
+                meta = json.load(meta_file)
+            self.assertEqual([self.server.article_url(3), self.server.article_url(5)],
+                             meta['aliases'])
+            self.assertEqual(2, config.get_metrics().get_summary()
+                             ['counters']['duplicates_skipped'])
+
+    @pytest.mark.stage_2_21_deduplication_check
+    @pytest.mark.lab_5_scrapper
+    def test_aliases_are_not_downloaded_again(self):
+        """
+        Ensure a repeated run treats URLs of skipped duplicates as saved
+        """
+        config = make_local_config(self.server, deduplicate=True, incremental=True)
+        prepare_environment(TEST_PATH)
+        with mock.patch('core_utils.article.article.ASSETS_PATH', TEST_PATH):
+            stream_articles(Crawler(config), config)
+            index = ArticleIndex(TEST_PATH)
+            self.assertEqual(4, len(index))
+            self.assertEqual(1, index.get_id(self.server.article_url(5)))
+
+            self.server.requests.clear()
+            config = make_local_config(self.server, deduplicate=True, incremental=True)
+            stream_articles(Crawler(config, index=index), config, index.get_next_id())
+        self.assertFalse([path for path in self.server.requests if 'article-' in path])
+        self.assertEqual(4, len(list(TEST_PATH.glob('*_raw.txt'))))
+
+    @pytest.mark.stage_2_21_deduplication_check
+    @pytest.mark.lab_5_scrapper
+    def test_copies_of_articles_saved_before_are_found(self):
+        """
+        Ensure a repeated run skips copies of articles saved by a previous run
+        """
+        config = make_local_config(self.server, deduplicate=True, incremental=True)
+        config._num_articles = 2  # pylint: disable=protected-access
+        prepare_environment(TEST_PATH)
+        with mock.patch('core_utils.article.article.ASSETS_PATH', TEST_PATH):
+            stream_articles(Crawler(config), config)
+            config = make_local_config(self.server, deduplicate=True, incremental=True)
+            index = ArticleIndex(TEST_PATH, config.get_duplicate_index())
+            stream_articles(Crawler(config, index=index), config, index.get_next_id())
+
+        self.assertEqual(4, len(list(TEST_PATH.glob('*_raw.txt'))))
+        with open(TEST_PATH / '1_meta.json', encoding='utf-8') as meta_file:
+            self.assertEqual([self.server.article_url(3), self.server.article_url(5)],
+                             json.load(meta_file)['aliases'])
+
+    @pytest.mark.stage_2_21_deduplication_check
+    @pytest.mark.lab_5_scrapper
+    def test_duplicates_are_kept_by_default(self):
+        """
+        Ensure all articles are saved when deduplication is disabled
+        """
+        config = make_local_config(self.server)
+        prepare_environment(TEST_PATH)
+        with mock.patch('core_utils.article.article.ASSETS_PATH', TEST_PATH):
+            stream_articles(Crawler(config), config)
+        self.assertEqual(6, len(list(TEST_PATH.glob('*_raw.txt'))))
+        self.assertIsNone(config.get_duplicate_index())
+
+    @pytest.mark.stage_2_21_deduplication_check
+    @pytest.mark.lab_5_scrapper
+    def test_near_duplicates_are_found(self):
+        """
+        Ensure slightly edited texts are found and different texts are not
+        """
+        index = DuplicateIndex(max_distance=3)
+        self.assertIsNone(index.find_original(make_article(1, STORY)))
+        self.assertIsNone(index.find_original(make_article(2, STORY.replace('river', 'sea'))))
+        self.assertEqual(1, index.find_original(make_article(3, STORY + ' Updated at noon.')))
+        self.assertEqual(1, index.find_original(make_article(4, STORY.upper())))
+        self.assertIsNone(index.find_original(make_article(5, '')))
+        self.assertIsNone(index.find_original(make_article(6, '')))
+        self.assertIsNone(get_simhash('...'))
+
+    @pytest.mark.stage_2_21_deduplication_check
+    @pytest.mark.lab_5_scrapper
+    def test_incorrect_deduplication_settings(self):
+        """
+        Ensure deduplication parameters are validated
+        """
+        for incorrect_params in ({'deduplicate': 'yes'}, {'duplicate_distance': -1},
+                                 {'duplicate_distance': 64}, {'duplicate_distance': 2.5}):
+            with self.assertRaises(IncorrectDeduplicationSettingsError):
+                make_local_config(self.server, **incorrect_params)
+
+    def tearDown(self) -> None:
+        self.server.stop()
+        if TEST_PATH.exists():
+            shutil.rmtree(TEST_PATH)
@@ -0,0 +1,168 @@
+"""
+Respecting robots.txt rules and crawl delays validation
+"""
+import shutil
+import unittest
+from unittest import mock
+
+import pytest
+
+from config.test_params import TEST_PATH
+from core_utils.constants import PROJECT_ROOT
+from lab_5_scrapper.fetching import RobotsCache
+from lab_5_scrapper.scrapper import (Crawler, IncorrectRobotsSettingsError,
+                                     RecursiveCrawler)
+from lab_5_scrapper.tests.local_server import (LocalNewsServer,
+                                               make_local_config)
+
+ROBOTS_HEADERS = {'Content-Type': 'text/plain'}
+
+
+class RobotsTest(unittest.TestCase):
+    """
+    Class for testing robots.txt policies of hosts
+    """
+
+    def setUp(self) -> None:
+        self.server = LocalNewsServer(num_articles=6).start()
+        self.server.files['/robots.txt'] = (
+            ROBOTS_HEADERS, b'User-agent: *\nDisallow: /volga/news/article-3\n')
+
+    def _robots_requests(self) -> int:
+        return self.server.requests.count('/robots.txt')
+
+    @pytest.mark.stage_2_22_robots_check
+    @pytest.mark.lab_5_scrapper
+    def test_disallowed_urls_are_not_queued(self):
+        """
+        Ensure disallowed articles are filtered out and rules are downloaded once
+        """
+        config = make_local_config(self.server, respect_robots=True)
+        crawler = Crawler(config)
+        crawler.find_articles()
+        self.assertEqual([self.server.article_url(i) for i in (1, 2, 4, 5, 6)], crawler.urls)
+        self.assertEqual(1, self._robots_requests())
+        self.assertEqual(1, config.get_request_stats()['robots_disallowed'])
+
+    @pytest.mark.stage_2_22_robots_check
+    @pytest.mark.lab_5_scrapper
+    def test_recursive_crawler_does_not_follow_disallowed_urls(self):
+        """
+        Ensure the recursive crawler neither records nor visits disallowed articles
+        """
+        for name in ('intermediate_info.json', 'intermediate_info.jsonl'):
+            (PROJECT_ROOT / 'lab_5_scrapper' / name).unlink(missing_ok=True)
+        server = LocalNewsServer(num_articles=6, listing_size=2).start()
+        server.files['/robots.txt'] = self.server.files['/robots.txt']
+        try:
+            crawler = RecursiveCrawler(make_local_config(server, respect_robots=True))
+            crawler.find_articles()
+            self.assertEqual([server.article_url(1), server.article_url(2)], crawler.urls)
+            self.assertNotIn('/volga/news/article-3', server.requests)
+        finally:
+            server.stop()
+            for name in ('intermediate_info.json', 'intermediate_info.jsonl'):
+                (PROJECT_ROOT / 'lab_5_scrapper' / name).unlink(missing_ok=True)
+
+    @pytest.mark.stage_2_22_robots_check
+    @pytest.mark.lab_5_scrapper
+    def test_crawl_delay_drives_rate_limiter(self):
+        """
+        Ensure crawl delay of the host lowers the frequency of requests
+        """
+        self.server.files['/robots.txt'] = (ROBOTS_HEADERS, b'User-agent: *\nCrawl-delay: 1\n')
+        config = make_local_config(self.server, respect_robots=True)
+        config.get_robots_cache().get_policy(self.server.seed_url)
+        rate_limiter = config.get_rate_limiter()
+        self.assertEqual(0.0, rate_limiter.acquire(self.server.seed_url))
+        self.assertAlmostEqual(1.0, rate_limiter.acquire(self.server.seed_url), delta=0.1)
+
+    @pytest.mark.stage_2_22_robots_check
+    @pytest.mark.lab_5_scrapper
+    def test_missing_and_failing_rules(self):
+        """
+        Ensure missing rules allow everything and a failing server disallows everything
+        """
+        del self.server.files['/robots.txt']
+        crawler = Crawler(make_local_config(self.server, respect_robots=True))
+        crawler.find_articles()
+        self.assertEqual(6, len(crawler.urls))
+
+        self.server.failures['/robots.txt'] = [(503, None)] * 4
+        crawler = Crawler(make_local_config(self.server, respect_robots=True, max_retries=0))
+        crawler.find_articles()
+        self.assertEqual([], crawler.urls)
+
+    @pytest.mark.stage_2_22_robots_check
+    @pytest.mark.lab_5_scrapper
+    def test_transient_failure_is_retried(self):
+        """
+        Ensure rules are downloaded again after a transient error
+        instead of disallowing everything, the same way as pages
+        """
+        self.server.failures['/robots.txt'] = [(503, None)]
+        config = make_local_config(self.server, respect_robots=True, max_retries=2,
+                                   backoff_factor=0.01)
+        robots_cache = config.get_robots_cache()
+        self.assertTrue(robots_cache.is_allowed(self.server.article_url(1)))
+        self.assertFalse(robots_cache.is_allowed(self.server.article_url(3)))
+        self.assertEqual(2, self._robots_requests())
+        stages = config.get_metrics().get_summary()['stages']
+        self.assertEqual(2, stages['download']['count'])
+        self.assertEqual(1, stages['retry_backoff']['count'])
+
+    @pytest.mark.stage_2_22_robots_check
+    @pytest.mark.lab_5_scrapper
+    def test_failing_rules_do_not_pause_host(self):
+        """
+        Ensure failures to download rules do not open the circuit for pages of the host
+        """
+        self.server.failures['/robots.txt'] = [(503, None)] * 3
+        config = make_local_config(self.server, respect_robots=True, max_retries=2,
+                                   backoff_factor=0.01, circuit_breaker_threshold=1,
+                                   circuit_breaker_cooldown=0.01)
+        self.assertFalse(config.get_robots_cache().is_allowed(self.server.article_url(1)))
+        self.assertEqual(0, config.get_circuit_breaker().get_stats()['circuit_breaker_trips'])
+
+    @pytest.mark.stage_2_22_robots_check
+    @pytest.mark.lab_5_scrapper
+    def test_failure_is_remembered_for_short_time(self):
+        """
+        Ensure a host failing to give rules is asked again before the TTL of rules expires
+        """
+        self.server.failures['/robots.txt'] = [(503, None)]
+        with mock.patch.object(RobotsCache, 'failure_ttl', 0):
+            robots_cache = make_local_config(self.server, respect_robots=True,
+                                             max_retries=0).get_robots_cache()
+            self.assertFalse(robots_cache.is_allowed(self.server.article_url(1)))
+            self.assertTrue(robots_cache.is_allowed(self.server.article_url(1)))
+        self.assertEqual(2, self._robots_requests())
+
+    @pytest.mark.stage_2_22_robots_check
+    @pytest.mark.lab_5_scrapper
+    def test_rules_are_refreshed_after_ttl(self):
+        """
+        Ensure outdated rules are downloaded again
+        """
+        config = make_local_config(self.server, respect_robots=True, robots_ttl=0)
+        robots_cache = config.get_robots_cache()
+        self.assertFalse(robots_cache.is_allowed(self.server.article_url(3)))
+        self.server.files['/robots.txt'] = (ROBOTS_HEADERS, b'User-agent: *\nAllow: /\n')
+        self.assertTrue(robots_cache.is_allowed(self.server.article_url(3)))
+        self.assertEqual(2, self._robots_requests())
+
+    @pytest.mark.stage_2_22_robots_check
+    @pytest.mark.lab_5_scrapper
+    def test_incorrect_robots_settings(self):
+        """
+        Ensure robots.txt parameters are validated
+        """
+        for incorrect_params in ({'respect_robots': 'yes'}, {'robots_ttl': -1},
+                                 {'robots_ttl': 1.5}, {'robots_ttl': True}):
+            with self.assertRaises(IncorrectRobotsSettingsError):
+                make_local_config(self.server, **incorrect_params)
+
+    def tearDown(self) -> None:
+        self.server.stop()
+        if TEST_PATH.exists():
+            shutil.rmtree(TEST_PATH)
@@ -0,0 +1,94 @@
+"""
+Recording and offline replay of responses validation
+"""
+import shutil
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from config.test_params import TEST_PATH
+from lab_5_scrapper.scrapper import (Crawler, IncorrectArchiveSettingsError,
+                                     make_request, prepare_environment,
+                                     stream_articles)
+from lab_5_scrapper.tests.local_server import (LocalNewsServer,
+                                               make_local_config)
+
+
+class HttpArchiveTest(unittest.TestCase):
+    """
+    Class for testing the archive of responses
+    """
+
+    def setUp(self) -> None:
+        self.server = LocalNewsServer(num_articles=6).start()
+        self.server.files['/robots.txt'] = ({'Content-Type': 'text/plain'},
+                                            b'User-agent: *\nDisallow: /volga/news/article-4\n')
+        self._directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.archive_path = str(Path(self._directory.name) / 'archive.sqlite3')
+
+    def _scrape(self, **optional_params: object) -> tuple[dict[str, str], dict[str, float]]:
+        config = make_local_config(self.server, respect_robots=True,
+                                   archive_path=self.archive_path, **optional_params)
+        prepare_environment(TEST_PATH)
+        with mock.patch('core_utils.article.article.ASSETS_PATH', TEST_PATH):
+            stream_articles(Crawler(config), config)
+        return ({path.name: path.read_text(encoding='utf-8') for path in TEST_PATH.iterdir()},
+                config.get_request_stats())
+
+    @pytest.mark.stage_2_23_archive_check
+    @pytest.mark.lab_5_scrapper
+    def test_replay_gives_recorded_articles_offline(self):
+        """
+        Ensure a replayed run saves the same articles without requests
+        and without waiting for the rate limiter
+        """
+        recorded, _ = self._scrape(archive_mode='record')
+        self.assertEqual(10, len(recorded))
+        self.server.stop()
+
+        start = time.perf_counter()
+        replayed, stats = self._scrape(archive_mode='replay', requests_per_second=1)
+        self.assertLess(time.perf_counter() - start, 1)
+        self.assertEqual(recorded, replayed)
+        self.assertEqual(0, stats['archive_misses'])
+        self.assertEqual(0, stats['requests'])
+
+    @pytest.mark.stage_2_23_archive_check
+    @pytest.mark.lab_5_scrapper
+    def test_missing_response_is_not_found(self):
+        """
+        Ensure a URL absent from the archive is replayed as a missing page
+        """
+        config = make_local_config(self.server, archive_mode='record',
+                                   archive_path=self.archive_path)
+        self.assertEqual(200, make_request(self.server.article_url(1), config).status_code)
+        config = make_local_config(self.server, archive_mode='replay',
+                                   archive_path=self.archive_path)
+        response = make_request(self.server.article_url(1), config)
+        self.assertEqual(200, response.status_code)
+        self.assertIn('Article 1', response.text)
+        self.assertEqual(404, make_request(self.server.article_url(2), config).status_code)
+        self.assertEqual({'archive_recorded': 0, 'archive_replayed': 1, 'archive_misses': 1},
+                         config.get_http_archive().get_stats())
+
+    @pytest.mark.stage_2_23_archive_check
+    @pytest.mark.lab_5_scrapper
+    def test_incorrect_archive_settings(self):
+        """
+        Ensure archive mode and path are validated
+        """
+        for incorrect_params in ({'archive_mode': 'play'}, {'archive_path': 5},
+                                 {'archive_path': ''},
+                                 {'archive_mode': 'replay', 'archive_path': self.archive_path}):
+            with self.assertRaises(IncorrectArchiveSettingsError):
+                make_local_config(self.server, **incorrect_params)
+
+    def tearDown(self) -> None:
+        self.server.stop()
+        self._directory.cleanup()
+        if TEST_PATH.exists():
+            shutil.rmtree(TEST_PATH)
@@ -0,0 +1,85 @@
+"""
+Classification and canonical forms of links validation
+"""
+import shutil
+import unittest
+
+import pytest
+
+from config.test_params import TEST_PATH
+from lab_5_scrapper.scrapper import Crawler, IncorrectUrlPatternsError
+from lab_5_scrapper.tests.local_server import (LocalNewsServer,
+                                               make_local_config)
+from lab_5_scrapper.urls import UrlClassifier
+
+PAGE_URL = 'https://example.com/volga/news'
+
+
+class UrlClassifierTest(unittest.TestCase):
+    """
+    Class for testing sorting of links into articles and other pages
+    """
+
+    def setUp(self) -> None:
+        self.server = LocalNewsServer(num_articles=6).start()
+
+    @pytest.mark.stage_2_24_url_classifier_check
+    @pytest.mark.lab_5_scrapper
+    def test_links_are_resolved_and_classified(self):
+        """
+        Ensure relative links are resolved against the page, fragments are dropped
+        and links that are not web pages or are excluded are left out
+        """
+        classifier = UrlClassifier(['/volga/news/'], [r'/volga/news/.*/print$'],
+                                   normalize=False, ignored_query_params=[])
+        hrefs = ['/volga/news/article-1#comments', 'article-2', '/about', '',
+                 '#top', 'mailto:editor@example.com', 'javascript:void(0)',
+                 'https://other.org/volga/news/article-3?b=2&a=1',
+                 '/volga/news/article-1/print']
+        self.assertEqual([('https://example.com/volga/news/article-1', True),
+                          ('https://example.com/volga/article-2', False),
+                          ('https://example.com/about', False),
+                          ('https://other.org/volga/news/article-3?b=2&a=1', True)],
+                         classifier.classify(hrefs, PAGE_URL))
+
+    @pytest.mark.stage_2_24_url_classifier_check
+    @pytest.mark.lab_5_scrapper
+    def test_query_is_canonicalized(self):
+        """
+        Ensure normalization sorts query parameters and drops the ignored ones
+        """
+        classifier = UrlClassifier(['/news/'], [], normalize=True,
+                                   ignored_query_params=['utm_source', 'utm_medium'])
+        self.assertEqual('https://example.com/news/1?a=1&b=2',
+                         classifier.canonicalize('HTTPS://Example.com:443/news/1/'
+                                                 '?utm_source=feed&b=2&a=1&utm_medium=rss#top'))
+
+    @pytest.mark.stage_2_24_url_classifier_check
+    @pytest.mark.lab_5_scrapper
+    def test_patterns_from_config_filter_listing(self):
+        """
+        Ensure the crawler keeps only links matching article patterns
+        and not matching excluded ones
+        """
+        config = make_local_config(self.server, article_patterns=[r'/article-[1-4]$'],
+                                   exclude_patterns=['article-2'])
+        crawler = Crawler(config)
+        crawler.find_articles()
+        self.assertEqual([self.server.article_url(i) for i in (1, 3, 4)], crawler.urls)
+
+    @pytest.mark.stage_2_24_url_classifier_check
+    @pytest.mark.lab_5_scrapper
+    def test_incorrect_url_patterns(self):
+        """
+        Ensure URL patterns and ignored query parameters are validated
+        """
+        for incorrect_params in ({'article_patterns': []}, {'article_patterns': '/news/'},
+                                 {'exclude_patterns': ['(']}, {'exclude_patterns': [1]},
+                                 {'ignored_query_params': ['']}):
+            with self.assertRaises(IncorrectUrlPatternsError):
+                make_local_config(self.server, **incorrect_params)
+
+    def tearDown(self) -> None:
+        self.server.stop()
+        if TEST_PATH.exists():
+            shutil.rmtree(TEST_PATH)
@@ -0,0 +1,71 @@
+# pylint: disable=protected-access
+"""
+Asynchronous crawling validation against a local stand-in website
+"""
+import asyncio
+import json
+import shutil
+import unittest
+from unittest import mock
+
+import pytest
+
+from config.test_params import TEST_PATH
+from lab_5_scrapper.scrapper import AsyncCrawler, IncorrectMaxInFlightError, crawl_async
+from lab_5_scrapper.tests.local_server import LocalNewsServer, make_local_config
+
+
+class AsyncCrawlerTest(unittest.TestCase):
+    """
+    Class for testing asynchronous crawling
+    """
+
+    def setUp(self) -> None:
+        self.server = LocalNewsServer(num_articles=8, delay=0.2).start()
+
+    @pytest.mark.stage_2_6_async_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_async_crawler_keeps_seed_order(self):
+        """
+        Ensure seed pages requested concurrently give links in the order of seeds
+        """
+        config = make_local_config(self.server, max_in_flight=2)
+        config._seed_urls = [self.server.seed_url, f'{self.server.base_url}/missing']
+        crawler = AsyncCrawler(config)
+        crawler.find_articles()
+        self.assertEqual([self.server.article_url(i) for i in range(1, 9)], crawler.urls)
+
+    @pytest.mark.stage_2_6_async_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_crawl_async_is_bounded_and_deterministic(self):
+        """
+        Ensure articles are fetched concurrently within the limit
+        and saved under IDs matching the order of discovered links
+        """
+        config = make_local_config(self.server, max_in_flight=4)
+        with mock.patch('core_utils.article.article.ASSETS_PATH', TEST_PATH):
+            asyncio.run(crawl_async(config))
+
+        self.assertLessEqual(self.server.max_in_flight, 4)
+        self.assertGreater(self.server.max_in_flight, 1)
+        for article_id in range(1, 9):
+            with open(TEST_PATH / f'{article_id}_meta.json', encoding='utf-8') as file:
+                meta = json.load(file)
+            self.assertEqual(self.server.article_url(article_id), meta['url'])
+            self.assertEqual(f'Article {article_id}', meta['title'])
+            self.assertTrue((TEST_PATH / f'{article_id}_raw.txt').read_text(encoding='utf-8'))
+
+    @pytest.mark.stage_2_6_async_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_incorrect_max_in_flight(self):
+        """
+        Ensure the concurrency limit is validated
+        """
+        for incorrect_value in (0, -1, 'four', True, 1000):
+            with self.assertRaises(IncorrectMaxInFlightError):
+                make_local_config(self.server, max_in_flight=incorrect_value)
+
+    def tearDown(self) -> None:
+        self.server.stop()
+        if TEST_PATH.exists():
+            shutil.rmtree(TEST_PATH)
@@ -0,0 +1,103 @@
+"""
+Per-host rate limiting validation
+"""
+import json
+import shutil
+import time
+import unittest
+
+import pytest
+
+from config.test_params import TEST_CRAWLER_CONFIG_PATH, TEST_PATH
+from core_utils.constants import CRAWLER_CONFIG_PATH
+from lab_5_scrapper.fetching import RateLimiter
+from lab_5_scrapper.scrapper import Config, IncorrectRateLimitError
+from lab_5_scrapper.tests.config_generator import generate_config
+
+
+class RateLimiterTest(unittest.TestCase):
+    """
+    Class for testing the token bucket rate limiter
+    """
+
+    @pytest.mark.stage_2_7_rate_limiter_check
+    @pytest.mark.lab_5_scrapper
+    def test_burst_is_not_delayed(self):
+        """
+        Ensure requests within the burst size do not wait
+        """
+        limiter = RateLimiter(requests_per_second=1, burst=3)
+        start = time.monotonic()
+        delays = [limiter.acquire('https://example.com/news') for _ in range(3)]
+        self.assertEqual([0.0, 0.0, 0.0], delays)
+        self.assertLess(time.monotonic() - start, 0.1)
+
+    @pytest.mark.stage_2_7_rate_limiter_check
+    @pytest.mark.lab_5_scrapper
+    def test_requests_over_burst_follow_rate(self):
+        """
+        Ensure requests beyond the burst are spread according to the rate
+        """
+        limiter = RateLimiter(requests_per_second=20, burst=1)
+        start = time.monotonic()
+        for _ in range(5):
+            limiter.acquire('https://example.com/news')
+        self.assertGreaterEqual(time.monotonic() - start, 0.19)
+
+    @pytest.mark.stage_2_7_rate_limiter_check
+    @pytest.mark.lab_5_scrapper
+    def test_hosts_are_limited_separately(self):
+        """
+        Ensure a busy host does not delay requests to another host
+        """
+        limiter = RateLimiter(requests_per_second=1, burst=1)
+        limiter.acquire('https://example.com/a')
+        self.assertEqual(0.0, limiter.acquire('https://example.org/a'))
+        self.assertGreater(limiter.acquire('https://example.com/b'), 0.0)
+
+
+class RateLimitConfigTest(unittest.TestCase):
+    """
+    Class for testing rate limit configuration
+    """
+
+    def setUp(self) -> None:
+        with CRAWLER_CONFIG_PATH.open(encoding='utf-8') as file:
+            self.reference = json.load(file)
+
+    def _generate(self, **optional_params) -> None:
+        generate_config(seed_urls=self.reference['seed_urls'],
+                        num_articles=self.reference['total_articles_to_find_and_parse'],
+                        headers=self.reference['headers'],
+                        encoding=self.reference['encoding'],
+                        timeout=self.reference['timeout'],
+                        should_verify_certificate=self.reference['should_verify_certificate'],
+                        headless_mode=self.reference['headless_mode'],
+                        **optional_params)
+
+    @pytest.mark.stage_2_7_rate_limiter_check
+    @pytest.mark.lab_5_scrapper
+    def test_incorrect_rate_limit_config_params(self):
+        """
+        Ensure rate and burst values are validated
+        """
+        for incorrect_params in ({'requests_per_second': 0}, {'requests_per_second': '1'},
+                                 {'requests_per_second': True}, {'burst': 0},
+                                 {'burst': 1.5}, {'burst': 1000}):
+            self._generate(**incorrect_params)
+            with self.assertRaises(IncorrectRateLimitError):
+                Config(TEST_CRAWLER_CONFIG_PATH)
+
+    @pytest.mark.stage_2_7_rate_limiter_check
+    @pytest.mark.lab_5_scrapper
+    def test_rate_limiter_is_shared(self):
+        """
+        Ensure one configuration gives one limiter for all requests
+        """
+        self._generate(requests_per_second=2.5, burst=4)
+        config = Config(TEST_CRAWLER_CONFIG_PATH)
+        self.assertIs(config.get_rate_limiter(), config.get_rate_limiter())
+
+    def tearDown(self) -> None:
+        if TEST_PATH.exists():
+            shutil.rmtree(TEST_PATH)
@@ -0,0 +1,63 @@
+"""
+Pooled keep-alive connections validation
+"""
+import shutil
+import unittest
+
+import pytest
+
+from config.test_params import TEST_PATH
+from lab_5_scrapper.scrapper import Crawler, HTMLParser, IncorrectPoolSizeError, make_request
+from lab_5_scrapper.tests.local_server import LocalNewsServer, make_local_config
+
+
+class FetcherTest(unittest.TestCase):
+    """
+    Class for testing connection reuse
+    """
+
+    def setUp(self) -> None:
+        self.server = LocalNewsServer(num_articles=5).start()
+
+    @pytest.mark.stage_2_8_fetcher_check
+    @pytest.mark.lab_5_scrapper
+    def test_crawler_and_parser_reuse_connection(self):
+        """
+        Ensure sequential requests of crawler and parser share one connection
+        """
+        config = make_local_config(self.server)
+        crawler = Crawler(config)
+        crawler.find_articles()
+        for article_id, url in enumerate(crawler.urls, 1):
+            HTMLParser(url, article_id, config).parse()
+
+        stats = config.get_fetcher().get_connection_stats()
+        self.assertEqual(6, stats['requests'])
+        self.assertEqual(1, stats['connections_opened'])
+        self.assertEqual(5, stats['connections_reused'])
+
+    @pytest.mark.stage_2_8_fetcher_check
+    @pytest.mark.lab_5_scrapper
+    def test_configured_headers_are_sent(self):
+        """
+        Ensure the session sends configured headers
+        """
+        config = make_local_config(self.server)
+        response = make_request(self.server.seed_url, config)
+        self.assertEqual(config.get_headers()['accept'],
+                         response.request.headers['accept'])
+
+    @pytest.mark.stage_2_8_fetcher_check
+    @pytest.mark.lab_5_scrapper
+    def test_incorrect_pool_size(self):
+        """
+        Ensure the pool size is validated
+        """
+        for incorrect_value in (0, 'four', False, 1000):
+            with self.assertRaises(IncorrectPoolSizeError):
+                make_local_config(self.server, pool_size=incorrect_value)
+
+    def tearDown(self) -> None:
+        self.server.stop()
+        if TEST_PATH.exists():
+            shutil.rmtree(TEST_PATH)
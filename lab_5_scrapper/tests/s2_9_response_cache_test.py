@@ -0,0 +1,133 @@
+"""
+On-disk response cache validation
+"""
+import shutil
+import unittest
+from unittest import mock
+
+import pytest
+
+from config.test_params import TEST_CRAWLER_CONFIG_PATH, TEST_PATH
+from lab_5_scrapper.fetching import ResponseCache
+from lab_5_scrapper.scrapper import (Config, IncorrectCacheSettingsError,
+                                     make_request)
+from lab_5_scrapper.tests.local_server import (LocalNewsServer,
+                                               make_local_config)
+
+
+class ResponseCacheTest(unittest.TestCase):
+    """
+    Class for testing cached requests
+    """
+
+    def setUp(self) -> None:
+        self.server = LocalNewsServer(num_articles=3).start()
+        self.cache_path = mock.patch('lab_5_scrapper.configuration.CACHE_PATH', TEST_PATH / 'cache')
+        self.cache_path.start()
+
+    def _make_config(self, **optional_params) -> Config:
+        return make_local_config(self.server, use_cache=True, **optional_params)
+
+    @pytest.mark.stage_2_9_response_cache_check
+    @pytest.mark.lab_5_scrapper
+    def test_fresh_entry_is_served_from_disk(self):
+        """
+        Ensure a page requested again within TTL, even by a new run,
+        does not reach the server
+        """
+        url = self.server.article_url(1)
+        first = make_request(url, self._make_config(cache_ttl=3600))
+        second = make_request(url, Config(TEST_CRAWLER_CONFIG_PATH))
+        self.assertEqual(1, len(self.server.requests))
+        self.assertEqual(first.text, second.text)
+        self.assertEqual(200, second.status_code)
+
+    @pytest.mark.stage_2_9_response_cache_check
+    @pytest.mark.lab_5_scrapper
+    def test_stale_entry_is_revalidated(self):
+        """
+        Ensure an expired page is requested conditionally and reused if not modified
+        """
+        url = self.server.article_url(2)
+        config = self._make_config(cache_ttl=0)
+        first = make_request(url, config)
+        second = make_request(url, config)
+        self.assertEqual([200, 304], self.server.statuses)
+        self.assertEqual(first.text, second.text)
+        self.assertEqual(200, second.status_code)
+
+        self.server.page_version += 1
+        make_request(url, config)
+        self.assertEqual([200, 304, 200], self.server.statuses)
+
+    @pytest.mark.stage_2_9_response_cache_check
+    @pytest.mark.lab_5_scrapper
+    def test_least_recently_used_entries_are_evicted(self):
+        """
+        Ensure the cache stays within its size limit
+        """
+        config = self._make_config()
+        page_size = len(make_request(self.server.article_url(1), config).content)
+        cache = ResponseCache(TEST_PATH / 'small_cache', ttl=3600,
+                              max_bytes=2 * page_size, request_headers={})
+        for article_id in range(1, 4):
+            cache.store(self.server.article_url(article_id),
+                        make_request(self.server.article_url(article_id), config))
+        self.assertLessEqual(cache.get_size(), 2 * page_size)
+        self.assertIsNone(cache.lookup(self.server.article_url(1)))
+        self.assertIsNotNone(cache.lookup(self.server.article_url(3)))
+
+    @pytest.mark.stage_2_9_response_cache_check
+    @pytest.mark.lab_5_scrapper
+    def test_entry_evicted_while_read_is_a_miss(self):
+        """
+        Ensure an entry removed by another thread right after it is read is not served
+        """
+        cache = ResponseCache(TEST_PATH / 'small_cache', ttl=3600,
+                              max_bytes=1024 * 1024, request_headers={})
+        url = self.server.article_url(1)
+        cache.store(url, make_request(url, self._make_config()))
+        with mock.patch('lab_5_scrapper.fetching.os.utime', side_effect=FileNotFoundError):
+            self.assertIsNone(cache.lookup(url))
+        self.assertIsNotNone(cache.lookup(url))
+
+    @pytest.mark.stage_2_9_response_cache_check
+    @pytest.mark.lab_5_scrapper
+    def test_entry_evicted_before_revalidation_is_stored_again(self):
+        """
+        Ensure a page confirmed by the server after its entry was evicted is cached again
+        """
+        config = self._make_config(cache_ttl=0)
+        url = self.server.article_url(1)
+        make_request(url, config)
+        cache = config.get_response_cache()
+        lookup = cache.lookup
+
+        def lookup_and_evict(looked_up_url):
+            entry = lookup(looked_up_url)
+            for path in cache.path.iterdir():
+                path.unlink()
+            return entry
+
+        with mock.patch.object(cache, 'lookup', lookup_and_evict):
+            response = make_request(url, config)
+        self.assertEqual([200, 304], self.server.statuses)
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(response.content, cache.lookup(url)['body'])
+
+    @pytest.mark.stage_2_9_response_cache_check
+    @pytest.mark.lab_5_scrapper
+    def test_incorrect_cache_settings(self):
+        """
+        Ensure cache parameters are validated
+        """
+        for incorrect_params in ({'use_cache': 'yes'}, {'cache_ttl': -1},
+                                 {'cache_ttl': '1h'}, {'cache_max_megabytes': 0}):
+            with self.assertRaises(IncorrectCacheSettingsError):
+                make_local_config(self.server, **incorrect_params)
+
+    def tearDown(self) -> None:
+        self.cache_path.stop()
+        self.server.stop()
+        if TEST_PATH.exists():
+            shutil.rmtree(TEST_PATH)
@@ -0,0 +1,87 @@
+"""
+Canonical forms of URLs and sorting of links into articles and other pages
+"""
+import re
+from typing import Iterable, Optional
+from urllib.parse import (parse_qsl, urldefrag, urlencode, urljoin, urlsplit,
+                          urlunsplit)
+
+
+def normalize_url(url: str, ignored_query_params: Iterable[str] = ()) -> str:
+    """
+    Brings URL to a canonical form: lowercase scheme and host,
+    no default port, no fragment, no trailing slash
+    and sorted query parameters without the ignored ones
+    """
+    parts = urlsplit(url)
+    scheme, netloc = parts.scheme.lower(), parts.netloc.lower()
+    if (scheme, parts.port) in (('http', 80), ('https', 443)):
+        netloc = netloc.rsplit(':', 1)[0]
+    path = parts.path.rstrip('/') or '/'
+    ignored = set(ignored_query_params)
+    query = urlencode(sorted((name, value)
+                             for name, value in parse_qsl(parts.query, keep_blank_values=True)
+                             if name not in ignored))
+    return urlunsplit((scheme, netloc, path, query, ''))
+
+
+def compile_patterns(patterns: list[str]) -> Optional[re.Pattern]:
+    """
+    Combines regular expressions into one, so that a link is checked by a single search
+    """
+    return re.compile('|'.join(f'(?:{pattern})' for pattern in patterns)) if patterns else None
+
+
+class UrlClassifier:
+    """
+    Makes links of a page absolute and canonical and tells articles from other pages
+    with regular expressions compiled once
+    """
+
+    def __init__(self, article_patterns: list[str], exclude_patterns: list[str],
+                 normalize: bool, ignored_query_params: list[str]) -> None:
+        """
+        Initializes an instance of the UrlClassifier class
+        """
+        self._article_regex = compile_patterns(article_patterns)
+        self._exclude_regex = compile_patterns(exclude_patterns)
+        self._normalize = normalize
+        self._ignored_query_params = frozenset(ignored_query_params)
+
+    def canonicalize(self, href: str, base_url: str = '') -> Optional[str]:
+        """
+        Resolves the link against the page it is found on and brings it to a canonical form,
+        links that do not lead to another web page give None
+        """
+        href = href.strip()
+        if not href or href.startswith('#'):
+            return None
+        url = urljoin(base_url, href)
+        if urlsplit(url).scheme.lower() not in ('http', 'https'):
+            return None
+        return normalize_url(url, self._ignored_query_params) if self._normalize \
+            else urldefrag(url).url
+
+    def is_excluded(self, url: str) -> bool:
+        """
+        Checks whether the URL matches one of the patterns of pages to leave out
+        """
+        return bool(self._exclude_regex and self._exclude_regex.search(url))
+
+    def is_article(self, url: str) -> bool:
+        """
+        Checks whether the URL matches one of the article patterns
+        """
+        return bool(self._article_regex and self._article_regex.search(url))
+
+    def classify(self, hrefs: Iterable[str], base_url: str) -> list[tuple[str, bool]]:
+        """
+        Retrieve canonical URLs of the links of a page that are not excluded,
+        each marked whether it leads to an article
+        """
+        links = []
+        for href in hrefs:
+            url = self.canonicalize(href, base_url)
+            if url and not self.is_excluded(url):
+                links.append((url, self.is_article(url)))
+        return links
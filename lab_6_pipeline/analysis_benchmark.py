@@ -0,0 +1,43 @@
+"""
+Compares per-article latency of Mystem analysis sentence by sentence and in a single batch
+"""
+import statistics
+import time
+from pathlib import Path
+
+from config.test_params import PIPE_TEST_FILES_FOLDER
+from lab_6_pipeline.pipeline import (CorpusManager,
+                                     MorphologicalAnalysisPipeline)
+
+
+def measure(corpus_manager: CorpusManager, batched: bool, repeats: int) -> dict[str, float]:
+    """
+    Returns median and worst processing time per article
+    """
+    pipeline = MorphologicalAnalysisPipeline(corpus_manager, batched=batched)
+    texts = [article.text for article in corpus_manager.get_articles().values()]
+    pipeline._process(texts[0])  # pylint: disable=protected-access
+    timings = []
+    for _ in range(repeats):
+        for text in texts:
+            start = time.perf_counter()
+            pipeline._process(text)  # pylint: disable=protected-access
+            timings.append(time.perf_counter() - start)
+    return {'median_ms': statistics.median(timings) * 1000,
+            'max_ms': max(timings) * 1000}
+
+
+def main(path_to_raw_txt_data: Path = PIPE_TEST_FILES_FOLDER) -> None:
+    """
+    Entrypoint for the benchmark
+    """
+    corpus_manager = CorpusManager(path_to_raw_txt_data)
+    for batched in (False, True):
+        result = measure(corpus_manager, batched, repeats=50)
+        mode = 'batched' if batched else 'per-sentence'
+        print(f'{mode:>12}: {result["median_ms"]:.2f} ms median, '
+              f'{result["max_ms"]:.2f} ms worst per article')
+
+
+if __name__ == "__main__":
+    main()
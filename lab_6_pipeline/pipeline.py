@@ -1,17 +1,38 @@
 """
 Pipeline for CONLL-U formatting
 """
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import accumulate
 from pathlib import Path
-from typing import List
+from typing import Iterator, List, Optional
 import pymystem3
 import pymorphy2
 import re
 
-from core_utils.article.article import SentenceProtocol, \
+from core_utils.article.article import Article, SentenceProtocol, \
     get_article_id_from_filepath, split_by_sentence
 from core_utils.article.ud import OpencorporaTagProtocol, TagConverter
 from core_utils.constants import ASSETS_PATH
 from core_utils.article.io import from_raw, to_cleaned, to_conllu
+from lab_6_pipeline.token_cache import TokenAnalysisCache, TokenFields
+
+SENTENCE_SEPARATOR = ' '
+LINE_BREAKS = re.compile(r'[\n\r\v\f\x1c-\x1e\x85\u2028\u2029]')
+NON_WORD_PATTERNS = ((re.compile(r'[A-Za-z]+'), 'X'), (re.compile(r'\d+'), 'NUM'),
+                     (re.compile(r'[.!?]'), 'PUNCT'))
+WORD = re.compile(r'\w+')
+MYSTEM_POS = re.compile(r'[A-Z]+')
+MYSTEM_GRAMMEMES = re.compile(r'[а-я]+')
+GRAMM_CATEGORIES = {
+    'NOUN': ('Gender', 'Animacy', 'Case', 'Number'),
+    'ADJ': ('Gender', 'Animacy', 'Case', 'Number'),
+    'VERB': ('Tense', 'Number', 'Gender'),
+    'PRON': ('Number', 'Case'),
+    'NUM': ('Gender', 'Case', 'Animacy')
+}
 
 class InconsistentDatasetError(Exception):
     """
@@ -203,37 +224,48 @@ class MystemTagConverter(TagConverter):
     Mystem Tag Converter
     """
 
+    def __init__(self, tag_mapping_path: Path):
+        """
+        Initializes MystemTagConverter, compiling the mapping into a lookup
+        of the UD category and value by a Mystem grammeme
+        """
+        super().__init__(tag_mapping_path)
+        self._features = {tag: (categ, f'{categ}={value}')
+                          for categ, values in self._tag_mapping.items() if categ != self.pos
+                          for tag, value in values.items()}
+        # conversions of grammemes seen so far, Mystem produces a limited set of them
+        self._converted_pos: dict[str, str] = {}
+        self._converted_tags: dict[str, str] = {}
+
     def convert_morphological_tags(self, tags: str) -> str:  # type: ignore
         """
         Converts the Mystem tags into the UD format
         """
-        part_of_speech = self.convert_pos(re.findall(r'[A-Z]+', tags)[0])
-        gramm_categories = {
-            'NOUN': [self.gender, self.animacy, self.case, self.number],
-            'ADJ': [self.gender, self.animacy, self.case, self.number],
-            'VERB': [self.tense, self.number, self.gender],
-            'PRON': [self.number, self.case],
-            'NUM': [self.gender, self.case, self.animacy]
-        }
-        necessary_tags = tags.split('|')[0]
-        tags_list = re.findall(r'[а-я]+', necessary_tags)
-        ud_tags_list = []
-        if part_of_speech not in gramm_categories:
-            return '_'
-        for categ in gramm_categories[part_of_speech]:
-            ud_tags = [f'{categ}={self._tag_mapping[categ][tag]}'
-                       for tag in tags_list
-                       if tag in self._tag_mapping[categ]]
-            ud_tags_list.extend(ud_tags)
-        return '|'.join(sorted(ud_tags_list)) if ud_tags_list else '_'
+        converted = self._converted_tags.get(tags)
+        if converted is None:
+            converted = self._converted_tags[tags] = self._compile_tags(tags)
+        return converted
 
+    def _compile_tags(self, tags: str) -> str:
+        """
+        Builds the UD features of the Mystem tags from the first of their alternatives
+        """
+        categories = GRAMM_CATEGORIES.get(self.convert_pos(MYSTEM_POS.findall(tags)[0]))
+        if categories is None:
+            return '_'
+        features = [self._features[tag] for tag in MYSTEM_GRAMMEMES.findall(tags.split('|')[0])
+                    if tag in self._features]
+        ud_tags_list = sorted(feature for categ, feature in features if categ in categories)
+        return '|'.join(ud_tags_list) if ud_tags_list else '_'
 
     def convert_pos(self, tags: str) -> str:  # type: ignore
         """
         Extracts and converts the POS from the Mystem tags into the UD format
         """
-        pos = re.findall(r'\w+', tags)[0]
-        return self._tag_mapping[self.pos][pos]
+        pos = self._converted_pos.get(tags)
+        if pos is None:
+            pos = self._converted_pos[tags] = self._tag_mapping[self.pos][WORD.findall(tags)[0]]
+        return pos
 
 
 class OpenCorporaTagConverter(TagConverter):
@@ -241,37 +273,76 @@ class OpenCorporaTagConverter(TagConverter):
     OpenCorpora Tag Converter
     """
 
+    def __init__(self, tag_mapping_path: Path):
+        """
+        Initializes OpenCorporaTagConverter
+        """
+        super().__init__(tag_mapping_path)
+        # pymorphy2 has a finite set of tags, so each of them is converted once
+        self._converted: dict[str, tuple[str, str]] = {}
+
+    def convert(self, tags: OpencorporaTagProtocol) -> tuple[str, str]:
+        """
+        Converts the OpenCorpora tags into the UD part of speech and features
+        """
+        key = str(tags)
+        converted = self._converted.get(key)
+        if converted is None:
+            pos = self._tag_mapping[self.pos][tags.POS] if tags.POS else 'X'
+            converted = self._converted[key] = (pos, self._compile_tags(tags, pos))
+        return converted
+
+    def _compile_tags(self, tags: OpencorporaTagProtocol, pos: str) -> str:
+        """
+        Builds the UD features of the OpenCorpora tags of a word of the given part of speech
+        """
+        if pos not in GRAMM_CATEGORIES:
+            return '_'
+        # attributes of pymorphy2 tags are named after the UD categories
+        oc_tags = {categ: getattr(tags, categ.lower()) for categ in GRAMM_CATEGORIES[pos]}
+        ud_tags_list = [f'{categ}={self._tag_mapping[categ][tag]}'
+                        for categ, tag in oc_tags.items() if tag]
+        return '|'.join(sorted(ud_tags_list)) if ud_tags_list else '_'
+
     def convert_pos(self, tags: OpencorporaTagProtocol) -> str:  # type: ignore
         """
         Extracts and converts POS from the OpenCorpora tags into the UD format
         """
-        return self._tag_mapping[self.pos][tags.POS] if tags.POS else 'X'
+        return self.convert(tags)[0]
 
     def convert_morphological_tags(self, tags: OpencorporaTagProtocol) -> str:  # type: ignore
         """
         Converts the OpenCorpora tags into the UD format
         """
-        gramm_categories = {
-            'NOUN': [self.gender, self.animacy, self.case, self.number],
-                            'ADJ': [self.gender, self.animacy, self.case, self.number],
-                            'VERB': [self.tense, self.number, self.gender],
-                            'PRON': [self.number, self.case],
-                            'NUM': [self.gender, self.case, self.animacy]
-        }
-        oc_to_ud = {
-            self.gender: tags.gender,
-            self.case: tags.case,
-            self.animacy: tags.animacy,
-            self.number: tags.number,
-            self.tense: tags.tense
-        }
-        pos = self.convert_pos(tags)
-        if pos not in gramm_categories:
-            return '_'
-        ud_tags_list = [f'{categ}={self._tag_mapping[categ][oc_to_ud[categ]]}'
-                        for categ in gramm_categories[pos]
-                        if oc_to_ud[categ]]
-        return '|'.join(sorted(ud_tags_list)) if ud_tags_list else '_'
+        return self.convert(tags)[1]
+
+
+def split_analysis(analysis: list[dict], sentences: list[str],
+                   separator: str = SENTENCE_SEPARATOR) -> list[list[dict]]:
+    """
+    Distributes the Mystem analysis of sentences joined with the separator
+    back between the sentences: tokens are matched by their offsets in the joined text,
+    non-word tokens spanning the boundary are cut and the separator is dropped
+    """
+    starts = accumulate((len(sent) + len(separator) for sent in sentences), initial=0)
+    bounds = [(start, start + len(sent)) for start, sent in zip(starts, sentences)]
+    analyzed: list[list[dict]] = [[] for _ in sentences]
+    first, token_end = 0, 0
+    for token in analysis:
+        text = token.get('text', '')
+        token_start, token_end = token_end, token_end + len(text)
+        while first < len(bounds) and bounds[first][1] <= token_start:
+            first += 1
+        for idx in range(first, len(bounds)):
+            sent_start, sent_end = bounds[idx]
+            if sent_start >= token_end:
+                break
+            if sent_start <= token_start and token_end <= sent_end:
+                analyzed[idx].append(token)
+            else:
+                analyzed[idx].append(
+                    {'text': text[max(sent_start - token_start, 0):sent_end - token_start]})
+    return analyzed
 
 
 class MorphologicalAnalysisPipeline:
@@ -279,56 +350,126 @@ class MorphologicalAnalysisPipeline:
     Preprocesses and morphologically annotates sentences into the CONLL-U format
     """
 
-    def __init__(self, corpus_manager: CorpusManager):
+    def __init__(self, corpus_manager: CorpusManager, batched: bool = True,
+                 processes: Optional[int] = 1, token_cache_path: Optional[Path] = None):
         """
-        Initializes MorphologicalAnalysisPipeline
+        Initializes MorphologicalAnalysisPipeline,
+        processes set to None use all available cores,
+        parameters of tokens are also kept in the token cache file if it is given
         """
+        if processes is not None and (not isinstance(processes, int)
+                                      or isinstance(processes, bool) or processes < 1):
+            raise ValueError('number of processes must be a positive integer')
         self._corpus = corpus_manager
         mapping_file = Path(__file__).parent / 'data' / 'mystem_tags_mapping.json'
         self._tag_converter = MystemTagConverter(mapping_file)
+        self._batched = batched
+        self._processes = processes or os.cpu_count() or 1
+        # the advanced pipeline analyzes nouns differently, so it keeps its own entries
+        self._token_cache = TokenAnalysisCache(path=token_cache_path,
+                                               namespace=type(self).__name__)
+        self._start_analyzers()
+
+    def __getstate__(self) -> dict:
+        """
+        Leaves out the corpus and the analyzers so that the pipeline can be passed to processes
+        """
+        return {name: value for name, value in self.__dict__.items()
+                if name not in ('_corpus', '_analyzer', '_backup_analyzer')}
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        Restores the pipeline passed to a process with its own analyzers
+        """
+        self.__dict__.update(state)
+        self._start_analyzers()
+
+    def _start_analyzers(self) -> None:
+        """
+        Creates the morphological analyzers
+        """
         self._analyzer = pymystem3.Mystem()
 
+    def _analyze(self, sentences: list[str]) -> list[list[dict]]:
+        """
+        Returns the Mystem analysis of each sentence: in the batched mode
+        the sentences of the text are analyzed together in a single call
+        """
+        if not self._batched:
+            return [self._analyzer.analyze(sent) for sent in sentences]
+        # Mystem is called once per line, so line breaks are replaced keeping offsets intact
+        block = LINE_BREAKS.sub(' ', SENTENCE_SEPARATOR.join(sentences))
+        return split_analysis(self._analyzer.analyze(block), sentences)
+
     def _process(self, text: str) -> List[ConlluSentence]:
         """
         Returns the text representation as the list of ConlluSentence
         """
         sentences = split_by_sentence(text)
         conllu_sentences = []
-        for idx, sent in enumerate(sentences):
-            sent_analyzed = self._analyzer.analyze(sent)
+        for idx, (sent, sent_analyzed) in enumerate(zip(sentences, self._analyze(sentences))):
             conllu_wordlist = []
-            index = 1
             for word in sent_analyzed:
-                if 'analysis' in word and word['analysis']:
-                    pos = self._tag_converter.convert_pos(word['analysis'][0]['gr'])
-                elif patterns := re.findall(r'[A-Za-z]+', word['text']):
-                    pos_tag = 'X'
-                elif patterns := re.findall(r'\d+', word['text']):
-                    pos_tag = 'NUM'
-                elif patterns := re.findall(r'[.!?]', word['text'].strip()):
-                    pos_tag = 'PUNCT'
-                else:
+                token = self._get_morphological_parameters(word)
+                if token is None:
                     continue
-                conllu_token = ConlluToken(word['text'].strip()) if word['text'] else ConlluToken(patterns[0].strip())
-                conllu_token.set_position(index)
-                index += 1
-                if 'analysis' in word and word['analysis']:
-                    morph_tags = self._tag_converter.convert_morphological_tags(word['analysis'][0]['gr'])
-                    token = MorphologicalTokenDTO(word['analysis'][0]['lex'], pos, morph_tags)
-                else:
-                    token = MorphologicalTokenDTO(patterns[0].strip(), pos_tag, '_')
+                conllu_token = ConlluToken(word['text'].strip())
+                conllu_token.set_position(len(conllu_wordlist) + 1)
                 conllu_token.set_morphological_parameters(token)
                 conllu_wordlist.append(conllu_token)
             conllu_sentences.append(ConlluSentence(idx, sent, conllu_wordlist))
+        self._token_cache.flush()
         return conllu_sentences
 
+    def _get_morphological_parameters(self, word: dict) -> Optional[MorphologicalTokenDTO]:
+        """
+        Returns morphological parameters of the Mystem token, remembering them for words,
+        tokens other than words, numbers and sentence punctuation give None
+        """
+        if word.get('analysis'):
+            analysis = word['analysis'][0]
+            fields = self._token_cache.get_or_compute(
+                word['text'], analysis['gr'], partial(self._convert, word['text'], analysis))
+            return MorphologicalTokenDTO(*fields)
+        for pattern, pos in NON_WORD_PATTERNS:
+            if match := pattern.search(word['text']):
+                return MorphologicalTokenDTO(match.group(), pos, '_')
+        return None
+
+    def _convert(self, wordform: str, analysis: dict) -> TokenFields:  # pylint: disable=unused-argument
+        """
+        Returns the lemma, part of speech and tags of the word in the UD format
+        """
+        return (analysis['lex'], self._tag_converter.convert_pos(analysis['gr']),
+                self._tag_converter.convert_morphological_tags(analysis['gr']))
+
+    def get_token_cache_stats(self) -> dict[str, float]:
+        """
+        Retrieve hits and misses of the cache of token parameters in this process
+        """
+        return self._token_cache.get_stats()
+
+    def _iter_processed(self) -> Iterator[tuple[Article, List[ConlluSentence]]]:
+        """
+        Yields articles of the corpus with their sentences in the order of the corpus,
+        with several processes the articles are shared between them
+        """
+        articles = list(self._corpus.get_articles().values())
+        if self._processes == 1 or len(articles) < 2:
+            for article in articles:
+                yield article, self._process(article.text)
+            return
+        with ProcessPoolExecutor(max_workers=min(self._processes, len(articles)),
+                                 initializer=init_analysis_worker,
+                                 initargs=(pickle.dumps(self),)) as pool:
+            yield from zip(articles, pool.map(analyze_in_worker,
+                                              [article.text for article in articles]))
+
     def run(self) -> None:
         """
         Performs basic preprocessing and writes processed text to files
         """
-        articles = self._corpus.get_articles()
-        for article in articles.values():
-            sentences = self._process(article.text)
+        for article, sentences in self._iter_processed():
             article.set_conllu_sentences(sentences)
             to_cleaned(article)
             to_conllu(article)
@@ -340,69 +481,61 @@ class AdvancedMorphologicalAnalysisPipeline(MorphologicalAnalysisPipeline):
     Preprocesses and morphologically annotates sentences into the CONLL-U format
     """
 
-    def __init__(self, corpus_manager: CorpusManager):
+    def __init__(self, corpus_manager: CorpusManager, batched: bool = True,
+                 processes: Optional[int] = 1, token_cache_path: Optional[Path] = None):
         """
         Initializes MorphologicalAnalysisPipeline
         """
-        super().__init__(corpus_manager)
+        super().__init__(corpus_manager, batched, processes, token_cache_path)
         mapping_file = Path(__file__).parent / 'data' / 'opencorpora_tags_mapping.json'
         self._backup_tag_converter = OpenCorporaTagConverter(mapping_file)
+
+    def _start_analyzers(self) -> None:
+        """
+        Creates the morphological analyzers
+        """
+        super()._start_analyzers()
         self._backup_analyzer = pymorphy2.MorphAnalyzer()
 
-    def _process(self, text: str) -> List[ConlluSentence]:
+    def _convert(self, wordform: str, analysis: dict) -> TokenFields:
         """
-        Returns the text representation as the list of ConlluSentence
+        Returns the lemma, part of speech and tags of the word in the UD format,
+        nouns are analyzed with pymorphy2
         """
-        sentences = split_by_sentence(text)
-        conllu_sentences = []
-        for idx, sent in enumerate(sentences):
-            sent_analyzed = self._analyzer.analyze(sent)
-            conllu_wordlist = []
-            index = 1
-            for word in sent_analyzed:
-                if 'analysis' in word and word['analysis']:
-                    pos = self._tag_converter.convert_pos(word['analysis'][0]['gr'])
-                elif patterns := re.findall(r'[A-Za-z]+', word['text']):
-                    pos_tag = 'X'
-                elif patterns := re.findall(r'\d+', word['text']):
-                    pos_tag = 'NUM'
-                elif patterns := re.findall(r'[.!?]', word['text'].strip()):
-                    pos_tag = 'PUNCT'
-                else:
-                    continue
-                if 'analysis' in word and word['analysis']:
-                    if pos == 'NOUN':
-                        oc_tag = self._backup_analyzer.tag(word['text'])[0]
-                        pos_tag = self._backup_tag_converter.convert_pos(oc_tag)
-                        morph_tag = self._backup_tag_converter.convert_morphological_tags(oc_tag)
-                        token = MorphologicalTokenDTO(
-                            self._backup_analyzer.normal_forms(word['text'])[0], pos_tag, morph_tag)
-                    else:
-                        morph_tag = self._tag_converter.convert_morphological_tags(word['analysis'][0]['gr'])
-                        token = MorphologicalTokenDTO(word['analysis'][0]['lex'], pos, morph_tag)
-                else:
-                    token = MorphologicalTokenDTO(patterns[0].replace(' ', ''), pos_tag, '_')
-                conllu_token = ConlluToken(word['text'].strip()) if word['text'] else ConlluToken(patterns[0].strip())
-                conllu_token.set_position(index)
-                index += 1
-                conllu_token.set_morphological_parameters(token)
-                conllu_wordlist.append(conllu_token)
-            conllu_sentences.append(ConlluSentence(idx, sent, conllu_wordlist))
-        return conllu_sentences
+        if self._tag_converter.convert_pos(analysis['gr']) != 'NOUN':
+            return super()._convert(wordform, analysis)
+        pos, tags = self._backup_tag_converter.convert(self._backup_analyzer.tag(wordform)[0])
+        return self._backup_analyzer.normal_forms(wordform)[0], pos, tags
 
     def run(self) -> None:
         """
         Performs basic preprocessing and writes processed text to files
         """
-        articles = self._corpus.get_articles()
-        for article in articles.values():
-            sentences = self._process(article.text)
+        for article, sentences in self._iter_processed():
             article.set_conllu_sentences(sentences)
             to_conllu(article,
                       include_morphological_tags=True,
                       include_pymorphy_tags=True)
 
 
+_ANALYSIS_WORKER_STATE: dict[str, MorphologicalAnalysisPipeline] = {}
+
+
+def init_analysis_worker(serialized_pipeline: bytes) -> None:
+    """
+    Restores the pipeline passed once to an analysis process,
+    a forked process this way does not share the analyzers of the parent
+    """
+    _ANALYSIS_WORKER_STATE['pipeline'] = pickle.loads(serialized_pipeline)
+
+
+def analyze_in_worker(text: str) -> List[ConlluSentence]:
+    """
+    Splits the text into morphologically annotated sentences in an analysis process
+    """
+    return _ANALYSIS_WORKER_STATE['pipeline']._process(text)  # pylint: disable=protected-access
+
+
 def main() -> None:
     """
     Entrypoint for pipeline module
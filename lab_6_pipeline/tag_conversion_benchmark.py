@@ -0,0 +1,93 @@
+"""
+Compares time of converting Mystem tags by regular expressions on every call
+with the precompiled converter, for tags seen for the first time and already seen ones
+"""
+import re
+import statistics
+import time
+from pathlib import Path
+
+from core_utils.article.ud import TagConverter
+from lab_6_pipeline.pipeline import MystemTagConverter
+
+MAPPING_PATH = Path(__file__).parent / 'data' / 'mystem_tags_mapping.json'
+
+# grammemes of frequent words of news texts
+MYSTEM_TAGS = (
+    'S,жен,од=им,ед', 'S,муж,неод=(вин,ед|им,ед)', 'S,сред,неод=(пр,ед|дат,ед)',
+    'S,гео,жен,неод=пр,ед', 'S,муж,од=мн,род,фам', 'S,сокр=(пр,мн|пр,ед|вин,мн)',
+    'V,несов,пе=прош,ед,изъяв,жен', 'V,сов,нп=непрош,ед,изъяв,3-л', 'V,несов,нп=инф',
+    'A=(вин,ед,полн,муж,неод|им,ед,полн,муж)', 'A=им,мн,полн', 'ANUM=им,ед,полн,жен',
+    'APRO=(дат,мн|твор,ед,муж)', 'SPRO,ед,3-л,муж=(вин|род)', 'NUM=(вин|им)',
+    'ADV=', 'ADVPRO=', 'PR=', 'CONJ=', 'PART=', 'INTJ=', 'COM='
+)
+
+
+class PerCallMystemTagConverter(TagConverter):
+    """
+    Mystem Tag Converter parsing the tags and scanning the mapping on every call,
+    as before precompilation
+    """
+
+    def convert_morphological_tags(self, tags: str) -> str:  # type: ignore
+        """
+        Converts the Mystem tags into the UD format
+        """
+        part_of_speech = self.convert_pos(re.findall(r'[A-Z]+', tags)[0])
+        gramm_categories = {
+            'NOUN': [self.gender, self.animacy, self.case, self.number],
+            'ADJ': [self.gender, self.animacy, self.case, self.number],
+            'VERB': [self.tense, self.number, self.gender],
+            'PRON': [self.number, self.case],
+            'NUM': [self.gender, self.case, self.animacy]
+        }
+        necessary_tags = tags.split('|')[0]
+        tags_list = re.findall(r'[а-я]+', necessary_tags)
+        ud_tags_list = []
+        if part_of_speech not in gramm_categories:
+            return '_'
+        for categ in gramm_categories[part_of_speech]:
+            ud_tags = [f'{categ}={self._tag_mapping[categ][tag]}'
+                       for tag in tags_list
+                       if tag in self._tag_mapping[categ]]
+            ud_tags_list.extend(ud_tags)
+        return '|'.join(sorted(ud_tags_list)) if ud_tags_list else '_'
+
+    def convert_pos(self, tags: str) -> str:  # type: ignore
+        """
+        Extracts and converts the POS from the Mystem tags into the UD format
+        """
+        pos = re.findall(r'\w+', tags)[0]
+        return self._tag_mapping[self.pos][pos]
+
+
+def measure(converter_class: type[TagConverter], warm: bool, repeats: int) -> float:
+    """
+    Returns median time in microseconds of converting part of speech and tags of a word
+    """
+    converter = converter_class(MAPPING_PATH)
+    timings = []
+    for _ in range(repeats):
+        if not warm:
+            converter = converter_class(MAPPING_PATH)
+        for tags in MYSTEM_TAGS:
+            start = time.perf_counter()
+            converter.convert_pos(tags)
+            converter.convert_morphological_tags(tags)
+            timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1_000_000
+
+
+def main() -> None:
+    """
+    Entrypoint for the benchmark
+    """
+    print(f'   per call: {measure(PerCallMystemTagConverter, True, repeats=2000):.2f} '
+          'µs per word')
+    for warm in (False, True):
+        mode = 'seen before' if warm else 'first seen'
+        print(f'{mode:>11}: {measure(MystemTagConverter, warm, repeats=2000):.2f} µs per word')
+
+
+if __name__ == "__main__":
+    main()
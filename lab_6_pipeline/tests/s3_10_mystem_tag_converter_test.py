@@ -0,0 +1,52 @@
+"""
+Tests for conversion of Mystem tags into the UD format
+"""
+import unittest
+from pathlib import Path
+
+import pytest
+
+from lab_6_pipeline.pipeline import MystemTagConverter
+
+
+class MystemTagConverterTest(unittest.TestCase):
+    """
+    Class for checking Mystem tag converter
+    """
+
+    def setUp(self) -> None:
+        mapping_path = Path(__file__).parent.parent / 'data' / 'mystem_tags_mapping.json'
+        self.converter = MystemTagConverter(mapping_path)
+        self.expected = {
+            'S,жен,од=им,ед': ('NOUN', 'Animacy=Anim|Case=Nom|Gender=Fem|Number=Sing'),
+            'S,муж,неод=(вин,ед|им,ед)': ('NOUN', 'Animacy=Inan|Case=Acc|Gender=Masc|Number=Sing'),
+            'V,несов,пе=прош,ед,изъяв,жен': ('VERB', 'Gender=Fem|Number=Sing|Tense=Past'),
+            'SPRO,ед,3-л,муж=(вин|род)': ('PRON', 'Case=Acc|Number=Sing'),
+            'NUM=(вин|им)': ('NUM', 'Case=Acc'),
+            'APRO=(дат,мн|твор,ед,муж)': ('ADJ', 'Case=Dat|Number=Plur'),
+            'PR=': ('ADP', '_')
+        }
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_10_mystem_tag_converter_checks
+    @pytest.mark.lab_6_pipeline
+    def test_tags_are_converted(self):
+        """
+        Ensure part of speech and features are converted from the first alternative
+        both for tags seen for the first time and already seen ones
+        """
+        for _ in range(2):
+            converted = {tags: (self.converter.convert_pos(tags),
+                                self.converter.convert_morphological_tags(tags))
+                         for tags in self.expected}
+            self.assertEqual(self.expected, converted)
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_10_mystem_tag_converter_checks
+    @pytest.mark.lab_6_pipeline
+    def test_unknown_part_of_speech(self):
+        """
+        Ensure an unknown part of speech is not converted
+        """
+        with self.assertRaises(KeyError):
+            self.converter.convert_pos('PARENTH=')
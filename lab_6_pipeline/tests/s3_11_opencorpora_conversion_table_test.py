@@ -0,0 +1,67 @@
+"""
+Tests for conversion of OpenCorpora tags memoised by tag
+"""
+import unittest
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+from lab_6_pipeline.pipeline import OpenCorporaTagConverter
+
+
+# pylint: disable=invalid-name,too-few-public-methods,too-many-arguments
+class ParsedTag:
+    """
+    Tag with the attributes of pymorphy2.tagset.OpencorporaTag used by the converter
+    """
+
+    def __init__(self, POS: Optional[str], gender: Optional[str] = None,
+                 number: Optional[str] = None, case: Optional[str] = None,
+                 animacy: Optional[str] = None) -> None:
+        self.POS = POS
+        self.gender = gender
+        self.number = number
+        self.case = case
+        self.animacy = animacy
+        self.tense = None
+
+    def __str__(self) -> str:
+        values = (self.POS, self.animacy, self.gender, self.number, self.case)
+        return ','.join(value for value in values if value)
+
+
+class OpenCorporaConversionTableTest(unittest.TestCase):
+    """
+    Class for checking conversion of OpenCorpora tags keyed by tag
+    """
+
+    def setUp(self) -> None:
+        mapping_path = Path(__file__).parent.parent / 'data' / 'opencorpora_tags_mapping.json'
+        self.converter = OpenCorporaTagConverter(mapping_path)
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_11_opencorpora_conversion_table_checks
+    @pytest.mark.lab_6_pipeline
+    def test_tags_are_converted(self):
+        """
+        Ensure part of speech and features are converted
+        """
+        self.assertEqual(('NOUN', 'Animacy=Inan|Case=Acc|Gender=Masc|Number=Sing'),
+                         self.converter.convert(ParsedTag('NOUN', 'masc', 'sing', 'accs', 'inan')))
+        self.assertEqual(('PRON', 'Case=Loc|Number=Plur'),
+                         self.converter.convert(ParsedTag('NPRO', number='plur', case='loc1')))
+        self.assertEqual(('ADP', '_'), self.converter.convert(ParsedTag('PREP')))
+        self.assertEqual(('X', '_'), self.converter.convert(ParsedTag(None)))
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_11_opencorpora_conversion_table_checks
+    @pytest.mark.lab_6_pipeline
+    def test_equal_tags_are_converted_once(self):
+        """
+        Ensure conversion of a tag equal to a converted one is taken from the table
+        """
+        converted = self.converter.convert(ParsedTag('NOUN', 'femn', 'plur', 'gent', 'anim'))
+        self.assertEqual(('NOUN', 'Animacy=Anim|Case=Gen|Gender=Fem|Number=Plur'), converted)
+        self.assertIs(converted,
+                      self.converter.convert(ParsedTag('NOUN', 'femn', 'plur', 'gent', 'anim')))
@@ -0,0 +1,59 @@
+# pylint: disable=protected-access
+"""
+Tests for analysis of whole articles in a single Mystem call
+"""
+import shutil
+import unittest
+
+import pytest
+
+from config.test_params import TEST_PATH
+from core_utils.article import article
+from lab_6_pipeline.pipeline import (CorpusManager,
+                                     MorphologicalAnalysisPipeline,
+                                     split_analysis)
+from lab_6_pipeline.tests.utils import pipeline_test_files_setup
+
+
+class BatchedAnalysisTest(unittest.TestCase):
+    """
+    Class for checking batched analysis of sentences
+    """
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_7_batched_analysis_checks
+    @pytest.mark.lab_6_pipeline
+    def test_analysis_is_split_by_sentences(self):
+        """
+        Ensure tokens are returned to their sentences
+        and punctuation spanning the boundary is cut
+        """
+        word = {'text': 'Мама', 'analysis': [{'lex': 'мама', 'gr': 'S,жен,од=им,ед'}]}
+        analysis = [word, {'text': ' '}, {'text': 'спит'}, {'text': '. '},
+                    {'text': 'Папа'}, {'text': '!?'}, {'text': '\n'}]
+        expected = [[word, {'text': ' '}, {'text': 'спит'}, {'text': '.'}],
+                    [{'text': 'Папа'}, {'text': '!?'}]]
+        self.assertEqual(expected, split_analysis(analysis, ['Мама спит.', 'Папа!?']))
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_7_batched_analysis_checks
+    @pytest.mark.lab_6_pipeline
+    def test_batched_and_sentence_analysis_are_equal(self):
+        """
+        Ensure analysis of a whole article gives the same sentences
+        as analysis sentence by sentence
+        """
+        pipeline_test_files_setup()
+        article.ASSETS_PATH = TEST_PATH
+        corpus_manager = CorpusManager(path_to_raw_txt_data=TEST_PATH)
+        text = corpus_manager.get_articles()[1].text
+        sentences = {}
+        for batched in (False, True):
+            pipeline = MorphologicalAnalysisPipeline(corpus_manager, batched=batched)
+            sentences[batched] = [sentence.get_conllu_text(include_morphological_tags=True)
+                                  for sentence in pipeline._process(text)]
+        self.assertEqual(sentences[False], sentences[True])
+
+    def tearDown(self) -> None:
+        if TEST_PATH.exists():
+            shutil.rmtree(TEST_PATH)
@@ -0,0 +1,65 @@
+"""
+Tests for analysis of articles in several processes
+"""
+import shutil
+import unittest
+
+import pytest
+
+from config.test_params import PIPE_TEST_FILES_FOLDER, TEST_PATH
+from core_utils.article import article
+from lab_6_pipeline.pipeline import (AdvancedMorphologicalAnalysisPipeline,
+                                     CorpusManager,
+                                     MorphologicalAnalysisPipeline)
+from lab_6_pipeline.tests.utils import pipeline_test_files_setup
+
+
+class ParallelPipelineTest(unittest.TestCase):
+    """
+    Class for checking parallel runs of pipelines
+    """
+
+    def setUp(self) -> None:
+        pipeline_test_files_setup()
+        for article_id in (2, 3):
+            shutil.copyfile(PIPE_TEST_FILES_FOLDER / '1_raw.txt',
+                            TEST_PATH / f'{article_id}_raw.txt')
+            shutil.copyfile(PIPE_TEST_FILES_FOLDER / '1_meta.json',
+                            TEST_PATH / f'{article_id}_meta.json')
+        article.ASSETS_PATH = TEST_PATH
+
+    def _run(self, pipeline_class: type, processes: int) -> dict[str, str]:
+        for path in TEST_PATH.glob('*.conllu'):
+            path.unlink()
+        for path in TEST_PATH.glob('*_cleaned.txt'):
+            path.unlink()
+        pipeline_class(CorpusManager(path_to_raw_txt_data=TEST_PATH), processes=processes).run()
+        return {path.name: path.read_text(encoding='utf-8') for path in TEST_PATH.iterdir()}
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_8_parallel_pipeline_checks
+    @pytest.mark.lab_6_pipeline
+    def test_parallel_run_writes_same_files(self):
+        """
+        Ensure articles analyzed in several processes are written as in a serial run
+        """
+        for pipeline_class in (MorphologicalAnalysisPipeline,
+                               AdvancedMorphologicalAnalysisPipeline):
+            serial = self._run(pipeline_class, processes=1)
+            self.assertEqual(serial, self._run(pipeline_class, processes=2))
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_8_parallel_pipeline_checks
+    @pytest.mark.lab_6_pipeline
+    def test_incorrect_number_of_processes(self):
+        """
+        Ensure the number of processes is validated
+        """
+        corpus_manager = CorpusManager(path_to_raw_txt_data=TEST_PATH)
+        for processes in (0, -1, 1.5, True, '2'):
+            with self.assertRaises(ValueError):
+                MorphologicalAnalysisPipeline(corpus_manager, processes=processes)
+
+    def tearDown(self) -> None:
+        if TEST_PATH.exists():
+            shutil.rmtree(TEST_PATH)
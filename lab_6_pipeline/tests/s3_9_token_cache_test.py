@@ -0,0 +1,73 @@
+"""
+Tests for the cache of morphological parameters of tokens
+"""
+import tempfile
+import unittest
+from pathlib import Path
+
+import pytest
+
+from lab_6_pipeline.token_cache import TokenAnalysisCache
+
+NOUN = ('мама', 'NOUN', 'Animacy=Anim|Case=Nom|Gender=Fem|Number=Sing')
+VERB = ('мыть', 'VERB', 'Gender=Fem|Number=Sing|Tense=Past')
+
+
+class TokenAnalysisCacheTest(unittest.TestCase):
+    """
+    Class for checking the cache of token parameters
+    """
+
+    def setUp(self) -> None:
+        self._directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.path = Path(self._directory.name) / 'tokens.sqlite3'
+        self.computed: list[str] = []
+
+    def _compute(self, fields: tuple[str, str, str]) -> tuple[str, str, str]:
+        self.computed.append(fields[0])
+        return fields
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_9_token_cache_checks
+    @pytest.mark.lab_6_pipeline
+    def test_least_recently_used_are_evicted(self):
+        """
+        Ensure parameters are computed once while cached
+        and the least recently used wordform is evicted
+        """
+        cache = TokenAnalysisCache(capacity=2)
+        cache.get_or_compute('мама', 'S,жен,од=им,ед', lambda: self._compute(NOUN))
+        cache.get_or_compute('мыла', 'V,несов=прош,ед,изъяв,жен', lambda: self._compute(VERB))
+        self.assertEqual(NOUN, cache.get_or_compute('мама', 'S,жен,од=им,ед',
+                                                    lambda: self._compute(NOUN)))
+        cache.get_or_compute('рама', 'S,жен,неод=им,ед', lambda: self._compute(NOUN))
+        cache.get_or_compute('мыла', 'V,несов=прош,ед,изъяв,жен', lambda: self._compute(VERB))
+        self.assertEqual(['мама', 'мыть', 'мама', 'мыть'], self.computed)
+        self.assertEqual({'hits': 1, 'disk_hits': 0, 'misses': 4, 'hit_rate': 0.2},
+                         cache.get_stats())
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_9_token_cache_checks
+    @pytest.mark.lab_6_pipeline
+    def test_persistent_tier_warm_starts(self):
+        """
+        Ensure parameters flushed to the file are reused by another cache
+        of the same namespace only
+        """
+        cache = TokenAnalysisCache(path=self.path, namespace='basic')
+        cache.get_or_compute('мама', 'S,жен,од=им,ед', lambda: self._compute(NOUN))
+        cache.close()
+
+        warm_cache = TokenAnalysisCache(path=self.path, namespace='basic')
+        self.assertEqual(NOUN, warm_cache.get_or_compute('мама', 'S,жен,од=им,ед',
+                                                         lambda: self._compute(VERB)))
+        self.assertEqual(1, warm_cache.get_stats()['disk_hits'])
+        other_cache = TokenAnalysisCache(path=self.path, namespace='advanced')
+        self.assertEqual(VERB, other_cache.get_or_compute('мама', 'S,жен,од=им,ед',
+                                                          lambda: self._compute(VERB)))
+        self.assertEqual(['мама', 'мыть'], self.computed)
+        warm_cache.close()
+        other_cache.close()
+
+    def tearDown(self) -> None:
+        self._directory.cleanup()
@@ -0,0 +1,128 @@
+"""
+Cache of morphological parameters of tokens shared by the articles of a corpus
+"""
+import sqlite3
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Optional
+
+TOKEN_CACHE_CAPACITY = 100_000
+
+TokenFields = tuple[str, str, str]
+
+
+class TokenAnalysisCache:
+    """
+    Bounded least recently used cache of lemma, part of speech and tags of a wordform
+    with the given Mystem grammemes, optionally backed by an SQLite file
+    so that repeated runs start warm
+    """
+
+    def __init__(self, capacity: int = TOKEN_CACHE_CAPACITY, path: Optional[Path] = None,
+                 namespace: str = '') -> None:
+        """
+        Initializes an instance of the TokenAnalysisCache class
+        """
+        self._capacity = capacity
+        self._path = path
+        self._namespace = namespace
+        self._entries: OrderedDict[tuple[str, str], TokenFields] = OrderedDict()
+        self._pending: list[tuple[str, ...]] = []
+        self._stats = {'hits': 0, 'disk_hits': 0, 'misses': 0}
+        self._connection = self._connect() if path else None
+
+    def __getstate__(self) -> dict:
+        """
+        Leaves out the entries and the connection so that the cache can be passed to processes
+        """
+        return {name: value for name, value in self.__dict__.items()
+                if name not in ('_entries', '_pending', '_stats', '_connection')}
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        Restores the cache passed to a process empty and with its own connection
+        """
+        self.__dict__.update(state)
+        self._entries = OrderedDict()
+        self._pending = []
+        self._stats = {'hits': 0, 'disk_hits': 0, 'misses': 0}
+        self._connection = self._connect() if self._path else None
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Opens the file of the persistent tier
+        """
+        assert self._path is not None
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        # processes of a parallel run write to the same file
+        connection = sqlite3.connect(self._path, timeout=30)
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute('CREATE TABLE IF NOT EXISTS tokens ('
+                           'namespace TEXT, wordform TEXT, gr TEXT, '
+                           'lemma TEXT, pos TEXT, tags TEXT, '
+                           'PRIMARY KEY (namespace, wordform, gr))')
+        connection.commit()
+        return connection
+
+    def get_or_compute(self, wordform: str, grammemes: str,
+                       compute: Callable[[], TokenFields]) -> TokenFields:
+        """
+        Returns cached parameters of the wordform or computes and remembers them
+        """
+        key = (wordform, grammemes)
+        fields = self._entries.get(key)
+        if fields is not None:
+            self._entries.move_to_end(key)
+            self._stats['hits'] += 1
+            return fields
+        fields = self._load(key)
+        if fields is not None:
+            self._stats['disk_hits'] += 1
+        else:
+            self._stats['misses'] += 1
+            fields = compute()
+            if self._connection is not None:
+                self._pending.append((self._namespace, *key, *fields))
+        self._entries[key] = fields
+        if len(self._entries) > self._capacity:
+            self._entries.popitem(last=False)
+        return fields
+
+    def _load(self, key: tuple[str, str]) -> Optional[TokenFields]:
+        """
+        Looks the wordform up in the persistent tier
+        """
+        if self._connection is None:
+            return None
+        row = self._connection.execute('SELECT lemma, pos, tags FROM tokens '
+                                       'WHERE namespace = ? AND wordform = ? AND gr = ?',
+                                       (self._namespace, *key)).fetchone()
+        return (row[0], row[1], row[2]) if row else None
+
+    def flush(self) -> None:
+        """
+        Writes parameters computed since the last flush to the persistent tier
+        """
+        if self._connection is None or not self._pending:
+            return
+        self._connection.executemany('INSERT OR REPLACE INTO tokens '
+                                     'VALUES (?, ?, ?, ?, ?, ?)', self._pending)
+        self._connection.commit()
+        self._pending.clear()
+
+    def get_stats(self) -> dict[str, float]:
+        """
+        Retrieve numbers of hits in memory and on disk, misses and the share of hits
+        """
+        lookups = sum(self._stats.values())
+        hits = self._stats['hits'] + self._stats['disk_hits']
+        return {**self._stats, 'hit_rate': hits / lookups if lookups else 0.0}
+
+    def close(self) -> None:
+        """
+        Flushes pending parameters and closes the file of the persistent tier
+        """
+        self.flush()
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None